@@ -16,6 +16,7 @@ from rich.progress import (
 from yt2audi.core import Converter, Downloader, ProcessingPipeline, Splitter, HistoryManager
 from yt2audi.models.profile import Profile
 from yt2audi.transfer import USBManager
+from yt2audi.utils import find_thumbnail
 
 console = Console()
 
@@ -189,11 +190,7 @@ def process_single_video(
     
     # Convert
     # Find thumbnail if downloaded
-    thumbnail_path = None
-    if downloaded_path:
-        potential_thumbnail = downloaded_path.with_suffix(".jpg")
-        if potential_thumbnail.exists():
-            thumbnail_path = potential_thumbnail
+    thumbnail_path = find_thumbnail(downloaded_path) if downloaded_path else None
 
     if show_progress:
         console.print("[bold green]Converting...[/bold green]")
@@ -237,6 +234,7 @@ def process_single_video(
         prof.output.max_file_size_gb,
         prof.output.on_size_exceed,
         output_dir,
+        converter.encoder,
     )
     
     # Report results
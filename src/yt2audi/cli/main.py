@@ -18,7 +18,7 @@ import yt2audi
 from yt2audi.config import list_available_profiles, load_profile
 from yt2audi.core import Converter, Downloader, Splitter
 from yt2audi.exceptions import ConversionError, DownloadError, YT2AudiError
-from yt2audi.utils import configure_logging
+from yt2audi.utils import configure_logging, install_uvloop
 
 import click
 # Monkeypatch to fix Typer/Click incompatibility
@@ -150,10 +150,13 @@ def download(ctx: typer.Context) -> None:
         output_dir = output or Path(prof.output.output_dir)
 
         # Process video
-        final_paths = process_single_video(
-            url, prof, output_dir, downloader, converter,
-            show_progress=True, skip_conversion=skip_conversion
-        )
+        try:
+            final_paths = process_single_video(
+                url, prof, output_dir, downloader, converter,
+                show_progress=True, skip_conversion=skip_conversion
+            )
+        finally:
+            downloader.close()
 
         console.print("\n[bold green]Complete![/bold green]")
 
@@ -250,16 +253,20 @@ def batch(ctx: typer.Context):
 
         progress_manager = BatchProgressManager(console)
         
+        install_uvloop()
         with progress_manager:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
-            results = loop.run_until_complete(
-                pipeline.run_batch(
-                    urls, 
-                    output_dir, 
-                    progress_callback=progress_manager.get_callback()
+            try:
+                results = loop.run_until_complete(
+                    pipeline.run_batch(
+                        urls, 
+                        output_dir, 
+                        progress_callback=progress_manager.get_callback()
+                    )
                 )
-            )
+            finally:
+                pipeline.close()
 
         succeeded = len(results)
         failed = len(urls) - succeeded
@@ -330,7 +337,10 @@ def playlist(ctx: typer.Context) -> None:
 
         # 1. Extract URLs from playlist
         console.print("[bold green]Extracting playlist information...[/bold green]")
-        urls = downloader.get_playlist_urls(url)
+        try:
+            urls = downloader.get_playlist_urls(url)
+        finally:
+            downloader.close()
         
         if not urls:
             console.print("[yellow]No videos found in playlist or failed to extract info.[/yellow]")
@@ -352,16 +362,20 @@ def playlist(ctx: typer.Context) -> None:
         progress_manager = BatchProgressManager(console)
         
         # 3. Process concurrently
+        install_uvloop()
         with progress_manager:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
-            results = loop.run_until_complete(
-                pipeline.run_batch(
-                    urls, 
-                    output_dir, 
-                    progress_callback=progress_manager.get_callback()
+            try:
+                results = loop.run_until_complete(
+                    pipeline.run_batch(
+                        urls, 
+                        output_dir, 
+                        progress_callback=progress_manager.get_callback()
+                    )
                 )
-            )
+            finally:
+                pipeline.close()
 
         succeeded = len(results)
         failed = len(urls) - succeeded
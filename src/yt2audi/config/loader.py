@@ -1,8 +1,11 @@
 """Configuration loading and management."""
 
 import os
+import tomllib
 from pathlib import Path
 
+import tomli_w
+
 from yt2audi.exceptions import ConfigError
 from yt2audi.models.profile import AppConfig, Profile
 
@@ -141,11 +144,7 @@ def load_app_config() -> AppConfig:
         return AppConfig()
 
     try:
-        import tomli
-
-        with open(config_path, "rb") as f:
-            data = tomli.load(f)
-        return AppConfig(**data)
+        return AppConfig.model_validate(tomllib.loads(config_path.read_text(encoding="utf-8")))
     except Exception as e:
         raise ConfigError(f"Failed to load app config from {config_path}: {e}") from e
 
@@ -163,8 +162,6 @@ def save_app_config(config: AppConfig) -> None:
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        import tomli_w
-
         with open(config_path, "wb") as f:
             tomli_w.dump(config.model_dump(), f)
     except Exception as e:
@@ -1,6 +1,7 @@
 """Metadata caching for YouTube video information."""
 
 import json
+import os
 import time
 from pathlib import Path
 from typing import Any, Optional
@@ -41,8 +42,15 @@ class MetadataCache:
 
         try:
             with open(self.cache_file, "r", encoding="utf-8") as f:
-                self._cache = json.load(f)
-            logger.debug("cache_loaded", entries=len(self._cache))
+                data = json.load(f)
+            # Drop stale entries up front so they are not carried into the next save
+            cutoff = time.time() - self.expiration_seconds
+            self._cache = {
+                url: entry
+                for url, entry in data.items()
+                if entry.get("_cached_at", 0) >= cutoff
+            }
+            logger.debug("cache_loaded", entries=len(self._cache), expired=len(data) - len(self._cache))
         except Exception as e:
             logger.warning("cache_load_failed", error=str(e))
             self._cache = {}
@@ -51,8 +59,12 @@ class MetadataCache:
         """Save cache to disk."""
         try:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(self._cache, f, indent=2)
+            # Write compact JSON to a temp file and swap it in atomically, so a crash
+            # or a concurrent run never leaves a truncated cache behind
+            tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self._cache, f, separators=(",", ":"))
+            os.replace(tmp_file, self.cache_file)
             logger.debug("cache_saved", entries=len(self._cache))
         except Exception as e:
             logger.error("cache_save_failed", error=str(e))
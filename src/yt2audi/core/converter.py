@@ -4,22 +4,29 @@ import asyncio
 import json
 import re
 import subprocess
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Callable
 
 import structlog
 
+from yt2audi.config import expand_path
 from yt2audi.core.gpu_detector import (
+    get_encoder_codec,
     get_encoder_extra_args,
     get_encoder_preset,
+    get_hwaccel_args,
     select_best_encoder,
 )
 from yt2audi.exceptions import ConversionError
 from yt2audi.models.profile import EncoderType, Profile
-from yt2audi.utils import ensure_extension, get_unique_path
+from yt2audi.utils import Lazy, ensure_extension, get_unique_path, sanitize_filename
 
 logger = structlog.get_logger(__name__)
 
+# Predicted output paths kept per converter; far more than one batch needs
+_OUTPUT_PATH_CACHE_SIZE = 1024
+
 
 class VideoMetadata:
     """Video metadata extracted from FFprobe."""
@@ -113,6 +120,12 @@ class Converter:
         # Select best encoder
         self.encoder = select_best_encoder(self.video_config.encoder_priority)
 
+        # Predicted output paths, keyed by every input that shapes the filename
+        # (least recently used first, capped at _OUTPUT_PATH_CACHE_SIZE)
+        self._output_path_cache: OrderedDict[tuple[str, str, str, Path, str, str], Path] = (
+            OrderedDict()
+        )
+
         logger.info(
             "converter_initialized", profile=profile.profile.name, encoder=self.encoder.value
         )
@@ -120,6 +133,9 @@ class Converter:
     def get_output_path(self, info_dict: dict[str, Any], output_dir: Path | None = None) -> Path:
         """Predict the output path for a video based on its info dictionary.
 
+        Results are memoized, so the pipeline's pre-check and conversion
+        stages share one filename sanitization per video.
+
         Args:
             info_dict: Video info from yt-dlp
             output_dir: Target output directory
@@ -127,9 +143,6 @@ class Converter:
         Returns:
             Predicted output Path
         """
-        from yt2audi.utils import sanitize_filename
-        from yt2audi.config import expand_path
-
         if output_dir is None:
             output_dir = expand_path(self.output_config.output_dir)
 
@@ -140,6 +153,15 @@ class Converter:
         video_id = info_dict.get("id", "none")
         uploader = info_dict.get("uploader", "unknown")
 
+        cache_key = (
+            str(video_id), str(title), str(uploader), output_dir, template,
+            self.output_config.container,
+        )
+        cached = self._output_path_cache.get(cache_key)
+        if cached is not None:
+            self._output_path_cache.move_to_end(cache_key)
+            return cached
+
         ctx = {
             "title": sanitize_filename(title),
             "id": video_id,
@@ -153,7 +175,11 @@ class Converter:
             # Fallback to standard
             filename = f"{ctx['title']}_{ctx['id']}.{ctx['ext']}"
 
-        return output_dir / filename
+        output_path = output_dir / filename
+        self._output_path_cache[cache_key] = output_path
+        if len(self._output_path_cache) > _OUTPUT_PATH_CACHE_SIZE:
+            self._output_path_cache.popitem(last=False)
+        return output_path
 
     def probe_video(self, input_path: Path) -> VideoMetadata:
         """Extract video metadata using FFprobe.
@@ -234,7 +260,7 @@ class Converter:
         Returns:
             FFmpeg command as list of arguments
         """
-        cmd = ["ffmpeg", "-i", str(input_path)]
+        cmd = ["ffmpeg", *get_hwaccel_args(self.encoder), "-i", str(input_path)]
 
         if thumbnail_path and thumbnail_path.exists():
             cmd.extend(["-i", str(thumbnail_path)])
@@ -248,7 +274,7 @@ class Converter:
             cmd.extend(["-c:v:1", "mjpeg", "-disposition:v:1", "attached_pic"])
 
         # Video encoding (stream 0)
-        cmd.extend(["-c:v:0", self.encoder.value])
+        cmd.extend(["-c:v:0", get_encoder_codec(self.encoder)])
 
         # Encoder preset
         preset = get_encoder_preset(self.encoder)
@@ -421,7 +447,7 @@ class Converter:
             thumbnail_path=thumbnail_path
         )
 
-        logger.debug("ffmpeg_command", cmd=" ".join(cmd))
+        logger.debug("ffmpeg_command", cmd=Lazy(lambda: " ".join(cmd)))
 
         # Execute conversion
         if progress_callback:
@@ -1,12 +1,22 @@
 """Video downloader using yt-dlp."""
 
 import asyncio
+import bisect
+import functools
+import os
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, TypeVar
 
 import structlog
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+import yt_dlp
+from yt_dlp.utils import DownloadError as YTDLPDownloadError
 
+from yt2audi.config import expand_path, get_config_dir
 from yt2audi.core.cache import MetadataCache
 from yt2audi.exceptions import DownloadError
 from yt2audi.models.profile import DownloadConfig, Profile
@@ -14,25 +24,226 @@ from yt2audi.utils import get_temp_dir, is_valid_url, is_youtube_url, sanitize_f
 
 logger = structlog.get_logger(__name__)
 
+T = TypeVar("T")
+
+# (target max_height upper bound, standard download height) pairs, sorted by bound.
+# 540p targets download 720p, which is the closest standard resolution with good quality.
+_HEIGHT_LADDER = ((480, 480), (540, 720), (720, 720), (1080, 1080))
+_HEIGHT_THRESHOLDS = tuple(bound for bound, _ in _HEIGHT_LADDER)
+_HEIGHT_DOWNLOADS = tuple(height for _, height in _HEIGHT_LADDER)
+
+# yt-dlp format selector with fallbacks, most to least specific
+_FORMAT_TEMPLATE = "/".join(
+    (
+        # 1. Best match: height + fps + codec + container constraints
+        "bestvideo[height<={height}][fps<={fps}][vcodec^={vcodec}][ext={container}]+"
+        "bestaudio[abr<={abr}][acodec^={acodec}][ext=m4a]",
+        # 2. Relaxed codec constraint (just height + fps + container)
+        "bestvideo[height<={height}][fps<={fps}][ext={container}]+"
+        "bestaudio[abr<={abr}][ext=m4a]",
+        # 3. Relaxed container (just height + fps)
+        "bestvideo[height<={height}][fps<={fps}]+bestaudio[abr<={abr}]",
+        # 4. Just height constraint
+        "bestvideo[height<={height}]+bestaudio",
+        # 5. Best combined format with height constraint
+        "best[height<={height}][ext={container}]",
+        # 6. Best combined format with container preference
+        "best[ext={container}]",
+        # 7. Last resort: any best format
+        "best",
+    )
+)
+
+# Container extensions that count as downloaded videos (tuple for str.endswith)
+_VIDEO_EXTENSIONS = (".mp4", ".mkv", ".webm")
+
+# Retry policy for single video downloads (exponential backoff, in seconds)
+_DOWNLOAD_ATTEMPTS = 3
+_RETRY_MIN_DELAY = 4
+_RETRY_MAX_DELAY = 10
+
+# Worker threads for blocking yt-dlp calls when no batch size is given
+_DEFAULT_POOL_WORKERS = 3
+
+# Minimum interval between "downloading" progress callbacks per URL in batches
+_PROGRESS_INTERVAL = 0.1
+
+# Oldest live extraction whose signed stream URLs are still trusted for download
+_LIVE_INFO_MAX_AGE = 3600.0
+
+# Header yt-dlp expects at the top of a Netscape cookie file
+_COOKIE_JAR_HEADER = "# Netscape HTTP Cookie File\n"
+
+
+def _prepare_cookie_jar(path: Path) -> bool:
+    """Make sure a cookie jar exists and only the current user can read it.
+
+    Args:
+        path: Cookie jar file
+
+    Returns:
+        True if the jar is ready, False if it could not be set up
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # mkdir's mode is masked by the umask and ignored for existing dirs
+        os.chmod(path.parent, 0o700)
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            os.chmod(path, 0o600)
+        else:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(_COOKIE_JAR_HEADER)
+    except OSError as e:
+        logger.warning("cookie_jar_unavailable", path=str(path), error=str(e))
+        return False
+    return True
+
 
 class Downloader:
     """YouTube video downloader using yt-dlp."""
 
-    def __init__(self, profile: Profile) -> None:
+    def __init__(self, profile: Profile, max_workers: int | None = None) -> None:
         """Initialize downloader.
 
         Args:
             profile: Download profile configuration
+            max_workers: Worker threads for blocking yt-dlp calls (extractions and
+                downloads) when no batch call asks for another size
         """
         self.profile = profile
         self.download_config = profile.download
         self.temp_dir = get_temp_dir()
+        # Shared cookie jar so yt-dlp sessions persist across videos and runs
+        # (only used when no browser cookies or cookie file are configured)
+        self.session_cookie_file = get_config_dir() / "cache" / "session" / "cookies.txt"
+        # Earlier versions kept the jar in the shared temp dir; don't leave it there
+        try:
+            (self.temp_dir / "cookies.txt").unlink(missing_ok=True)
+        except OSError:
+            pass
+        # Persistent yt-dlp cache (player JS, signature functions) shared across runs;
+        # yt-dlp creates the directory on first write
+        self.ydl_cache_dir = get_config_dir() / "cache" / "yt-dlp"
         self.cache = MetadataCache()
+        # Built format strings keyed by the profile settings they depend on
+        self._format_string_cache: dict[tuple[int, int, int, str, str, str], str] = {}
+        # Bounded worker pool for blocking yt-dlp calls (created on first use)
+        self._pool: ThreadPoolExecutor | None = None
+        self._pool_size = 0
+        self._default_pool_size = max_workers or _DEFAULT_POOL_WORKERS
+        # Long-lived YoutubeDL instances, one per option set per thread
+        # (YoutubeDL is not thread-safe, so worker threads never share one)
+        self._ydl_local = threading.local()
+        self._ydl_instances: list[Any] = []
+        self._ydl_lock = threading.Lock()
+        # Info dicts extracted live (not from MetadataCache) in this process, by URL,
+        # with their monotonic extraction time; only these are handed to yt-dlp for
+        # download, since the signed stream URLs in cached entries expire within hours
+        self._live_info: dict[str, tuple[dict[str, Any], float]] = {}
+        # In-flight async info extractions by URL, so concurrent callers share one request
+        self._inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+        # Static yt-dlp options, copied and completed by _get_ydl_opts
+        self._opts_template = self._build_opts_template()
 
         logger.info("downloader_initialized", profile=profile.profile.name)
 
+    def _get_pool(self, max_workers: int | None = None) -> ThreadPoolExecutor:
+        """Get the shared worker pool, resizing it if a different size is requested.
+
+        Args:
+            max_workers: Desired number of worker threads (defaults to current size)
+
+        Returns:
+            Thread pool used for blocking yt-dlp calls
+        """
+        size = max_workers or self._pool_size or self._default_pool_size
+        if self._pool is None or size != self._pool_size:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+            self._pool = ThreadPoolExecutor(max_workers=size, thread_name_prefix="yt2audi-dl")
+            self._pool_size = size
+        return self._pool
+
+    async def _run_in_pool(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking callable on the shared worker pool.
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for func
+
+        Returns:
+            Result of func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_pool(), functools.partial(func, *args))
+
+    def _dispatch_progress(self, d: dict[str, Any]) -> None:
+        """Forward yt-dlp progress to the current call's hook on this thread."""
+        hook = getattr(self._ydl_local, "progress_hook", None)
+        if hook is not None:
+            hook(d)
+
+    @contextmanager
+    def _ydl(self, opts: dict[str, Any]) -> Iterator[Any]:
+        """Get a long-lived YoutubeDL for these options on the current thread.
+
+        Instances are cached by their options, excluding the output template and
+        progress hooks, which are applied per call. Reusing an instance keeps its
+        extractors, cookies and player JS cache warm across videos.
+
+        Args:
+            opts: yt-dlp options dictionary
+
+        Yields:
+            YoutubeDL instance
+        """
+        outtmpl = opts.pop("outtmpl", None)
+        progress_hooks = opts.pop("progress_hooks", None)
+        key = tuple(sorted((k, repr(v)) for k, v in opts.items()))
+
+        instances: dict[tuple[tuple[str, str], ...], Any] = self._ydl_local.__dict__.setdefault(
+            "instances", {}
+        )
+        ydl = instances.get(key)
+        if ydl is None:
+            opts["progress_hooks"] = [self._dispatch_progress]
+            if outtmpl is not None:
+                opts["outtmpl"] = outtmpl
+            instance = yt_dlp.YoutubeDL(opts)
+            ydl = instances[key] = instance.__enter__()
+            with self._ydl_lock:
+                self._ydl_instances.append(instance)
+        elif outtmpl is not None:
+            ydl.params["outtmpl"]["default"] = outtmpl
+
+        self._ydl_local.progress_hook = progress_hooks[0] if progress_hooks else None
+        try:
+            yield ydl
+        finally:
+            self._ydl_local.progress_hook = None
+
+    def close(self) -> None:
+        """Release the worker pool and cached YoutubeDL instances."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+            self._pool_size = 0
+
+        with self._ydl_lock:
+            instances, self._ydl_instances = self._ydl_instances, []
+        for instance in instances:
+            try:
+                instance.__exit__(None, None, None)
+            except Exception as e:
+                logger.debug("ydl_close_failed", error=str(e))
+        self._ydl_local = threading.local()
+
     async def extract_info_async(self, url: str) -> dict[str, Any]:
         """Extract video info asynchronously.
+
+        Concurrent calls for the same URL share a single extraction.
         
         Args:
             url: YouTube URL
@@ -40,7 +251,13 @@ class Downloader:
         Returns:
             yt-dlp info dictionary
         """
-        return await asyncio.to_thread(self.extract_info, url)
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._run_in_pool(self.extract_info, url))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+        # Shield so one cancelled caller doesn't cancel the extraction for the others
+        return await asyncio.shield(task)
 
     def extract_info(self, url: str) -> dict[str, Any]:
         """Extract video info.
@@ -63,7 +280,7 @@ class Downloader:
         if cached:
             return cached
             
-        ydl_opts = self._get_ydl_opts("dummy", ignore_archive=True)
+        ydl_opts = self._get_ydl_opts("dummy", ignore_archive=True, skip_format=True)
         # Faster extraction
         ydl_opts.update({
             "skip_download": True,
@@ -71,14 +288,14 @@ class Downloader:
         })
         
         try:
-            import yt_dlp
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with self._ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
                 if not info:
                     raise DownloadError(f"Failed to extract info for {url}")
                 
                 # Cache result
                 self.cache.set(url, info)
+                self._live_info[url] = (info, time.monotonic())
                 return info
                 
         except Exception as e:
@@ -98,17 +315,24 @@ class Downloader:
         audio_cfg = self.profile.audio
         output_cfg = self.profile.output
 
+        cache_key = (
+            video_cfg.max_height,
+            video_cfg.max_fps,
+            audio_cfg.bitrate_kbps,
+            video_cfg.codec,
+            audio_cfg.codec,
+            output_cfg.container,
+        )
+        cached = self._format_string_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Calculate target video constraints
-        # Add 20% headroom to max_height to allow for some quality margin
-        # But use standard resolutions (480p, 720p) as thresholds
-        if video_cfg.max_height <= 480:
-            max_download_height = 480
-        elif video_cfg.max_height <= 540:
-            max_download_height = 720  # 720p is standard, gives good quality for 540p output
-        elif video_cfg.max_height <= 720:
-            max_download_height = 720
-        elif video_cfg.max_height <= 1080:
-            max_download_height = 1080
+        # Use standard resolutions (480p, 720p, 1080p) as thresholds; anything
+        # above 1080p downloads at the requested height
+        idx = bisect.bisect_left(_HEIGHT_THRESHOLDS, video_cfg.max_height)
+        if idx < len(_HEIGHT_DOWNLOADS):
+            max_download_height = _HEIGHT_DOWNLOADS[idx]
         else:
             max_download_height = video_cfg.max_height
 
@@ -118,106 +342,37 @@ class Downloader:
         # Audio bitrate: match target (no need to download 320kbps if we output 128kbps)
         max_audio_bitrate = audio_cfg.bitrate_kbps
 
-        # Codec preferences
-        video_codec_pref = "vcodec^=avc" if video_cfg.codec == "h264" else f"vcodec^={video_cfg.codec}"
-        audio_codec_pref = audio_cfg.codec  # aac, mp3, opus
-
-        # Container preference
-        container_pref = output_cfg.container  # mp4, mkv, etc.
-
-        # Build format selector with quality constraints
-        # Priority: resolution -> fps -> codec -> container
-        format_parts = []
-
-        # Video format selection
-        video_filter = (
-            f"bestvideo[height<={max_download_height}]"
-            f"[fps<={max_fps}]"
-            f"[{video_codec_pref}]"
-            f"[ext={container_pref}]"
-        )
-
-        # Audio format selection
-        audio_filter = (
-            f"bestaudio[abr<={max_audio_bitrate}]"
-            f"[acodec^={audio_codec_pref}]"
-            f"[ext=m4a]"
-        )
-
-        # Build complete format string with fallbacks
-        # 1. Best match: height + fps + codec + container constraints
-        format_parts.append(f"{video_filter}+{audio_filter}")
-
-        # 2. Relaxed codec constraint (just height + fps + container)
-        format_parts.append(
-            f"bestvideo[height<={max_download_height}][fps<={max_fps}][ext={container_pref}]+"
-            f"bestaudio[abr<={max_audio_bitrate}][ext=m4a]"
-        )
-
-        # 3. Relaxed container (just height + fps)
-        format_parts.append(
-            f"bestvideo[height<={max_download_height}][fps<={max_fps}]+"
-            f"bestaudio[abr<={max_audio_bitrate}]"
-        )
-
-        # 4. Just height constraint
-        format_parts.append(
-            f"bestvideo[height<={max_download_height}]+"
-            f"bestaudio"
+        format_string = _FORMAT_TEMPLATE.format(
+            height=max_download_height,
+            fps=max_fps,
+            abr=max_audio_bitrate,
+            # Codec preferences
+            vcodec="avc" if video_cfg.codec == "h264" else video_cfg.codec,
+            acodec=audio_cfg.codec,  # aac, mp3, opus
+            # Container preference
+            container=output_cfg.container,  # mp4, mkv, etc.
         )
 
-        # 5. Best combined format with height constraint
-        format_parts.append(f"best[height<={max_download_height}][ext={container_pref}]")
-
-        # 6. Best combined format with container preference
-        format_parts.append(f"best[ext={container_pref}]")
-
-        # 7. Last resort: any best format
-        format_parts.append("best")
-
-        format_string = "/".join(format_parts)
-
-        logger.info(
+        logger.debug(
             "format_string_built",
             max_height=max_download_height,
             max_fps=max_fps,
             max_audio_bitrate=max_audio_bitrate,
             video_codec=video_cfg.codec,
             audio_codec=audio_cfg.codec,
-            format_string=format_string[:200] + "..." if len(format_string) > 200 else format_string,
+            format_string=format_string,
         )
 
+        self._format_string_cache[cache_key] = format_string
         return format_string
 
-    def _get_ydl_opts(
-        self,
-        output_template: str,
-        progress_hook: Callable[[dict[str, Any]], None] | None = None,
-        use_optimized_format: bool = True,
-        ignore_archive: bool = False,
-    ) -> dict[str, Any]:
-        """Build yt-dlp options dictionary.
-
-        Args:
-            output_template: Output filename template
-            progress_hook: Optional progress callback
-            use_optimized_format: Use profile-optimized format string (default: True)
-            ignore_archive: Ignore download archive (force download)
+    def _build_opts_template(self) -> dict[str, Any]:
+        """Build the yt-dlp options that do not change between calls.
 
         Returns:
-            yt-dlp options dictionary
+            Static part of the yt-dlp options dictionary
         """
-        from yt2audi.config import expand_path
-
-        # Use optimized format string if requested or if format_preference is "auto"
-        if use_optimized_format or self.download_config.format_preference == "auto":
-            format_string = self._build_optimized_format_string()
-        else:
-            format_string = self.download_config.format_preference
-
         opts: dict[str, Any] = {
-            "format": format_string,
-            "outtmpl": str(output_template),
             "retries": self.download_config.retries,
             "fragment_retries": self.download_config.fragment_retries,
             "restrictfilenames": True,  # Avoid special characters
@@ -226,6 +381,8 @@ class Downloader:
             "no_warnings": False,
             "quiet": False,
             "no_color": True,
+            # Reuse connections to the same media hosts across requests
+            "http_headers": {"Connection": "keep-alive"},
             # Bypassing 403s and blocklists:
             # We avoid hardcoding specific clients (like android/ios) unless we have a PO Token
             # because yt-dlp might fail if those clients are enforced without a token.
@@ -241,15 +398,16 @@ class Downloader:
             "continuedl": True,
             "nopart": False,  # Use .part files for better resume detection
             "hls_prefer_native": True, # Better for long streams
-            "concurrent_fragment_downloads": 3, # Speed up multi-part downloads
-            # Thumbnail downloading
-            "writethumbnail": True,
-            "postprocessors": [
-                {
-                    "key": "FFmpegThumbnailsConvertor",
-                    "format": "jpg",
-                }
-            ],
+            # Reuse downloaded player JS instead of fetching it on every run
+            "cachedir": os.fspath(self.ydl_cache_dir),
+            # Speed up multi-part (DASH/HLS) downloads
+            "concurrent_fragment_downloads": self.download_config.concurrent_fragments,
+            # Ranged requests for progressive mp4 downloads
+            "http_chunk_size": int(self.download_config.http_chunk_size_mb * 1024 * 1024),
+            # Thumbnail downloading, kept in its original format: the converter
+            # re-encodes it to MJPEG anyway, so a separate ffmpeg JPEG pass here
+            # would only hold up the download thread
+            "writethumbnail": self.download_config.write_thumbnail,
             # JS Runtime - helps with YouTube extraction scripts
             "js_runtimes": {"node": {}},
             "remote_components": ["ejs:github"],
@@ -264,6 +422,15 @@ class Downloader:
             if cookies_path.exists():
                 opts["cookiefile"] = str(cookies_path)
 
+        # Otherwise fall back to the session cookie jar (yt-dlp loads it and saves
+        # it on close); configured cookies are never copied into it
+        if (
+            not self.download_config.cookies_from_browser
+            and not self.download_config.cookies_file
+            and _prepare_cookie_jar(self.session_cookie_file)
+        ):
+            opts["cookiefile"] = os.fspath(self.session_cookie_file)
+
         # PO Token handling
         if self.download_config.po_token:
             # If token provided, we can try to force clients or just pass the token
@@ -281,43 +448,80 @@ class Downloader:
                 }
             }
 
-        # Download archive for resume functionality
-        # We skip archive if explicitly requested (e.g. for temp downloads)
-        if self.download_config.download_archive and not ignore_archive:
-            archive_path = expand_path(self.download_config.download_archive)
-            archive_path.parent.mkdir(parents=True, exist_ok=True)
-            opts["download_archive"] = str(archive_path)
-
         # Rate limiting
         if self.download_config.rate_limit_mbps:
             # Convert Mbps to bytes per second
             rate_limit_bytes = int(self.download_config.rate_limit_mbps * 1024 * 1024 / 8)
             opts["ratelimit"] = rate_limit_bytes
 
+        return opts
+
+    def _get_ydl_opts(
+        self,
+        output_template: str | os.PathLike[str],
+        progress_hook: Callable[[dict[str, Any]], None] | None = None,
+        use_optimized_format: bool = True,
+        ignore_archive: bool = False,
+        skip_format: bool = False,
+    ) -> dict[str, Any]:
+        """Build yt-dlp options dictionary.
+
+        Starts from a shallow copy of the static template built at init and only
+        fills in the per-call keys.
+
+        Args:
+            output_template: Output filename template
+            progress_hook: Optional progress callback
+            use_optimized_format: Use profile-optimized format string (default: True)
+            ignore_archive: Ignore download archive (force download)
+            skip_format: Use a static format for metadata-only calls that never download
+
+        Returns:
+            yt-dlp options dictionary
+        """
+        if skip_format:
+            format_string = "bestaudio/best"
+        # Use optimized format string if requested or if format_preference is "auto"
+        elif use_optimized_format or self.download_config.format_preference == "auto":
+            format_string = self._build_optimized_format_string()
+        else:
+            format_string = self.download_config.format_preference
+
+        opts = self._opts_template.copy()
+        opts["format"] = format_string
+        opts["outtmpl"] = os.fspath(output_template)
+
+        # Download archive for resume functionality
+        # We skip archive if explicitly requested (e.g. for temp downloads)
+        if self.download_config.download_archive and not ignore_archive:
+            archive_path = expand_path(self.download_config.download_archive)
+            archive_path.parent.mkdir(parents=True, exist_ok=True)
+            opts["download_archive"] = os.fspath(archive_path)
+
         # Progress hook
         if progress_hook:
             opts["progress_hooks"] = [progress_hook]
 
         return opts
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((DownloadError, ConnectionError)),
-        reraise=True,
-    )
     def download_video(
         self,
         url: str,
         output_dir: Path | None = None,
         progress_callback: Callable[[dict[str, Any]], None] | None = None,
+        info_dict: dict[str, Any] | None = None,
     ) -> tuple[Path, dict[str, Any]]:
         """Download a single video.
 
+        Download and connection errors are retried with exponential backoff.
+
         Args:
             url: YouTube video URL
             output_dir: Output directory (defaults to temp_dir)
             progress_callback: Optional callback for progress updates
+            info_dict: Info already extracted for this URL by extract_info; skips
+                the metadata round-trip on the first attempt if it was extracted
+                live within the last hour (cached info is re-extracted)
 
         Returns:
             Tuple of (Path to downloaded video file, info_dict)
@@ -326,57 +530,123 @@ class Downloader:
             DownloadError: If download fails
             ValueError: If URL is invalid
         """
+        # Validate once up front rather than on every retry attempt
         if not is_valid_url(url):
             raise ValueError(f"Invalid URL: {url}")
 
         if not is_youtube_url(url):
             logger.warning("non_youtube_url", url=url)
 
+        info_dict = self._take_live_info(url, info_dict)
+
+        attempt = 0
+        while True:
+            try:
+                return self._download_video_once(url, output_dir, progress_callback, info_dict)
+            except (DownloadError, ConnectionError) as e:
+                attempt += 1
+                # Retries always re-extract rather than reuse the handed-over info
+                info_dict = None
+                if attempt >= _DOWNLOAD_ATTEMPTS:
+                    raise
+                delay = min(_RETRY_MAX_DELAY, _RETRY_MIN_DELAY * 2 ** (attempt - 1))
+                logger.warning(
+                    "download_retry", url=url, attempt=attempt, delay=delay, error=str(e)
+                )
+                time.sleep(delay)
+
+    def _take_live_info(
+        self, url: str, info_dict: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        """Return info_dict only if it is this process's recent live extraction of url.
+
+        Cache hits from MetadataCache are kept for days, but the signed stream
+        URLs inside them expire after a few hours, so downloading from them
+        would fail with HTTP 403 and fall back to a delayed retry.
+
+        Args:
+            url: URL being downloaded
+            info_dict: Info handed over by the caller, if any
+
+        Returns:
+            info_dict if it can be downloaded from directly, otherwise None
+        """
+        live = self._live_info.pop(url, None)
+        if info_dict is None:
+            return None
+        if (
+            live is None
+            or live[0] is not info_dict
+            or time.monotonic() - live[1] > _LIVE_INFO_MAX_AGE
+        ):
+            logger.debug("info_dict_not_live", url=url)
+            return None
+        return info_dict
+
+    def _download_video_once(
+        self,
+        url: str,
+        output_dir: Path | None,
+        progress_callback: Callable[[dict[str, Any]], None] | None,
+        info_dict: dict[str, Any] | None = None,
+    ) -> tuple[Path, dict[str, Any]]:
+        """Perform a single download attempt on an already validated URL (see download_video)."""
         output_dir = output_dir or self.temp_dir
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Output template
         output_template = output_dir / "%(title)s_%(id)s.%(ext)s"
 
-        logger.info("download_started", url=url, output_dir=str(output_dir))
+        logger.debug("download_started", url=url, output_dir=str(output_dir))
 
         try:
-            import yt_dlp
-
             # Ignore archive for single video downloads to ensure we get the file
             # even if it was previously recorded but deleted.
             ydl_opts = self._get_ydl_opts(
-                str(output_template), 
+                output_template,
                 progress_callback,
                 ignore_archive=True
             )
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                # Extract info first
-                info = ydl.extract_info(url, download=False)
-                if not info:
-                    raise DownloadError(f"Could not extract video info from {url}")
-
-                # Get expected filename
-                filename = ydl.prepare_filename(info)
-                output_path = Path(filename)
-
-                # Download
-                ydl.download([url])
+            with self._ydl(ydl_opts) as ydl:
+                if info_dict is not None:
+                    # Re-run format selection and download from the known info,
+                    # without fetching the video page again (copy: yt-dlp mutates it)
+                    info = ydl.process_ie_result(dict(info_dict), download=True)
+                    output_path = Path(ydl.prepare_filename(info))
+                else:
+                    # Extract info first
+                    info = ydl.extract_info(url, download=False)
+                    if not info:
+                        raise DownloadError(f"Could not extract video info from {url}")
+
+                    # Get expected filename
+                    filename = ydl.prepare_filename(info)
+                    output_path = Path(filename)
+
+                    # Download
+                    ydl.download([url])
 
                 if not output_path.exists():
                     raise DownloadError(f"Download completed but file not found: {output_path}")
 
+                # Prefer the size yt-dlp already reported over another stat() call
+                size_bytes = (
+                    info.get("filesize")
+                    or info.get("filesize_approx")
+                    or output_path.stat().st_size
+                )
                 logger.info(
                     "download_completed",
                     url=url,
+                    video_id=info.get("id"),
                     path=str(output_path),
-                    size_mb=output_path.stat().st_size / 1024 / 1024,
+                    size_mb=size_bytes / 1024 / 1024,
                 )
 
                 return output_path, info
 
-        except yt_dlp.utils.DownloadError as e:
+        except YTDLPDownloadError as e:
             logger.error("download_failed", url=url, error=str(e))
             raise DownloadError(f"Failed to download {url}: {e}") from e
         except Exception as e:
@@ -388,6 +658,7 @@ class Downloader:
         url: str,
         output_dir: Path | None = None,
         progress_callback: Callable[[dict[str, Any]], None] | None = None,
+        info_dict: dict[str, Any] | None = None,
     ) -> tuple[Path, dict[str, Any]]:
         """Download a single video asynchronously.
 
@@ -395,22 +666,58 @@ class Downloader:
             url: YouTube video URL
             output_dir: Output directory
             progress_callback: Optional callback for progress updates
+            info_dict: Info already extracted for this URL, reused instead of re-fetching
 
         Returns:
             Tuple of (Path to downloaded video file, info_dict)
         """
-        return await asyncio.to_thread(
-            self.download_video, url, output_dir, progress_callback
+        return await self._run_in_pool(
+            self.download_video, url, output_dir, progress_callback, info_dict
         )
 
-    async def download_batch_async(
+    def _make_batch_progress_hook(
+        self,
+        url: str,
+        progress_callback: Callable[[str, dict[str, Any]], None] | None,
+    ) -> Callable[[dict[str, Any]], None] | None:
+        """Wrap a batch progress callback to include the URL and throttle updates.
+
+        "downloading" updates are forwarded at most every _PROGRESS_INTERVAL seconds;
+        other statuses (finished, error) always pass through.
+
+        Args:
+            url: URL the hook reports progress for
+            progress_callback: Optional callback(url, progress_dict)
+
+        Returns:
+            Progress hook for download_video, or None if there is no callback
+        """
+        if progress_callback is None:
+            return None
+
+        last_progress = 0.0
+
+        def _progress_hook(d: dict[str, Any]) -> None:
+            nonlocal last_progress
+            now = time.monotonic()
+            if d.get("status") == "downloading" and now - last_progress < _PROGRESS_INTERVAL:
+                return
+            last_progress = now
+            progress_callback(url, d)
+
+        return _progress_hook
+
+    async def iter_download_batch_async(
         self,
         urls: list[str],
         output_dir: Path | None = None,
         progress_callback: Callable[[str, dict[str, Any]], None] | None = None,
         max_concurrent: int = 3,
-    ) -> list[Path]:
-        """Download multiple videos concurrently.
+    ) -> AsyncIterator[tuple[Path, dict[str, Any]]]:
+        """Download multiple videos concurrently, yielding each as soon as it finishes.
+
+        Lets callers start processing finished videos while others still download.
+        Failed downloads are logged and skipped.
 
         Args:
             urls: List of YouTube URLs
@@ -418,36 +725,75 @@ class Downloader:
             progress_callback: Optional callback(url, progress_dict)
             max_concurrent: Maximum number of concurrent downloads
 
-        Returns:
-            List of paths to downloaded videos
+        Yields:
+            Tuples of (Path to downloaded video file, info_dict) in completion order
         """
         output_dir = output_dir or self.temp_dir
-        semaphore = asyncio.Semaphore(max_concurrent)
-        
-        logger.info("async_batch_download_started", url_count=len(urls), concurrent=max_concurrent)
+        self._get_pool(max_concurrent)
 
-        async def _download_task(url: str) -> Path | None:
-            async with semaphore:
+        logger.debug("async_batch_download_started", url_count=len(urls), concurrent=max_concurrent)
+
+        # A fixed set of workers pulls URLs from a queue, so memory stays
+        # O(max_concurrent) tasks however long the batch is
+        pending: asyncio.Queue[str] = asyncio.Queue()
+        for url in urls:
+            pending.put_nowait(url)
+        finished: asyncio.Queue[tuple[Path, dict[str, Any]] | None] = asyncio.Queue()
+
+        async def _download_task(url: str) -> tuple[Path, dict[str, Any]] | None:
+            try:
+                return await self.download_video_async(
+                    url, output_dir, self._make_batch_progress_hook(url, progress_callback)
+                )
+            except Exception as e:
+                logger.error("async_batch_item_failed", url=url, error=str(e))
+                return None
+
+        async def _worker() -> None:
+            while True:
                 try:
-                    # Wrap progress callback to include URL
-                    def _progress_hook(d: dict[str, Any]) -> None:
-                        if progress_callback:
-                            progress_callback(url, d)
-
-                    return await self.download_video_async(url, output_dir, _progress_hook)
-                except Exception as e:
-                    logger.error("async_batch_item_failed", url=url, error=str(e))
-                    return None
-
-        # Create tasks for all URLs
-        tasks = [_download_task(url) for url in urls]
-        
-        # Run tasks and wait for completion
-        results = await asyncio.gather(*tasks)
-        
-        # Filter out failures
-        successful_results = [r for r in results if r is not None]
-        # successful_results is a list of (Path, dict)
+                    url = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                finished.put_nowait(await _download_task(url))
+
+        workers = [
+            asyncio.ensure_future(_worker()) for _ in range(max(1, min(max_concurrent, len(urls))))
+        ]
+        try:
+            for _ in urls:
+                result = await finished.get()
+                if result is not None:
+                    yield result
+        finally:
+            # Consumer stopped early: stop pulling new URLs
+            for worker in workers:
+                worker.cancel()
+
+    async def download_batch_async(
+        self,
+        urls: list[str],
+        output_dir: Path | None = None,
+        progress_callback: Callable[[str, dict[str, Any]], None] | None = None,
+        max_concurrent: int = 3,
+    ) -> list[tuple[Path, dict[str, Any]]]:
+        """Download multiple videos concurrently.
+
+        Args:
+            urls: List of YouTube URLs
+            output_dir: Output directory
+            progress_callback: Optional callback(url, progress_dict)
+            max_concurrent: Maximum number of concurrent downloads
+
+        Returns:
+            List of (Path, info_dict) tuples for successful downloads, in completion order
+        """
+        successful_results = [
+            result
+            async for result in self.iter_download_batch_async(
+                urls, output_dir, progress_callback, max_concurrent
+            )
+        ]
 
         logger.info(
             "async_batch_download_completed",
@@ -465,18 +811,18 @@ class Downloader:
         progress_callback: Callable[[str, dict[str, Any]], None] | None = None,
         use_async: bool = False,
         max_concurrent: int = 3,
-    ) -> list[Path]:
-        """Download multiple videos.
+    ) -> list[tuple[Path, dict[str, Any]]]:
+        """Download multiple videos concurrently.
 
         Args:
             urls: List of YouTube URLs
             output_dir: Output directory
             progress_callback: Optional callback(url, progress_dict)
-            use_async: Whether to use concurrent downloads
-            max_concurrent: Max concurrent downloads if use_async is True
+            use_async: Whether to run the downloads through the asyncio batch API
+            max_concurrent: Max concurrent downloads
 
         Returns:
-            List of paths to downloaded videos
+            List of (Path, info_dict) tuples for successful downloads, in completion order
         """
         if use_async:
             try:
@@ -497,20 +843,26 @@ class Downloader:
         output_dir = output_dir or self.temp_dir
         results: list[tuple[Path, dict[str, Any]]] = []
 
-        logger.info("batch_download_started", url_count=len(urls))
-
-        for i, url in enumerate(urls, 1):
-            logger.info("batch_progress", current=i, total=len(urls), url=url)
+        logger.debug("batch_download_started", url_count=len(urls), concurrent=max_concurrent)
+
+        # Downloads are network-bound and yt-dlp releases the GIL on socket I/O,
+        # so plain worker threads overlap them without any event loop
+        pool = self._get_pool(max_concurrent)
+        futures = {
+            pool.submit(
+                self.download_video,
+                url,
+                output_dir,
+                self._make_batch_progress_hook(url, progress_callback),
+            ): url
+            for url in urls
+        }
 
+        for i, future in enumerate(as_completed(futures), 1):
+            url = futures[future]
+            logger.debug("batch_progress", current=i, total=len(urls), url=url)
             try:
-                # Wrap progress callback to include URL
-                def _progress_hook(d: dict[str, Any]) -> None:
-                    if progress_callback:
-                        progress_callback(url, d)
-
-                path, info = self.download_video(url, output_dir, _progress_hook)
-                results.append((path, info))
-
+                results.append(future.result())
             except Exception as e:
                 logger.error("batch_item_failed", url=url, error=str(e))
                 # Continue with next video
@@ -524,12 +876,6 @@ class Downloader:
 
         return results
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((DownloadError, ConnectionError)),
-        reraise=True,
-    )
     def download_playlist(
         self,
         playlist_url: str,
@@ -560,9 +906,7 @@ class Downloader:
         logger.info("playlist_download_started", url=playlist_url)
 
         try:
-            import yt_dlp
-
-            ydl_opts = self._get_ydl_opts(str(output_template), progress_callback)
+            ydl_opts = self._get_ydl_opts(output_template, progress_callback)
 
             # Override for playlist
             ydl_opts["noplaylist"] = False
@@ -572,7 +916,7 @@ class Downloader:
             if self.download_config.playlist_reverse:
                 ydl_opts["playlist_reverse"] = True
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with self._ydl(ydl_opts) as ydl:
                 # Extract playlist info
                 info = ydl.extract_info(playlist_url, download=False)
                 if not info:
@@ -586,9 +930,17 @@ class Downloader:
                 # Download playlist
                 ydl.download([playlist_url])
 
-                # Find downloaded files
-                downloaded_files = sorted(output_dir.glob("*"))
-                downloaded_videos = [f for f in downloaded_files if f.suffix in [".mp4", ".mkv", ".webm"]]
+                # Find downloaded files (sorted so playlist_index prefixes keep order)
+                with os.scandir(output_dir) as it:
+                    downloaded_videos = [
+                        Path(path)
+                        for path in sorted(
+                            entry.path
+                            for entry in it
+                            if entry.name.endswith(_VIDEO_EXTENSIONS)
+                            and entry.is_file(follow_symlinks=False)
+                        )
+                    ]
 
                 logger.info(
                     "playlist_download_completed",
@@ -599,7 +951,7 @@ class Downloader:
 
                 return downloaded_videos
 
-        except yt_dlp.utils.DownloadError as e:
+        except YTDLPDownloadError as e:
             logger.error("playlist_download_failed", url=playlist_url, error=str(e))
             raise DownloadError(f"Failed to download playlist {playlist_url}: {e}") from e
         except Exception as e:
@@ -615,7 +967,7 @@ class Downloader:
         Returns:
             List of video URLs
         """
-        return await asyncio.to_thread(self.get_playlist_urls, playlist_url)
+        return await self._run_in_pool(self.get_playlist_urls, playlist_url)
 
     def get_playlist_urls(self, playlist_url: str) -> list[str]:
         """Extract video URLs from a playlist.
@@ -626,8 +978,6 @@ class Downloader:
         Returns:
             List of video URLs
         """
-        import yt_dlp
-
         ydl_opts = {
             "extract_flat": True,
             "quiet": True,
@@ -638,7 +988,7 @@ class Downloader:
         }
 
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with self._ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(playlist_url, download=False)
                 if not info or "entries" not in info:
                     return []
@@ -651,44 +1001,3 @@ class Downloader:
         except Exception as e:
             logger.error("playlist_extraction_failed", url=playlist_url, error=str(e))
             return []
-
-    def extract_info(self, url: str, download: bool = False) -> dict[str, Any]:
-        """Extract video information without downloading.
-
-        Args:
-            url: YouTube video URL
-            download: Whether to download the video
-
-        Returns:
-            Dictionary with video metadata
-
-        Raises:
-            DownloadError: If info extraction fails
-        """
-        if not is_valid_url(url):
-            raise ValueError(f"Invalid URL: {url}")
-
-        logger.info("extracting_video_info", url=url)
-
-        # Try cache first
-        cached_info = self.cache.get(url)
-        if cached_info:
-            return cached_info
-
-        try:
-            import yt_dlp
-
-            ydl_opts = {"quiet": True, "no_warnings": True}
-
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                if not info:
-                    raise DownloadError(f"Could not extract info from {url}")
-
-                # Cache the result
-                self.cache.set(url, info)
-                return info
-
-        except Exception as e:
-            logger.error("info_extraction_failed", url=url, error=str(e))
-            raise DownloadError(f"Failed to extract info from {url}: {e}") from e
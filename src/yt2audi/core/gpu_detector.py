@@ -1,24 +1,53 @@
 """GPU detection and encoder selection."""
 
+import asyncio
+import atexit
+import functools
+import re
+import shutil
 import subprocess
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 import structlog
-try:
-    import py3nvml.py3nvml as nvml
-except ImportError:
-    nvml = None
-
-try:
-    import GPUtil
-except ImportError:
-    GPUtil = None
 
 from yt2audi.exceptions import GPUDetectionError
 from yt2audi.models.profile import EncoderType
 
 logger = structlog.get_logger(__name__)
 
+# Encoder rows in `ffmpeg -encoders` output, e.g. " V....D h264_nvenc  NVIDIA NVENC ..."
+_ENCODER_LINE_RE = re.compile(r"^\s*[VAS][F.][S.][X.][B.][D.]\s+(\S+)", re.MULTILINE)
+
+# Linux DRM devices; each exposes its PCI vendor ID (e.g. "0x1002") under device/vendor
+_DRM_CLASS_DIR = Path("/sys/class/drm")
+
+# PCI vendor IDs of GPU makers with hardware H.264 encoders
+_PCI_VENDOR_IDS = {
+    "0x10de": "nvidia",
+    "0x1002": "amd",
+    "0x8086": "intel",
+}
+
+# NVML stays initialized for the process lifetime once detect_nvidia_gpu succeeds.
+# nvmlInit can hang on broken driver setups, so it is bounded by a timeout.
+_NVML_INIT_TIMEOUT = 2.0
+_nvml_lock = threading.Lock()
+_nvml_initialized = False
+
+# py3nvml is imported on the first NVIDIA probe, not at import time; None once
+# the import has failed (optional dependency)
+_NVML_NOT_LOADED: Any = object()
+nvml: Any = _NVML_NOT_LOADED
+
+# Serializes the first `ffmpeg -encoders` run when probes check encoders concurrently
+_ffmpeg_probe_lock = threading.Lock()
+
 
 class GPUVendor(str, Enum):
     """GPU vendor types."""
@@ -49,17 +78,94 @@ class GPUInfo:
         return f"GPUInfo(vendor={self.vendor}, name={self.name}, has_encoder={self.has_encoder})"
 
 
+# Hardware H.264 encoder for each GPU vendor
+_VENDOR_ENCODER = MappingProxyType({
+    GPUVendor.NVIDIA: EncoderType.NVENC_H264,
+    GPUVendor.AMD: EncoderType.AMF_H264,
+    GPUVendor.INTEL: EncoderType.QSV_H264,
+})
+
+# FFmpeg -preset value per encoder (see get_encoder_preset)
+_PRESET_MAP = MappingProxyType({
+    EncoderType.NVENC_H264: "p4",  # Balanced performance/quality
+    EncoderType.AMF_H264: "balanced",
+    EncoderType.QSV_H264: "medium",
+    EncoderType.LIBX264: "medium",
+    EncoderType.AUTO: "medium",
+})
+
+# Rate-control flags per encoder; the quality value is appended after them
+_EXTRA_ARGS_MAP = MappingProxyType({
+    EncoderType.NVENC_H264: ("-rc:v:0", "vbr", "-cq:v:0"),
+    EncoderType.AMF_H264: ("-rc:v:0", "vbr_latency", "-qp_i:v:0"),
+    EncoderType.QSV_H264: ("-global_quality:v:0",),
+    EncoderType.LIBX264: ("-crf:v:0",),
+    EncoderType.AUTO: ("-crf:v:0",),
+})
+
+
+def _load_nvml() -> Any:
+    """Import py3nvml on first use.
+
+    Returns:
+        The py3nvml.py3nvml module, or None if it is not installed
+    """
+    global nvml
+
+    if nvml is _NVML_NOT_LOADED:
+        try:
+            import py3nvml.py3nvml as nvml_module
+        except ImportError:
+            nvml_module = None
+        nvml = nvml_module
+    return nvml
+
+
+def _ensure_nvml() -> None:
+    """Initialize NVML once per process and shut it down at exit.
+
+    Raises:
+        TimeoutError: If nvmlInit does not return within _NVML_INIT_TIMEOUT
+        Exception: Any error raised by nvmlInit
+    """
+    global _nvml_initialized
+
+    with _nvml_lock:
+        if _nvml_initialized:
+            return
+
+        errors: list[BaseException] = []
+
+        def _init() -> None:
+            try:
+                nvml.nvmlInit()
+            except BaseException as e:
+                errors.append(e)
+
+        # Daemon thread, so a hung driver call cannot block interpreter exit
+        thread = threading.Thread(target=_init, name="yt2audi-nvml-init", daemon=True)
+        thread.start()
+        thread.join(_NVML_INIT_TIMEOUT)
+        if thread.is_alive():
+            raise TimeoutError(f"nvmlInit did not return within {_NVML_INIT_TIMEOUT}s")
+        if errors:
+            raise errors[0]
+
+        atexit.register(nvml.nvmlShutdown)
+        _nvml_initialized = True
+
+
 def detect_nvidia_gpu() -> GPUInfo | None:
     """Detect NVIDIA GPU using py3nvml.
 
     Returns:
         GPUInfo if NVIDIA GPU found, None otherwise
     """
-    if nvml is None:
+    if _load_nvml() is None:
         return None
 
     try:
-        nvml.nvmlInit()
+        _ensure_nvml()
         device_count = nvml.nvmlDeviceGetCount()
 
         if device_count > 0:
@@ -70,39 +176,55 @@ def detect_nvidia_gpu() -> GPUInfo | None:
             if isinstance(name, bytes):
                 name = name.decode("utf-8")
 
-            logger.info("nvidia_gpu_detected", name=name, device_count=device_count)
-            nvml.nvmlShutdown()
+            logger.debug("nvidia_gpu_detected", name=name, device_count=device_count)
 
             return GPUInfo(vendor=GPUVendor.NVIDIA, name=name, has_encoder=True)
-
-        nvml.nvmlShutdown()
     except Exception as e:
         logger.debug("nvidia_detection_failed", error=str(e))
 
     return None
 
 
+@functools.cache
+def _scan_pci_vendors() -> frozenset[str]:
+    """Read the PCI vendors of display devices from sysfs (Linux only).
+
+    This is a handful of tiny file reads, unlike GPUtil which shells out to
+    nvidia-smi. Other platforms return an empty set and rely on the FFmpeg probe.
+
+    Returns:
+        Vendor names ("nvidia", "amd", "intel") of the GPUs present
+    """
+    vendors: set[str] = set()
+    try:
+        vendor_files = list(_DRM_CLASS_DIR.glob("card*/device/vendor"))
+    except OSError:
+        return frozenset()
+
+    for vendor_file in vendor_files:
+        try:
+            vendor_id = vendor_file.read_text(encoding="ascii").strip().lower()
+        except OSError:
+            continue
+        if vendor_id in _PCI_VENDOR_IDS:
+            vendors.add(_PCI_VENDOR_IDS[vendor_id])
+
+    return frozenset(vendors)
+
+
 def detect_amd_gpu() -> GPUInfo | None:
-    """Detect AMD GPU using GPUtil or system commands.
+    """Detect AMD GPU from PCI vendor IDs or FFmpeg encoders.
 
     Returns:
         GPUInfo if AMD GPU found, None otherwise
     """
-    if GPUtil is None:
-        return None
-
-    try:
-        gpus = GPUtil.getGPUs()
-        for gpu in gpus:
-            if "amd" in gpu.name.lower() or "radeon" in gpu.name.lower():
-                logger.info("amd_gpu_detected", name=gpu.name)
-                return GPUInfo(vendor=GPUVendor.AMD, name=gpu.name, has_encoder=True)
-    except Exception as e:
-        logger.debug("amd_detection_gputil_failed", error=str(e))
+    if "amd" in _scan_pci_vendors():
+        logger.debug("amd_gpu_detected", source="pci")
+        return GPUInfo(vendor=GPUVendor.AMD, name="AMD GPU", has_encoder=True)
 
     # Fallback: Try to detect via FFmpeg encoders
     if check_ffmpeg_encoder("h264_amf"):
-        logger.info("amd_gpu_detected_via_ffmpeg")
+        logger.debug("amd_gpu_detected_via_ffmpeg")
         return GPUInfo(vendor=GPUVendor.AMD, name="AMD GPU (via FFmpeg)", has_encoder=True)
 
     return None
@@ -114,26 +236,51 @@ def detect_intel_gpu() -> GPUInfo | None:
     Returns:
         GPUInfo if Intel GPU found, None otherwise
     """
-    if GPUtil is None:
-        return None
-
-    try:
-        gpus = GPUtil.getGPUs()
-        for gpu in gpus:
-            if "intel" in gpu.name.lower():
-                logger.info("intel_gpu_detected", name=gpu.name)
-                return GPUInfo(vendor=GPUVendor.INTEL, name=gpu.name, has_encoder=True)
-    except Exception as e:
-        logger.debug("intel_detection_gputil_failed", error=str(e))
+    if "intel" in _scan_pci_vendors():
+        logger.debug("intel_gpu_detected", source="pci")
+        return GPUInfo(vendor=GPUVendor.INTEL, name="Intel GPU", has_encoder=True)
 
     # Fallback: Try to detect via FFmpeg encoders
     if check_ffmpeg_encoder("h264_qsv"):
-        logger.info("intel_gpu_detected_via_ffmpeg")
+        logger.debug("intel_gpu_detected_via_ffmpeg")
         return GPUInfo(vendor=GPUVendor.INTEL, name="Intel GPU (via FFmpeg)", has_encoder=True)
 
     return None
 
 
+@functools.cache
+def _ffmpeg_encoder_set() -> frozenset[str]:
+    """List the encoders compiled into FFmpeg, running `ffmpeg -encoders` once.
+
+    The binary is resolved with shutil.which first; without one on PATH no
+    process is spawned. Only successful listings are cached, so FFmpeg
+    installed later in the session is still picked up.
+
+    Returns:
+        Names of all available FFmpeg encoders
+
+    Raises:
+        subprocess.TimeoutExpired: If FFmpeg does not answer in time
+        FileNotFoundError: If FFmpeg is not on PATH
+        RuntimeError: If FFmpeg exits with an error
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise FileNotFoundError("ffmpeg not found on PATH")
+
+    result = subprocess.run(
+        [ffmpeg, "-hide_banner", "-encoders"],
+        capture_output=True,
+        text=True,
+        timeout=10,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg -encoders exited with code {result.returncode}")
+
+    return frozenset(_ENCODER_LINE_RE.findall(result.stdout))
+
+
 def check_ffmpeg_encoder(encoder_name: str) -> bool:
     """Check if FFmpeg supports a specific encoder.
 
@@ -144,50 +291,43 @@ def check_ffmpeg_encoder(encoder_name: str) -> bool:
         True if encoder is available, False otherwise
     """
     try:
-        result = subprocess.run(
-            ["ffmpeg", "-encoders"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            check=False,
-        )
-
-        if result.returncode == 0:
-            return encoder_name in result.stdout
-
-    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+        with _ffmpeg_probe_lock:
+            encoders = _ffmpeg_encoder_set()
+        return encoder_name in encoders
+    except (subprocess.TimeoutExpired, FileNotFoundError, RuntimeError) as e:
         logger.warning("ffmpeg_encoder_check_failed", encoder=encoder_name, error=str(e))
 
     return False
 
 
+@functools.lru_cache(maxsize=1)
 def detect_available_gpus() -> list[GPUInfo]:
     """Detect all available GPUs.
 
+    The vendor probes are independent and mostly wait on drivers or
+    subprocesses, so they run concurrently. The result is cached for the
+    lifetime of the process (see reset_gpu_cache).
+
     Returns:
-        List of GPUInfo objects for detected GPUs
+        List of GPUInfo objects for detected GPUs (NVIDIA, AMD, Intel order)
     """
-    gpus: list[GPUInfo] = []
+    probes = (detect_nvidia_gpu, detect_amd_gpu, detect_intel_gpu)
+    with ThreadPoolExecutor(max_workers=len(probes), thread_name_prefix="yt2audi-gpu") as pool:
+        results = list(pool.map(lambda probe: probe(), probes))
 
-    # Try NVIDIA
-    nvidia = detect_nvidia_gpu()
-    if nvidia:
-        gpus.append(nvidia)
+    return [gpu for gpu in results if gpu]
 
-    # Try AMD
-    amd = detect_amd_gpu()
-    if amd:
-        gpus.append(amd)
 
-    # Try Intel
-    intel = detect_intel_gpu()
-    if intel:
-        gpus.append(intel)
+async def detect_available_gpus_async() -> list[GPUInfo]:
+    """Detect all available GPUs without blocking the event loop.
 
-    return gpus
+    Returns:
+        List of GPUInfo objects for detected GPUs
+    """
+    return await asyncio.to_thread(detect_available_gpus)
 
 
-def select_best_encoder(encoder_priority: list[EncoderType]) -> EncoderType:
+def select_best_encoder(encoder_priority: Sequence[EncoderType]) -> EncoderType:
     """Select the best available encoder based on priority list.
 
     Args:
@@ -201,35 +341,41 @@ def select_best_encoder(encoder_priority: list[EncoderType]) -> EncoderType:
 
     The function checks each encoder in priority order and returns
     the first one that is available. If no hardware encoder is found,
-    it falls back to libx264 (CPU encoding).
+    it falls back to libx264 (CPU encoding). The selection is cached per
+    priority order, so only the first call probes the hardware. If AUTO
+    comes first, it is returned without probing anything.
     """
-    logger.info("selecting_encoder", priority=encoder_priority)
+    if encoder_priority and encoder_priority[0] == EncoderType.AUTO:
+        logger.debug("encoder_selected", encoder=EncoderType.AUTO.value, probed=False)
+        return EncoderType.AUTO
+    return _select_best_encoder(tuple(encoder_priority))
+
+
+@functools.lru_cache(maxsize=8)
+def _select_best_encoder(encoder_priority: tuple[EncoderType, ...]) -> EncoderType:
+    """Cached body of select_best_encoder (calls that raise are not cached)."""
+    logger.debug("selecting_encoder", priority=encoder_priority)
 
     # Detect available GPUs
     gpus = detect_available_gpus()
-    logger.info("gpus_detected", count=len(gpus), gpus=[str(gpu) for gpu in gpus])
-
-    # Map GPU vendors to encoder types
-    vendor_encoder_map = {
-        GPUVendor.NVIDIA: EncoderType.NVENC_H264,
-        GPUVendor.AMD: EncoderType.AMF_H264,
-        GPUVendor.INTEL: EncoderType.QSV_H264,
-    }
+    # Probe details are debug-only; GPUInfo reprs are only built if the event is rendered
+    logger.debug("gpus_detected", count=len(gpus), gpus=gpus)
 
     # Build set of available encoders
     available_encoders = set()
     for gpu in gpus:
-        if gpu.has_encoder and gpu.vendor in vendor_encoder_map:
-            encoder = vendor_encoder_map[gpu.vendor]
+        if gpu.has_encoder and gpu.vendor in _VENDOR_ENCODER:
+            encoder = _VENDOR_ENCODER[gpu.vendor]
             # Verify encoder is actually available in FFmpeg
             if check_ffmpeg_encoder(encoder.value):
                 available_encoders.add(encoder)
 
-    # Always add libx264 as CPU fallback
+    # Always add libx264 as CPU fallback (AUTO encodes with it too)
     if check_ffmpeg_encoder(EncoderType.LIBX264.value):
         available_encoders.add(EncoderType.LIBX264)
+        available_encoders.add(EncoderType.AUTO)
 
-    logger.info("available_encoders", encoders=[e.value for e in available_encoders])
+    logger.debug("available_encoders", encoders=[e.value for e in available_encoders])
 
     # Select first available encoder from priority list
     for encoder in encoder_priority:
@@ -245,6 +391,17 @@ def select_best_encoder(encoder_priority: list[EncoderType]) -> EncoderType:
     raise GPUDetectionError("No video encoder available (FFmpeg not found or misconfigured)")
 
 
+def reset_gpu_cache() -> None:
+    """Forget cached GPU detection and encoder selection results.
+
+    Useful in tests, or after the FFmpeg build or drivers have changed.
+    """
+    _ffmpeg_encoder_set.cache_clear()
+    _scan_pci_vendors.cache_clear()
+    detect_available_gpus.cache_clear()
+    _select_best_encoder.cache_clear()
+
+
 def get_encoder_preset(encoder: EncoderType) -> str:
     """Get the appropriate preset for an encoder.
 
@@ -260,14 +417,36 @@ def get_encoder_preset(encoder: EncoderType) -> str:
     - QuickSync: veryfast/faster/fast/medium/slow
     - libx264: ultrafast/superfast/veryfast/faster/fast/medium/slow/slower/veryslow
     """
-    preset_map = {
-        EncoderType.NVENC_H264: "p4",  # Balanced performance/quality
-        EncoderType.AMF_H264: "balanced",
-        EncoderType.QSV_H264: "medium",
-        EncoderType.LIBX264: "medium",
-    }
+    return _PRESET_MAP.get(encoder, "medium")
+
+
+def get_encoder_codec(encoder: EncoderType) -> str:
+    """Get the FFmpeg codec name to pass to -c:v for an encoder.
+
+    Args:
+        encoder: Encoder type
+
+    Returns:
+        FFmpeg encoder name (AUTO encodes with libx264)
+    """
+    if encoder == EncoderType.AUTO:
+        return EncoderType.LIBX264.value
+    return encoder.value
+
+
+def get_hwaccel_args(encoder: EncoderType) -> list[str]:
+    """Get FFmpeg input options for hardware-accelerated decoding.
 
-    return preset_map.get(encoder, "medium")
+    Args:
+        encoder: Encoder type
+
+    Returns:
+        List of FFmpeg arguments to place before -i
+    """
+    if encoder == EncoderType.AUTO:
+        # FFmpeg tries the available hwaccels itself and falls back to software
+        return ["-hwaccel", "auto"]
+    return []
 
 
 def get_encoder_extra_args(encoder: EncoderType, quality_cq: int) -> list[str]:
@@ -280,15 +459,7 @@ def get_encoder_extra_args(encoder: EncoderType, quality_cq: int) -> list[str]:
     Returns:
         List of FFmpeg arguments
     """
-    args: list[str] = []
-
-    if encoder == EncoderType.NVENC_H264:
-        args.extend(["-rc:v:0", "vbr", "-cq:v:0", str(quality_cq)])
-    elif encoder == EncoderType.AMF_H264:
-        args.extend(["-rc:v:0", "vbr_latency", "-qp_i:v:0", str(quality_cq)])
-    elif encoder == EncoderType.QSV_H264:
-        args.extend(["-global_quality:v:0", str(quality_cq)])
-    elif encoder == EncoderType.LIBX264:
-        args.extend(["-crf:v:0", str(quality_cq)])
-
-    return args
+    flags = _EXTRA_ARGS_MAP.get(encoder)
+    if flags is None:
+        return []
+    return [*flags, str(quality_cq)]
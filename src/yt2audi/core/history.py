@@ -1,8 +1,15 @@
 """History tracking for completed video processing."""
 
+import hashlib
+import math
+import mmap
 import os
+import threading
+import weakref
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Set
+from types import TracebackType
+from typing import IO, Set
 
 import structlog
 
@@ -10,6 +17,60 @@ from yt2audi.config import get_config_dir
 
 logger = structlog.get_logger(__name__)
 
+# Bloom filter sizing: ~300 KB covers 100k IDs at a 1-in-100k false positive rate
+_BLOOM_CAPACITY = 100_000
+_BLOOM_ERROR_RATE = 1e-5
+
+# Completed IDs are buffered and written in one call once this many are pending,
+# or this many seconds after the first one (a crash loses at most that window,
+# which only means re-downloading those videos)
+_FLUSH_EVERY = 64
+_FLUSH_INTERVAL = 2.0
+
+
+def _flush_and_close(fh: IO[str], pending: list[str]) -> None:
+    """Write out pending IDs, sync the file to disk and close it."""
+    try:
+        if pending:
+            fh.write("".join(pending))
+            pending.clear()
+        fh.flush()
+        os.fsync(fh.fileno())
+    finally:
+        fh.close()
+
+
+class _BloomFilter:
+    """Fixed-size Bloom filter over byte strings (no false negatives)."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        """Initialize an empty filter.
+
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false positive rate at capacity
+        """
+        self._size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._hash_count = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def _positions(self, item: bytes) -> Iterator[int]:
+        """Yield the bit positions for an item (double hashing over one digest)."""
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self._hash_count):
+            yield (h1 + i * h2) % self._size
+
+    def add(self, item: bytes) -> None:
+        """Add an item to the filter."""
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: bytes) -> bool:
+        """Return False if the item was never added, True if it probably was."""
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
 
 class HistoryManager:
     """Tracks successfully processed videos to avoid re-processing."""
@@ -26,7 +87,21 @@ class HistoryManager:
         else:
             self.history_file = history_file
 
+        # Every ID on disk goes into the Bloom filter; the exact IDs are only
+        # held once a lookup hits the filter, so runs that never repeat a
+        # video keep memory small for large histories
+        self._bloom = _BloomFilter(_BLOOM_CAPACITY, _BLOOM_ERROR_RATE)
         self._processed_ids: Set[str] = set()
+        # Exact IDs from disk, read on the first Bloom filter hit (see _file_contains)
+        self._file_ids: frozenset[bytes] | None = None
+        # Append handle kept open across writes (opened on first write)
+        self._fh: IO[str] | None = None
+        self._fh_finalizer: weakref.finalize[[IO[str], list[str]], HistoryManager] | None = None
+        # Lines not yet written, flushed in batches (see _FLUSH_EVERY)
+        self._pending: list[str] = []
+        self._flush_timer: threading.Timer | None = None
+        # Pipeline tasks mark completions concurrently
+        self._lock = threading.Lock()
         self._load_history()
 
     def _load_history(self) -> None:
@@ -35,20 +110,109 @@ class HistoryManager:
             return
 
         try:
-            with open(self.history_file, "r", encoding="utf-8") as f:
-                self._processed_ids = {line.strip() for line in f if line.strip()}
-            logger.debug("history_loaded", entries=len(self._processed_ids))
+            video_ids = self._read_ids()
+            for video_id in video_ids:
+                self._bloom.add(video_id)
+            logger.debug("history_loaded", entries=len(video_ids))
         except Exception as e:
             logger.warning("history_load_failed", error=str(e))
 
-    def _save_id(self, video_id: str) -> None:
-        """Append a single ID to history disk file."""
+    def _read_ids(self) -> list[bytes]:
+        """Read all IDs from the history file as bytes.
+
+        The file is memory-mapped and split in one call rather than decoded
+        line by line; splitting on whitespace also drops blank lines and CRs.
+
+        Returns:
+            IDs in file order (may contain duplicates)
+        """
+        with open(self.history_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []  # mmap cannot map an empty file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm[:].split()
+
+    def _file_contains(self, video_id: str) -> bool:
+        """Check the history file itself for an ID (authoritative).
+
+        The file is scanned once, on the first Bloom filter hit, into an exact
+        ID set that later hits reuse; IDs written after that are already in
+        _processed_ids.
+        """
+        if self._file_ids is None:
+            try:
+                self._file_ids = frozenset(self._read_ids())
+            except FileNotFoundError:
+                self._file_ids = frozenset()
+            except Exception as e:
+                logger.warning("history_scan_failed", id=video_id, error=str(e))
+                return False
+        return video_id.encode("utf-8") in self._file_ids
+
+    def _open_file(self) -> IO[str]:
+        """Open the history file for appending; caller must hold the lock.
+
+        Returns:
+            The new append handle (also stored as self._fh)
+        """
+        self.history_file.parent.mkdir(parents=True, exist_ok=True)
+        fh = open(self.history_file, "a", encoding="utf-8")
+        self._fh = fh
+        # Flush, sync and close at exit or when the manager is garbage collected
+        self._fh_finalizer = weakref.finalize(self, _flush_and_close, fh, self._pending)
+        return fh
+
+    def _flush_locked(self) -> None:
+        """Write all pending IDs in a single call; caller must hold the lock."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending:
+            return
         try:
-            self.history_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.history_file, "a", encoding="utf-8") as f:
-                f.write(f"{video_id}\n")
+            fh = self._fh if self._fh is not None else self._open_file()
+            fh.write("".join(self._pending))
+            fh.flush()
         except Exception as e:
-            logger.error("history_save_failed", id=video_id, error=str(e))
+            logger.error("history_save_failed", count=len(self._pending), error=str(e))
+        self._pending.clear()
+
+    def flush(self) -> None:
+        """Write buffered IDs to the history file."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Flush buffered IDs, sync the file to disk and close it (reopened on the next write)."""
+        with self._lock:
+            self._flush_locked()
+            self._close_file()
+
+    def _close_file(self) -> None:
+        """Close the history file handle; caller must hold the lock."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._fh_finalizer is not None:
+            try:
+                self._fh_finalizer()
+            except Exception as e:
+                logger.warning("history_close_failed", error=str(e))
+            self._fh_finalizer = None
+        self._fh = None
+
+    def __enter__(self) -> "HistoryManager":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the history file on exit."""
+        self.close()
 
     def is_processed(self, video_id: str) -> bool:
         """Check if a video ID has been successfully processed.
@@ -58,23 +222,57 @@ class HistoryManager:
 
         Returns:
             True if processed, False otherwise.
+
+        Unseen IDs, the common case, are rejected by the Bloom filter without
+        touching disk; filter hits are confirmed against the history file once.
         """
-        return video_id in self._processed_ids
+        if video_id in self._processed_ids:
+            return True
+        if video_id.encode("utf-8") not in self._bloom:
+            return False
+        if self._file_contains(video_id):
+            self._processed_ids.add(video_id)
+            return True
+        return False
 
     def mark_completed(self, video_id: str) -> None:
         """Mark a video as successfully processed.
 
+        The ID counts as processed immediately; the write to disk is batched
+        and happens within _FLUSH_INTERVAL seconds, or on flush()/close().
+
         Args:
             video_id: YouTube video ID.
         """
-        if video_id not in self._processed_ids:
+        with self._lock:
+            if self.is_processed(video_id):
+                return
             self._processed_ids.add(video_id)
-            self._save_id(video_id)
-            logger.info("history_updated", id=video_id)
+            self._bloom.add(video_id.encode("utf-8"))
+            if self._fh is None:
+                # Open now so the exit finalizer covers IDs still in the buffer
+                try:
+                    self._open_file()
+                except Exception as e:
+                    logger.error("history_save_failed", id=video_id, error=str(e))
+            self._pending.append(f"{video_id}\n")
+            if len(self._pending) >= _FLUSH_EVERY:
+                self._flush_locked()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(_FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        logger.info("history_updated", id=video_id)
 
     def clear(self) -> None:
         """Clear the entire history."""
-        self._processed_ids.clear()
+        with self._lock:
+            self._processed_ids.clear()
+            self._file_ids = frozenset()
+            self._bloom = _BloomFilter(_BLOOM_CAPACITY, _BLOOM_ERROR_RATE)
+            self._pending.clear()
+            # Close first so the file can be removed on Windows too
+            self._close_file()
         if self.history_file.exists():
             try:
                 self.history_file.unlink()
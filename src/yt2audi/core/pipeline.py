@@ -1,6 +1,7 @@
 """Concurrent processing pipeline for YT2Audi."""
 
 import asyncio
+import functools
 from pathlib import Path
 from typing import Any, Callable, Optional
 
@@ -10,18 +11,23 @@ from yt2audi.core.converter import Converter
 from yt2audi.core.downloader import Downloader
 from yt2audi.core.history import HistoryManager
 from yt2audi.core.splitter import Splitter
+from yt2audi.exceptions import ConversionError
 from yt2audi.models.profile import Profile
 from yt2audi.transfer import USBManager
+from yt2audi.utils import extract_video_id, find_thumbnail
 
 logger = structlog.get_logger(__name__)
 
+# Extra hand-off slots between stages beyond the next stage's worker count
+_QUEUE_SLACK = 4
+
 
 class ProcessingPipeline:
     """Manages concurrent download and conversion tasks using an async pipeline.
     
     This pipeline allows for:
-    1. Multiple concurrent downloads (limited by semaphore)
-    2. Multiple concurrent conversions (limited by semaphore)
+    1. Multiple concurrent downloads (limited by worker count / semaphore)
+    2. Multiple concurrent conversions (limited by worker count / semaphore)
     3. Pipelining: Conversion of video A can happen while video B is downloading
     """
 
@@ -39,9 +45,14 @@ class ProcessingPipeline:
             max_concurrent_conversions: Cap on simultaneous conversions (usually lower to save CPU/GPU)
         """
         self.profile = profile
-        self.downloader = Downloader(profile)
+        # Prechecks (metadata extraction) share the downloader's thread pool with
+        # downloads; one spare thread keeps them from queueing behind downloads
+        self.downloader = Downloader(profile, max_workers=max_concurrent_downloads + 1)
         self.converter = Converter(profile)
         self.history = HistoryManager()
+        self.max_concurrent_downloads = max_concurrent_downloads
+        self.max_concurrent_conversions = max_concurrent_conversions
+        # Bound standalone process_one calls; run_batch bounds stages by worker count
         self.download_semaphore = asyncio.Semaphore(max_concurrent_downloads)
         self.convert_semaphore = asyncio.Semaphore(max_concurrent_conversions)
         
@@ -51,6 +62,11 @@ class ProcessingPipeline:
             max_conversions=max_concurrent_conversions
         )
 
+    def close(self) -> None:
+        """Release downloader worker threads, yt-dlp sessions and the history file."""
+        self.downloader.close()
+        self.history.close()
+
     async def process_one(
         self,
         url: str,
@@ -70,21 +86,45 @@ class ProcessingPipeline:
         Raises:
             Exception: Re-raises any error from download or conversion
         """
-        # --- Stage 0: Check if already exists in history or filesystem ---
+        skipped, info_dict = await self._precheck(url, output_dir, progress_callback)
+        if skipped is not None:
+            return skipped
+
+        async with self.download_semaphore:
+            downloaded_path, info_dict = await self._download(url, info_dict, progress_callback)
+
+        async with self.convert_semaphore:
+            converted_path = await self._convert(
+                url, downloaded_path, info_dict, output_dir, progress_callback
+            )
+
+        return await self._finalize(url, converted_path, info_dict, output_dir, progress_callback)
+
+    async def _precheck(
+        self,
+        url: str,
+        output_dir: Path,
+        progress_callback: Optional[Callable[[str, float, str], None]],
+    ) -> tuple[list[Path] | None, dict[str, Any] | None]:
+        """Stage 0: Check if the video already exists in history or on disk.
+
+        Returns:
+            Tuple of (output paths if the video can be skipped else None, info_dict or None)
+        """
         try:
             info_dict = await self.downloader.extract_info_async(url)
             video_id = info_dict.get("id")
+            expected_path = self.converter.get_output_path(info_dict, output_dir)
             
             # 1. Check persistent history
             if video_id and self.history.is_processed(video_id):
                 logger.info("pipeline_skip_history", url=url, id=video_id)
                 if progress_callback:
                     progress_callback(url, 100, "Already in history")
-                # Even if in history, try to return the path if we can predict it
-                return [self.converter.get_output_path(info_dict, output_dir)]
+                # Even if in history, return the predicted path
+                return [expected_path], info_dict
 
             # 2. Check filesystem
-            expected_path = self.converter.get_output_path(info_dict, output_dir)
             if expected_path.exists():
                 logger.info("pipeline_skip_existing", url=url, path=str(expected_path))
                 if progress_callback:
@@ -92,93 +132,128 @@ class ProcessingPipeline:
                 # Mark as completed in history if it's already on disk but not in history
                 if video_id:
                     self.history.mark_completed(video_id)
-                return [expected_path]
+                return [expected_path], info_dict
         except Exception as e:
             logger.debug("pipeline_precheck_failed", url=url, error=str(e))
-            info_dict = None
+            return None, None
 
-        # --- Stage 1: Download ---
-        async with self.download_semaphore:
-            logger.info("pipeline_stage_download", url=url)
-            
-            def _dl_hook(d: dict[str, Any]) -> None:
-                if progress_callback and d.get("status") == "downloading":
-                    downloaded = d.get("downloaded_bytes", 0)
-                    total = d.get("total_bytes") or d.get("total_bytes_estimate", 0)
-                    if total > 0:
-                        # Scale download to 0-50%
-                        percent = (downloaded / total) * 50
-                        progress_callback(url, percent, "Downloading")
-
-            try:
-                # If we have info_dict already, it's good, but downloader re-checks
-                downloaded_path, info_dict = await self.downloader.download_video_async(
-                    url, progress_callback=_dl_hook
-                )
-            except Exception as e:
-                logger.error("pipeline_download_failed", url=url, error=str(e))
-                if progress_callback:
-                    progress_callback(url, 0, f"Download Failed: {e}")
-                raise
+        return None, info_dict
+
+    async def _download(
+        self,
+        url: str,
+        info_dict: dict[str, Any] | None,
+        progress_callback: Optional[Callable[[str, float, str], None]],
+    ) -> tuple[Path, dict[str, Any]]:
+        """Stage 1: Download the video (callers bound concurrency).
+
+        The pre-check's info_dict is handed to the downloader so yt-dlp does
+        not fetch the same metadata a second time; the downloader only uses it
+        if it was extracted live rather than served from the metadata cache.
+        """
+        logger.info("pipeline_stage_download", url=url)
+        
+        def _dl_hook(d: dict[str, Any]) -> None:
+            if progress_callback and d.get("status") == "downloading":
+                downloaded = d.get("downloaded_bytes", 0)
+                total = d.get("total_bytes") or d.get("total_bytes_estimate", 0)
+                if total > 0:
+                    # Scale download to 0-50%
+                    percent = (downloaded / total) * 50
+                    progress_callback(url, percent, "Downloading")
 
-        # --- Stage 2: Conversion ---
+        try:
+            return await self.downloader.download_video_async(
+                url, progress_callback=_dl_hook, info_dict=info_dict
+            )
+        except Exception as e:
+            logger.error("pipeline_download_failed", url=url, error=str(e))
+            if progress_callback:
+                progress_callback(url, 0, f"Download Failed: {e}")
+            raise
+
+    async def _convert(
+        self,
+        url: str,
+        downloaded_path: Path,
+        info_dict: dict[str, Any] | None,
+        output_dir: Path,
+        progress_callback: Optional[Callable[[str, float, str], None]],
+    ) -> Path:
+        """Stage 2: Convert the downloaded video (callers bound concurrency)."""
         # Find thumbnail if downloaded (usually in same temp dir)
-        thumbnail_path = None
-        if downloaded_path:
-            potential_thumbnail = downloaded_path.with_suffix(".jpg")
-            if potential_thumbnail.exists():
-                thumbnail_path = potential_thumbnail
+        thumbnail_path = find_thumbnail(downloaded_path) if downloaded_path else None
 
         conversion_success = False
-        async with self.convert_semaphore:
-            logger.info("pipeline_stage_conversion", url=url, path=str(downloaded_path))
+        logger.info("pipeline_stage_conversion", url=url, path=str(downloaded_path))
+        
+        def _cv_hook(percent: float, stage: str) -> None:
+            if progress_callback:
+                # Scale conversion to 50-100%
+                scaled_percent = 50 + (percent * 0.5)
+                progress_callback(url, scaled_percent, stage)
+
+        try:
+            converted_path = await self.converter.convert_video_async(
+                downloaded_path, 
+                output_dir=output_dir, 
+                progress_callback=_cv_hook,
+                info_dict=info_dict,
+                thumbnail_path=thumbnail_path
+            )
+            conversion_success = True
+            return converted_path
+        except Exception as e:
+            logger.error("pipeline_conversion_failed", url=url, error=str(e))
+            if progress_callback:
+                progress_callback(url, 0, f"Conversion Failed: {e}")
+            raise
+        finally:
+            # ONLY cleanup temporary downloaded files if conversion succeeded
+            # This allows resuming conversion if it failed previously
+            if conversion_success and downloaded_path.exists():
+                try:
+                    downloaded_path.unlink()
+                except Exception:
+                    pass
             
-            def _cv_hook(percent: float, stage: str) -> None:
-                if progress_callback:
-                    # Scale conversion to 50-100%
-                    scaled_percent = 50 + (percent * 0.5)
-                    progress_callback(url, scaled_percent, stage)
-
-            try:
-                converted_path = await self.converter.convert_video_async(
-                    downloaded_path, 
-                    output_dir=output_dir, 
-                    progress_callback=_cv_hook,
-                    info_dict=info_dict,
-                    thumbnail_path=thumbnail_path
-                )
-                conversion_success = True
-            except Exception as e:
-                logger.error("pipeline_conversion_failed", url=url, error=str(e))
-                if progress_callback:
-                    progress_callback(url, 0, f"Conversion Failed: {e}")
-                raise
-            finally:
-                # ONLY cleanup temporary downloaded files if conversion succeeded
-                # This allows resuming conversion if it failed previously
-                if conversion_success and downloaded_path.exists():
-                    try:
-                        downloaded_path.unlink()
-                    except Exception:
-                        pass
-                
-                if conversion_success and thumbnail_path and thumbnail_path.exists():
-                    try:
-                        thumbnail_path.unlink()
-                    except Exception:
-                        pass
+            if conversion_success and thumbnail_path and thumbnail_path.exists():
+                try:
+                    thumbnail_path.unlink()
+                except Exception:
+                    pass
 
-        # --- Stage 3: Split & Finalize ---
-        logger.info("pipeline_stage_finalize", url=url, path=str(converted_path))
-        if progress_callback:
-            progress_callback(url, 95, "Finalizing")
+    async def _finalize(
+        self,
+        url: str,
+        converted_path: Path,
+        info_dict: dict[str, Any] | None,
+        output_dir: Path,
+        progress_callback: Optional[Callable[[str, float, str], None]],
+        final_paths: list[Path] | None = None,
+    ) -> list[Path]:
+        """Stages 3-4: Split oversized output, copy to USB and record history.
 
-        final_paths = Splitter.handle_size_exceed(
-            converted_path,
-            self.profile.output.max_file_size_gb,
-            self.profile.output.on_size_exceed,
-            output_dir,
-        )
+        final_paths, when given, is the already size-handled output (see
+        _handle_sizes) and stage 3 is skipped.
+        """
+        loop = asyncio.get_running_loop()
+        if final_paths is None:
+            # --- Stage 3: Split & Finalize ---
+            logger.info("pipeline_stage_finalize", url=url, path=str(converted_path))
+            if progress_callback:
+                progress_callback(url, 95, "Finalizing")
+
+            # Splitting/compressing runs ffmpeg and waits on it; keep it off the event loop
+            final_paths = await loop.run_in_executor(
+                None,
+                Splitter.handle_size_exceed,
+                converted_path,
+                self.profile.output.max_file_size_gb,
+                self.profile.output.on_size_exceed,
+                output_dir,
+                self.converter.encoder,
+            )
 
         # --- Stage 4: Transfer (USB) ---
         if self.profile.transfer.usb_auto_copy:
@@ -188,7 +263,6 @@ class ProcessingPipeline:
             
             usb_root = USBManager.find_best_drive(self.profile.transfer.usb_mount_path)
             if usb_root:
-                loop = asyncio.get_running_loop()
                 try:
                     # Run blocking copy in executor
                     final_paths = await loop.run_in_executor(
@@ -209,11 +283,48 @@ class ProcessingPipeline:
             progress_callback(url, 100, "Complete")
             
         # Record successful completion in history
-        if "info_dict" in locals() and info_dict and info_dict.get("id"):
+        if info_dict and info_dict.get("id"):
             self.history.mark_completed(info_dict["id"])
 
         return final_paths
 
+    async def _handle_sizes(
+        self,
+        items: list[tuple[str, Path, dict[str, Any] | None]],
+        output_dir: Path,
+        progress_callback: Optional[Callable[[str, float, str], None]],
+    ) -> dict[Path, list[Path]]:
+        """Stage 3 for several converted videos at once.
+
+        Runs Splitter.handle_many, so up to max_concurrent_conversions ffmpeg
+        processes split or compress the group together.
+
+        Args:
+            items: (url, converted file, info dict) per video
+            output_dir: Target output directory
+            progress_callback: Optional callback(url, percent, stage)
+
+        Returns:
+            Final paths per converted file, for files handled successfully
+        """
+        for url, converted_path, _ in items:
+            logger.info("pipeline_stage_finalize", url=url, path=str(converted_path))
+            if progress_callback:
+                progress_callback(url, 95, "Finalizing")
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                Splitter.handle_many,
+                [(converted_path, self.profile.output.on_size_exceed) for _, converted_path, _ in items],
+                self.profile.output.max_file_size_gb,
+                output_dir,
+                max_workers=self.max_concurrent_conversions,
+                encoder=self.converter.encoder,
+            ),
+        )
+
     async def run_batch(
         self,
         urls: list[str],
@@ -222,26 +333,152 @@ class ProcessingPipeline:
     ) -> dict[str, list[Path]]:
         """Run a batch of videos through the concurrent pipeline.
 
+        Downloads, conversions and finalization run as separate worker pools
+        connected by queues, so the encoder picks up each finished download
+        while later downloads continue, regardless of network jitter. The
+        hand-off queues are bounded, so when conversion falls behind, downloads
+        pause instead of piling up files in the temp directory; in-flight work
+        stays proportional to the worker counts, not the batch size. Videos
+        that finish converting while the finalizer is busy are finalized
+        together, with their splits/compressions running in parallel.
+
         Args:
             urls: List of YouTube URLs
             output_dir: Target output directory
             progress_callback: Optional callback(url, percent, stage)
 
         Returns:
-            Dictionary mapping URL to list of generated file paths
+            Dictionary mapping URL to list of generated file paths (empty for
+            videos skipped via history whose metadata is not cached)
         """
         logger.info("pipeline_batch_started", count=len(urls))
-        
-        tasks = [self.process_one(url, output_dir, progress_callback) for url in urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        final_results = {}
-        for url, res in zip(urls, results):
-            if isinstance(res, Exception):
-                logger.error("pipeline_item_failed", url=url, error=str(res))
+        final_results: dict[str, list[Path]] = {}
+
+        # Drop duplicate URLs (keeping order) and videos already in history,
+        # decided from the URL alone so no metadata is fetched for them
+        new_urls: list[str] = []
+        for url in dict.fromkeys(urls):
+            video_id = extract_video_id(url)
+            if video_id and self.history.is_processed(video_id):
+                logger.info("pipeline_skip_history", url=url, id=video_id)
+                if progress_callback:
+                    progress_callback(url, 100, "Already in history")
+                cached_info = self.downloader.cache.get(url)
+                final_results[url] = (
+                    [self.converter.get_output_path(cached_info, output_dir)] if cached_info else []
+                )
             else:
-                final_results[url] = res
-                
+                new_urls.append(url)
+
+        # Queue items carry the URL plus the previous stage's output; None stops a worker
+        dl_queue: asyncio.Queue[str | None] = asyncio.Queue()
+        cv_queue: asyncio.Queue[tuple[str, Path, dict[str, Any] | None] | None] = asyncio.Queue(
+            maxsize=self.max_concurrent_conversions + _QUEUE_SLACK
+        )
+        fin_queue: asyncio.Queue[tuple[str, Path, dict[str, Any] | None] | None] = asyncio.Queue(
+            maxsize=1 + _QUEUE_SLACK
+        )
+
+        def _record_failure(url: str, error: Exception) -> None:
+            logger.error("pipeline_item_failed", url=url, error=str(error))
+
+        async def _download_worker() -> None:
+            while (url := await dl_queue.get()) is not None:
+                try:
+                    skipped, info_dict = await self._precheck(url, output_dir, progress_callback)
+                    if skipped is not None:
+                        final_results[url] = skipped
+                        continue
+                    downloaded_path, info_dict = await self._download(
+                        url, info_dict, progress_callback
+                    )
+                    await cv_queue.put((url, downloaded_path, info_dict))
+                except Exception as e:
+                    _record_failure(url, e)
+
+        async def _convert_worker() -> None:
+            while (item := await cv_queue.get()) is not None:
+                url, downloaded_path, info_dict = item
+                try:
+                    converted_path = await self._convert(
+                        url, downloaded_path, info_dict, output_dir, progress_callback
+                    )
+                    await fin_queue.put((url, converted_path, info_dict))
+                except Exception as e:
+                    _record_failure(url, e)
+
+        async def _finalize_worker() -> None:
+            stop = False
+            while not stop:
+                # Take everything converted so far, so size handling of several
+                # videos overlaps (see _handle_sizes); USB copies stay sequential
+                batch: list[tuple[str, Path, dict[str, Any] | None]] = []
+                item = await fin_queue.get()
+                while item is not None:
+                    batch.append(item)
+                    if fin_queue.empty():
+                        break
+                    item = fin_queue.get_nowait()
+                stop = item is None
+
+                handled: dict[Path, list[Path]] = {}
+                if len(batch) > 1:
+                    try:
+                        handled = await self._handle_sizes(batch, output_dir, progress_callback)
+                    except Exception as e:
+                        logger.error("pipeline_size_handling_failed", count=len(batch), error=str(e))
+
+                for url, converted_path, info_dict in batch:
+                    try:
+                        if len(batch) == 1:
+                            final_paths = None  # Size handling done by _finalize
+                        elif converted_path in handled:
+                            final_paths = handled[converted_path]
+                        else:
+                            raise ConversionError(f"Size handling failed for {converted_path.name}")
+                        final_results[url] = await self._finalize(
+                            url,
+                            converted_path,
+                            info_dict,
+                            output_dir,
+                            progress_callback,
+                            final_paths=final_paths,
+                        )
+                    except Exception as e:
+                        _record_failure(url, e)
+                        # Download and convert report their own failures as they happen
+                        if progress_callback:
+                            progress_callback(url, 0, f"Finalize Failed: {e}")
+
+        for url in new_urls:
+            dl_queue.put_nowait(url)
+
+        # The task group cancels every worker if run_batch itself is cancelled
+        # or a worker dies unexpectedly; per-URL errors never leave a worker
+        async with asyncio.TaskGroup() as tg:
+            dl_workers = [
+                tg.create_task(_download_worker())
+                for _ in range(max(1, min(self.max_concurrent_downloads, len(new_urls))))
+            ]
+            cv_workers = [
+                tg.create_task(_convert_worker()) for _ in range(self.max_concurrent_conversions)
+            ]
+            # A single finalizer keeps USB copies sequential
+            fin_worker = tg.create_task(_finalize_worker())
+
+            # Shut stages down in order once the stage before them has drained
+            for _ in dl_workers:
+                dl_queue.put_nowait(None)
+            await asyncio.gather(*dl_workers)
+            for _ in cv_workers:
+                await cv_queue.put(None)
+            await asyncio.gather(*cv_workers)
+            await fin_queue.put(None)
+            await fin_worker
+
+        # Report in input order
+        final_results = {url: final_results[url] for url in urls if url in final_results}
+
         logger.info(
             "pipeline_batch_completed", 
             total=len(urls), 
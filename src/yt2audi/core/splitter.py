@@ -1,32 +1,370 @@
 """Video file splitter for FAT32 compatibility."""
 
+import functools
+import hashlib
+import json
+import os
 import subprocess
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import ClassVar
 
 import structlog
 
+from yt2audi.config import get_config_dir
+from yt2audi.core.gpu_detector import get_encoder_codec, get_encoder_preset, get_hwaccel_args
 from yt2audi.exceptions import ConversionError
-from yt2audi.models.profile import OnSizeExceed
+from yt2audi.models.profile import EncoderType, OnSizeExceed
+from yt2audi.utils.logging import Lazy
 
 logger = structlog.get_logger(__name__)
 
+# Lines of ffmpeg stderr kept for error messages
+_STDERR_TAIL_LINES = 200
+
+# Headroom left under the size cap for the moov index and packet interleaving
+_FS_SAFETY_BYTES = 8 * 1024**2
+
+# Container bytes per packet (index entries, chunk headers) budgeted on top
+# of the payload when planning size-based cuts
+_PACKET_OVERHEAD_BYTES = 32
+
+# Tolerance for matching planned cut times to keyframe pts (ffprobe prints
+# times rounded to microseconds)
+_CUT_TIME_DELTA = 0.001
+
+# Only try a stream-copy remux before compressing when the input is at most
+# this much over target; container overhead never accounts for more
+_REMUX_MAX_OVERSHOOT = 1.10
+
+# Containers that support moving the moov atom to the front
+_FASTSTART_SUFFIXES = frozenset({".mp4", ".m4v", ".mov"})
+
+
+def _probe_cache_dir() -> Path:
+    """Directory holding one cached ffprobe result per probed file."""
+    return get_config_dir() / "cache" / "ffprobe"
+
+
+def _drop_page_cache(path: Path) -> None:
+    """Tell the kernel a file's cached pages won't be needed again.
+
+    A split or compression streams the whole input through the page cache
+    once; dropping it afterwards leaves that memory for the next job. Only
+    available where os.posix_fadvise exists (not on Windows or macOS).
+
+    Args:
+        path: File that was just read in full
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.debug("fadvise_failed", path=str(path), error=str(e))
+
+
+def _run_ffmpeg(
+    cmd: list[str],
+    timeout: float,
+    on_stdout_line: Callable[[str], None] | None = None,
+) -> None:
+    """Run an ffmpeg (or ffprobe) command, keeping only the tail of its stderr in memory.
+
+    Args:
+        cmd: Command line
+        timeout: Seconds before the process is killed
+        on_stdout_line: If given, called with each stdout line as it arrives
+            (otherwise stdout is discarded)
+
+    Raises:
+        subprocess.CalledProcessError: On a nonzero exit (stderr holds the tail)
+        subprocess.TimeoutExpired: If the process runs longer than timeout
+    """
+    tail: deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL if on_stdout_line is None else subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    )
+
+    stderr = proc.stderr
+    assert stderr is not None
+
+    # Drain pipes on threads so a chatty ffmpeg never blocks on a full pipe
+    readers = [threading.Thread(target=tail.extend, args=(stderr,), daemon=True)]
+    if on_stdout_line is not None:
+        stdout = proc.stdout
+        assert stdout is not None
+        on_line = on_stdout_line  # Non-Optional for the reader thread
+
+        def _read_stdout() -> None:
+            for line in stdout:
+                on_line(line)
+
+        readers.append(threading.Thread(target=_read_stdout, daemon=True))
+    for reader in readers:
+        reader.start()
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        for reader in readers:
+            reader.join()
+        stderr.close()
+        if proc.stdout is not None:
+            proc.stdout.close()
+
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, stderr="".join(tail))
+
+
+@functools.cache
+def _compress_template(
+    encoder: EncoderType, suffix: str
+) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+    """Static parts of the compress command for an encoder and container.
+
+    Only the paths and bitrates change between calls, so the rest is built
+    once per (encoder, container) pair.
+
+    Args:
+        encoder: Video encoder
+        suffix: Lower-case output file extension
+
+    Returns:
+        (options before -i, encoder options, container options)
+    """
+    codec = get_encoder_codec(encoder)
+    encoder_args = [
+        "-threads",
+        "0",  # Let the encoder use every core
+        "-c:v",
+        codec,
+        "-preset",
+        get_encoder_preset(encoder),
+    ]
+    if codec == EncoderType.LIBX264.value:
+        encoder_args += ["-x264-params", "rc-lookahead=20"]
+    container_args = ("-movflags", "+faststart") if suffix in _FASTSTART_SUFFIXES else ()
+    return tuple(get_hwaccel_args(encoder)), tuple(encoder_args), container_args
+
+
+class _CutPlanner:
+    """Pick keyframe cut times that keep every part under a byte budget.
+
+    Fed ffprobe ``-of compact=p=0`` packet lines one at a time (so the listing
+    of a long video is never held in memory). Each part is grown packet by
+    packet; once it would exceed the budget, it is cut at the last video
+    keyframe inside it, so every part starts on a keyframe and no content
+    is duplicated or dropped between parts.
+    """
+
+    def __init__(self, max_part_bytes: int) -> None:
+        self.max_part_bytes = max_part_bytes
+        self.cuts: list[float] = []  # Keyframe pts, in the input's timeline
+        self.start_time = 0.0
+        self.oversize_gop = False  # A single GOP exceeds the budget
+        self._part_bytes = 0
+        self._key_time: float | None = None  # Latest cut candidate in this part
+        self._bytes_before_key = 0
+
+    def feed(self, line: str) -> None:
+        """Account for one line of the packet listing.
+
+        Args:
+            line: ``key=value|key=value`` line (packet or format section)
+        """
+        if self.oversize_gop:
+            return
+        fields = dict(field.partition("=")[::2] for field in line.strip().split("|"))
+        if "codec_type" not in fields:
+            # Format section: ffmpeg shifts output timestamps by the start time
+            try:
+                self.start_time = float(fields.get("start_time", ""))
+            except ValueError:
+                pass
+            return
+        try:
+            size = int(fields.get("size", ""))
+        except ValueError:
+            return
+
+        if self._part_bytes and fields["codec_type"] == "video" and "K" in fields.get("flags", ""):
+            try:
+                pts = float(fields.get("pts_time", ""))
+            except ValueError:
+                pts = None
+            if pts is not None and (not self.cuts or pts > self.cuts[-1]):
+                self._key_time = pts
+                self._bytes_before_key = self._part_bytes
+
+        self._part_bytes += size + _PACKET_OVERHEAD_BYTES
+        if self._part_bytes <= self.max_part_bytes:
+            return
+        if self._key_time is None:
+            self.oversize_gop = True
+            return
+        self.cuts.append(self._key_time)
+        self._part_bytes -= self._bytes_before_key
+        self._key_time = None
+        if self._part_bytes > self.max_part_bytes:
+            self.oversize_gop = True
+
+    def segment_times(self) -> list[float]:
+        """Cut times relative to the start of ffmpeg's output timeline."""
+        return [cut - self.start_time for cut in self.cuts]
+
+
+# (input_path, max_size_gb, output_dir, current_size_gb, input_stat, encoder) -> outputs;
+# every handler takes the full argument list and "_"-prefixes what it ignores
+_SizeHandler = Callable[
+    [Path, float, Path | None, float, os.stat_result | None, EncoderType], list[Path]
+]
+
 
 class Splitter:
     """Split videos into FAT32-compatible chunks."""
 
+    # OnSizeExceed action -> handler, filled in after the class body
+    _HANDLERS: ClassVar[dict[OnSizeExceed, _SizeHandler]]
+
     @staticmethod
-    def get_file_size_gb(path: Path) -> float:
+    def get_file_size_gb(path: Path, stat_result: os.stat_result | None = None) -> float:
         """Get file size in gigabytes.
 
         Args:
             path: File path
+            stat_result: Already fetched stat of path, to avoid another syscall
 
         Returns:
-            Size in GB
+            Size in GB (0.0 if the file does not exist)
         """
-        if not path.exists():
-            return 0.0
-        return path.stat().st_size / (1024**3)
+        if stat_result is None:
+            try:
+                stat_result = path.stat()
+            except FileNotFoundError:
+                return 0.0
+        return stat_result.st_size / (1024**3)
+
+    @staticmethod
+    def _probe(path: Path, stat_result: os.stat_result | None = None) -> dict[str, float]:
+        """Get duration and overall bitrate of a media file, cached on disk.
+
+        Results are stored per absolute path and reused while the file's size
+        and modification time are unchanged, so repeated splits or compressions
+        of the same file run ffprobe only once.
+
+        Args:
+            path: Media file to probe
+            stat_result: Already fetched stat of path
+
+        Returns:
+            Dict with "duration" (seconds) and "bitrate" (bits/s, 0 if unknown)
+
+        Raises:
+            subprocess.CalledProcessError: If ffprobe fails
+            subprocess.TimeoutExpired: If ffprobe does not finish in time
+        """
+        abs_path = str(path.resolve())
+        st = stat_result or path.stat()
+        cache_file = _probe_cache_dir() / f"{hashlib.sha1(abs_path.encode('utf-8')).hexdigest()}.json"
+
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if (
+                cached.get("path") == abs_path
+                and cached.get("size") == st.st_size
+                and cached.get("mtime_ns") == st.st_mtime_ns
+            ):
+                logger.debug("ffprobe_cache_hit", path=abs_path)
+                return {"duration": cached["duration"], "bitrate": cached["bitrate"]}
+        except (OSError, ValueError, KeyError):
+            pass  # Missing, stale or unreadable entry: probe again
+
+        probe_cmd = [
+            "ffprobe",
+            "-v",
+            "error",
+            "-print_format",
+            "json",
+            "-show_entries",
+            "format=duration,bit_rate",  # Only what is consumed below
+            str(path),
+        ]
+        probe_res = subprocess.run(
+            probe_cmd, capture_output=True, text=True, timeout=30, check=True
+        )
+        fmt = json.loads(probe_res.stdout).get("format", {})
+        result = {
+            "duration": float(fmt.get("duration") or 0),
+            "bitrate": float(fmt.get("bit_rate") or 0),
+        }
+
+        # Write to a temp file and swap it in, so readers never see a partial entry
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"path": abs_path, "size": st.st_size, "mtime_ns": st.st_mtime_ns, **result},
+                    f,
+                )
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.debug("ffprobe_cache_write_failed", path=abs_path, error=str(e))
+
+        return result
+
+    @staticmethod
+    def _segment_time(
+        input_path: Path, input_stat: os.stat_result, max_size_gb: float
+    ) -> float:
+        """Get the segment duration that keeps each part under max_size_gb.
+
+        FFmpeg's segment muxer doesn't support a size limit directly, so the
+        duration is derived from the (cached) probed bitrate.
+
+        Args:
+            input_path: Input video file
+            input_stat: Stat of input_path
+            max_size_gb: Maximum size per chunk in gigabytes
+
+        Returns:
+            Segment duration in seconds
+        """
+        # Convert GB to bytes for FFmpeg
+        max_size_bytes = int(max_size_gb * 1024**3)
+
+        probe_data = Splitter._probe(input_path, input_stat)
+        duration = probe_data["duration"]
+        bitrate = probe_data["bitrate"]
+
+        if bitrate <= 0:
+            # Fallback: estimate bitrate from file size
+            if duration > 0:
+                bitrate = (input_stat.st_size * 8) / duration
+            else:
+                bitrate = 1_000_000 # 1 Mbps fallback
+
+        # Target duration (s) = target size (bits) / bitrate (bits/s)
+        target_duration = (max_size_bytes * 8) / bitrate
+        # Use slightly less to be safe
+        return max(1.0, target_duration * 0.95)
 
     @staticmethod
     def split_video(
@@ -34,16 +372,22 @@ class Splitter:
         max_size_gb: float,
         output_dir: Path | None = None,
         part_template: str = "{stem}_part{num:03d}.{ext}",
+        input_stat: os.stat_result | None = None,
     ) -> list[Path]:
         """Split video into chunks under max_size_gb.
 
-        Uses FFmpeg segment muxer for seamless splitting without re-encoding.
+        Parts are stream-copied (no re-encoding) and cut at keyframes chosen
+        from the measured packet sizes, so every part fits regardless of
+        bitrate variation. If that fails (e.g. no video keyframes to cut at),
+        falls back to the segment muxer with a duration derived from the
+        average bitrate.
 
         Args:
             input_path: Input video file
             max_size_gb: Maximum size per chunk in gigabytes
             output_dir: Output directory (defaults to input file directory)
             part_template: Template for part filenames (uses format() with stem, num, ext)
+            input_stat: Already fetched stat of input_path (e.g. from handle_size_exceed)
 
         Returns:
             List of output chunk paths
@@ -51,10 +395,13 @@ class Splitter:
         Raises:
             ConversionError: If splitting fails
         """
-        if not input_path.exists():
-            raise ConversionError(f"Input file not found: {input_path}")
+        if input_stat is None:
+            try:
+                input_stat = input_path.stat()
+            except FileNotFoundError:
+                raise ConversionError(f"Input file not found: {input_path}") from None
 
-        current_size_gb = Splitter.get_file_size_gb(input_path)
+        current_size_gb = Splitter.get_file_size_gb(input_path, input_stat)
 
         if current_size_gb <= max_size_gb:
             logger.info(
@@ -68,9 +415,6 @@ class Splitter:
         output_dir = output_dir or input_path.parent
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Convert GB to bytes for FFmpeg
-        max_size_bytes = int(max_size_gb * 1024**3)
-
         # Build output pattern for FFmpeg segment muxer
         # FFmpeg expects %03d as a literal string (it will replace it with numbers)
         # Don't use the template's format spec here - build the pattern directly
@@ -87,72 +431,16 @@ class Splitter:
         )
 
         try:
-            # FFmpeg's segment muxer doesn't support -segment_size directly.
-            # We must calculate duration based on bitrate.
-            # Get duration and bitrate using ffprobe
-            probe_cmd = [
-                "ffprobe",
-                "-v",
-                "error",
-                "-show_entries",
-                "format=duration,bitrate",
-                "-of",
-                "default=noprint_wrappers=1",
-                str(input_path),
-            ]
-            probe_res = subprocess.run(probe_cmd, capture_output=True, text=True, check=True)
-            
-            # Parse output lines like "duration=19.133243"
-            probe_data = {}
-            for line in probe_res.stdout.strip().split("\n"):
-                if "=" in line:
-                    k, v = line.split("=", 1)
-                    probe_data[k.strip()] = v.strip()
-            
-            duration = float(probe_data.get("duration", 0))
-            bitrate = float(probe_data.get("bitrate", 0))
-
-            if bitrate <= 0:
-                # Fallback: estimate bitrate from file size
-                if duration > 0:
-                    bitrate = (input_path.stat().st_size * 8) / duration
-                else:
-                    bitrate = 1_000_000 # 1 Mbps fallback
-
-            # Target duration (s) = target size (bits) / bitrate (bits/s)
-            target_duration = (max_size_bytes * 8) / bitrate
-            # Use slightly less to be safe
-            target_duration = max(1.0, target_duration * 0.95)
-
-            cmd = [
-                "ffmpeg",
-                "-i",
-                str(input_path),
-                "-c",
-                "copy",
-                "-map",
-                "0",
-                "-f",
-                "segment",
-                "-segment_time",
-                str(target_duration),
-                "-reset_timestamps",
-                "1",
-                output_pattern,
-            ]
-
-            logger.debug("ffmpeg_split_command", cmd=" ".join(cmd))
+            try:
+                parts = Splitter._split_by_size(input_path, input_stat, max_size_gb, output_dir)
+            except subprocess.CalledProcessError as e:
+                logger.warning("split_by_size_failed", input=str(input_path), error=e.stderr)
+                parts = None
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=600,  # 10 minutes max
-                check=True,
-            )
-
-            # Find generated chunks
-            parts = sorted(output_dir.glob(f"{input_path.stem}_part*{input_path.suffix}"))
+            if parts is None:
+                parts = Splitter._split_by_time(
+                    input_path, input_stat, max_size_gb, output_dir, output_pattern
+                )
 
             if not parts:
                 raise ConversionError("Splitting completed but no output files found")
@@ -161,9 +449,10 @@ class Splitter:
                 "video_split_completed",
                 input=str(input_path),
                 parts_created=len(parts),
-                parts=[str(p) for p in parts],
+                parts=Lazy(lambda: [str(p) for p in parts]),
             )
 
+            _drop_page_cache(input_path)
             return parts
 
         except subprocess.CalledProcessError as e:
@@ -173,20 +462,431 @@ class Splitter:
             logger.error("split_error", input=str(input_path), error=str(e))
             raise ConversionError(f"Failed to split {input_path}: {e}") from e
 
+    @staticmethod
+    def _find_parts(input_path: Path, output_dir: Path) -> list[Path]:
+        """List the chunk files written for input_path, in order.
+
+        Equivalent to globbing ``{stem}_part*{suffix}`` but with plain string
+        checks on one scandir pass, so no pattern is compiled and no Path is
+        built for entries that don't match. Parts are ordered by their number,
+        so unpadded numbering (part10 after part9) sorts correctly too.
+
+        Args:
+            input_path: Input video file
+            output_dir: Directory the chunks were written to
+
+        Returns:
+            Sorted chunk paths
+        """
+        prefix = f"{input_path.stem}_part"
+        suffix = input_path.suffix
+        min_len = len(prefix) + len(suffix)
+        with os.scandir(output_dir) as entries:
+            names = [
+                entry.name
+                for entry in entries
+                if len(entry.name) >= min_len
+                and entry.name.startswith(prefix)
+                and entry.name.endswith(suffix)
+                and entry.is_file(follow_symlinks=False)
+            ]
+
+        def _part_key(name: str) -> tuple[int, int, str]:
+            number = name[len(prefix) : len(name) - len(suffix)]
+            if number.isdigit():
+                return (0, int(number), name)
+            return (1, 0, name)  # Unnumbered leftovers go last
+
+        names.sort(key=_part_key)
+        return [output_dir / name for name in names]
+
+    @staticmethod
+    def _split_by_size(
+        input_path: Path,
+        input_stat: os.stat_result,
+        max_size_gb: float,
+        output_dir: Path,
+    ) -> list[Path] | None:
+        """Split at measured keyframes so each part fits under the size cap.
+
+        One ffprobe pass lists every packet's size and the video keyframe
+        times; cut points are planned from those (see _CutPlanner) and the
+        segment muxer then stream-copies the input once, starting each part
+        exactly on a planned keyframe.
+
+        Args:
+            input_path: Input video file
+            input_stat: Stat of input_path
+            max_size_gb: Maximum size per chunk in gigabytes
+            output_dir: Output directory
+
+        Returns:
+            Chunk paths, or None if this strategy can't be used for the file
+            (e.g. no video keyframes, or a single GOP larger than the cap)
+
+        Raises:
+            subprocess.CalledProcessError: If ffprobe or ffmpeg fails (any parts
+                written are removed)
+        """
+        max_size_bytes = int(max_size_gb * 1024**3)
+        planner = _CutPlanner(max_size_bytes - min(_FS_SAFETY_BYTES, max_size_bytes // 20))
+
+        probe_cmd = [
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            "packet=codec_type,pts_time,size,flags:format=start_time",
+            "-of",
+            "compact=p=0",
+            str(input_path),
+        ]
+        _run_ffmpeg(probe_cmd, timeout=600, on_stdout_line=planner.feed)
+
+        if planner.oversize_gop or not planner.cuts:
+            logger.info(
+                "split_by_size_unavailable",
+                input=str(input_path),
+                reason="oversize_gop" if planner.oversize_gop else "no_keyframe_cuts",
+                size_bytes=input_stat.st_size,
+            )
+            return None
+
+        cmd = [
+            "ffmpeg",
+            "-i",
+            str(input_path),
+            "-c",
+            "copy",
+            "-map",
+            "0",
+            "-f",
+            "segment",
+            "-segment_times",
+            ",".join(f"{t:.6f}" for t in planner.segment_times()),
+            "-segment_time_delta",
+            str(_CUT_TIME_DELTA),
+            "-reset_timestamps",
+            "1",
+            "-y",
+            str(output_dir / f"{input_path.stem}_part%03d{input_path.suffix}"),
+        ]
+
+        logger.debug("ffmpeg_split_command", cmd=Lazy(lambda: " ".join(cmd)))
+
+        try:
+            _run_ffmpeg(cmd, timeout=600)  # 10 minutes max
+        except subprocess.CalledProcessError:
+            for written in Splitter._find_parts(input_path, output_dir):
+                written.unlink(missing_ok=True)
+            raise
+
+        return Splitter._find_parts(input_path, output_dir)
+
+    @staticmethod
+    def _split_by_time(
+        input_path: Path,
+        input_stat: os.stat_result,
+        max_size_gb: float,
+        output_dir: Path,
+        output_pattern: str,
+    ) -> list[Path]:
+        """Split with the segment muxer using a bitrate-derived segment time.
+
+        Args:
+            input_path: Input video file
+            input_stat: Stat of input_path
+            max_size_gb: Maximum size per chunk in gigabytes
+            output_dir: Output directory
+            output_pattern: Segment muxer output pattern (with %03d)
+
+        Returns:
+            Chunk paths found after ffmpeg finished (may be empty)
+
+        Raises:
+            subprocess.CalledProcessError: If ffmpeg fails
+        """
+        target_duration = Splitter._segment_time(input_path, input_stat, max_size_gb)
+
+        cmd = [
+            "ffmpeg",
+            "-i",
+            str(input_path),
+            "-c",
+            "copy",
+            "-map",
+            "0",
+            "-f",
+            "segment",
+            "-segment_time",
+            str(target_duration),
+            "-reset_timestamps",
+            "1",
+            output_pattern,
+        ]
+
+        logger.debug("ffmpeg_split_command", cmd=Lazy(lambda: " ".join(cmd)))
+
+        _run_ffmpeg(cmd, timeout=600)  # 10 minutes max
+
+        # Find generated chunks
+        return Splitter._find_parts(input_path, output_dir)
+
+    @staticmethod
+    def split_many(
+        paths: list[Path],
+        max_size_gb: float,
+        output_dir: Path | None = None,
+    ) -> dict[Path, list[Path]]:
+        """Split several videos with a single ffmpeg process.
+
+        Every oversize input gets its own -map/segment output in one command,
+        so process startup and codec initialisation are paid once per batch.
+        Falls back to split_video per file when fewer than two files need
+        splitting, when the inputs use different containers, or for any input
+        whose segments came out over the limit.
+
+        Args:
+            paths: Input video files
+            max_size_gb: Maximum size per chunk in gigabytes
+            output_dir: Output directory (defaults to each input's directory)
+
+        Returns:
+            Mapping of input file to its chunk paths, in input order (files
+            already under the limit map to themselves)
+
+        Raises:
+            ConversionError: If any input is missing or splitting fails
+        """
+        results: dict[Path, list[Path]] = {}
+        to_split: list[tuple[Path, os.stat_result, Path]] = []
+
+        for input_path in dict.fromkeys(paths):
+            try:
+                input_stat = input_path.stat()
+            except FileNotFoundError:
+                raise ConversionError(f"Input file not found: {input_path}") from None
+
+            size_gb = Splitter.get_file_size_gb(input_path, input_stat)
+            if size_gb <= max_size_gb:
+                logger.info(
+                    "split_not_needed",
+                    path=str(input_path),
+                    size_gb=size_gb,
+                    max_size_gb=max_size_gb,
+                )
+                results[input_path] = [input_path]
+                continue
+
+            results[input_path] = []  # Keep input order; filled in below
+            to_split.append((input_path, input_stat, output_dir or input_path.parent))
+
+        suffixes = {input_path.suffix.lower() for input_path, _, _ in to_split}
+        if len(to_split) < 2 or len(suffixes) > 1:
+            for input_path, input_stat, part_dir in to_split:
+                results[input_path] = Splitter.split_video(
+                    input_path, max_size_gb, output_dir=part_dir, input_stat=input_stat
+                )
+            return results
+
+        inputs: list[str] = []
+        outputs: list[str] = []
+        try:
+            for index, (input_path, input_stat, part_dir) in enumerate(to_split):
+                part_dir.mkdir(parents=True, exist_ok=True)
+                inputs += ["-i", str(input_path)]
+                outputs += [
+                    "-map",
+                    str(index),
+                    "-c",
+                    "copy",
+                    "-f",
+                    "segment",
+                    "-segment_time",
+                    str(Splitter._segment_time(input_path, input_stat, max_size_gb)),
+                    "-reset_timestamps",
+                    "1",
+                    str(part_dir / f"{input_path.stem}_part%03d{input_path.suffix}"),
+                ]
+
+            cmd = ["ffmpeg", *inputs, *outputs]
+
+            logger.info("splitting_videos", count=len(to_split), max_size_gb=max_size_gb)
+            logger.debug("ffmpeg_split_command", cmd=Lazy(lambda: " ".join(cmd)))
+
+            _run_ffmpeg(cmd, timeout=600 * len(to_split))  # 10 minutes max per file
+
+            max_size_bytes = int(max_size_gb * 1024**3)
+            for input_path, input_stat, part_dir in to_split:
+                parts = Splitter._find_parts(input_path, part_dir)
+                if not parts:
+                    raise ConversionError(
+                        f"Splitting completed but no output files found for {input_path}"
+                    )
+                # Time-based segments can overshoot on VBR content; redo those
+                # inputs with split_video's keyframe-cut strategy
+                if any(part.stat().st_size > max_size_bytes for part in parts):
+                    logger.warning(
+                        "batch_split_part_oversize", input=str(input_path), max_size_gb=max_size_gb
+                    )
+                    for part in parts:
+                        part.unlink(missing_ok=True)
+                    parts = Splitter.split_video(
+                        input_path, max_size_gb, output_dir=part_dir, input_stat=input_stat
+                    )
+                results[input_path] = parts
+
+        except subprocess.CalledProcessError as e:
+            logger.error("ffmpeg_split_failed", inputs=len(to_split), error=e.stderr)
+            raise ConversionError(f"FFmpeg splitting failed: {e.stderr}") from e
+        except ConversionError:
+            raise
+        except Exception as e:
+            logger.error("split_error", inputs=len(to_split), error=str(e))
+            raise ConversionError(f"Failed to split {len(to_split)} files: {e}") from e
+
+        logger.info(
+            "videos_split_completed",
+            inputs=len(to_split),
+            parts_created=sum(len(results[p]) for p, _, _ in to_split),
+        )
+        for input_path, _, _ in to_split:
+            _drop_page_cache(input_path)
+        return results
+
+    @staticmethod
+    def _remux_if_fits(
+        input_path: Path,
+        output_path: Path,
+        target_size_gb: float,
+        input_stat: os.stat_result,
+    ) -> bool:
+        """Try a stream-copy remux and keep it if it already fits the target.
+
+        Remuxing drops container overhead without any encoding, which is often
+        enough for files only slightly over the limit.
+
+        Args:
+            input_path: Input video file
+            output_path: Where to place the remuxed file on success
+            target_size_gb: Target size in gigabytes
+            input_stat: Stat of input_path
+
+        Returns:
+            True if output_path now holds a remux under target_size_gb
+        """
+        input_size_gb = Splitter.get_file_size_gb(input_path, input_stat)
+        if input_size_gb > target_size_gb * _REMUX_MAX_OVERSHOOT:
+            logger.info(
+                "compress_reencode_required",
+                input=str(input_path),
+                reason="too_large_for_remux",
+                input_size_gb=input_size_gb,
+                target_size_gb=target_size_gb,
+            )
+            return False
+
+        tmp_path = output_path.with_name(f"{output_path.stem}.remux{output_path.suffix}")
+        cmd = ["ffmpeg", "-i", str(input_path), "-c", "copy"]
+        if output_path.suffix.lower() in _FASTSTART_SUFFIXES:
+            cmd += ["-movflags", "+faststart"]
+        cmd += ["-y", str(tmp_path)]
+
+        logger.debug("ffmpeg_remux_command", cmd=Lazy(lambda: " ".join(cmd)))
+
+        remux_size_gb = 0.0
+        try:
+            _run_ffmpeg(cmd, timeout=600)
+            remux_size_gb = Splitter.get_file_size_gb(tmp_path)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            logger.warning("compress_remux_failed", input=str(input_path), error=str(e))
+
+        if 0 < remux_size_gb <= target_size_gb:
+            os.replace(tmp_path, output_path)
+            logger.info(
+                "compress_remux_succeeded",
+                input=str(input_path),
+                output=str(output_path),
+                input_size_gb=input_size_gb,
+                output_size_gb=remux_size_gb,
+                target_size_gb=target_size_gb,
+            )
+            return True
+
+        tmp_path.unlink(missing_ok=True)
+        logger.info(
+            "compress_reencode_required",
+            input=str(input_path),
+            reason="remux_too_large",
+            remux_size_gb=remux_size_gb,
+            target_size_gb=target_size_gb,
+        )
+        return False
+
+    @staticmethod
+    def _compress_command(
+        input_path: Path,
+        output_path: Path,
+        encoder: EncoderType,
+        video_bitrate_kbps: int,
+        audio_bitrate_kbps: int,
+    ) -> list[str]:
+        """Build the bitrate-targeted ffmpeg command for compress_to_size.
+
+        Args:
+            input_path: Input video file
+            output_path: Output path
+            encoder: Video encoder
+            video_bitrate_kbps: Target video bitrate
+            audio_bitrate_kbps: Target audio bitrate
+
+        Returns:
+            FFmpeg command line
+        """
+        input_args, encoder_args, container_args = _compress_template(
+            encoder, output_path.suffix.lower()
+        )
+        return [
+            "ffmpeg",
+            *input_args,
+            "-i",
+            str(input_path),
+            *encoder_args,
+            "-b:v",
+            f"{video_bitrate_kbps}k",
+            "-maxrate",
+            f"{video_bitrate_kbps}k",
+            "-bufsize",
+            f"{video_bitrate_kbps * 2}k",
+            "-b:a",
+            f"{audio_bitrate_kbps}k",
+            *container_args,
+            "-y",
+            str(output_path),
+        ]
+
     @staticmethod
     def compress_to_size(
         input_path: Path,
         target_size_gb: float,
         reduction_factor: float = 0.8,
         output_path: Path | None = None,
+        input_stat: os.stat_result | None = None,
+        encoder: EncoderType = EncoderType.LIBX264,
     ) -> Path:
         """Compress video to fit under target size by reducing bitrate.
 
+        Files only slightly over target are first remuxed with stream copy;
+        if that alone fits, the re-encode is skipped. A hardware encoder that
+        fails is retried once with libx264.
+
         Args:
             input_path: Input video file
             target_size_gb: Target size in gigabytes
             reduction_factor: Bitrate reduction factor (0.8 = 80% of calculated bitrate)
             output_path: Output path (defaults to input_compressed.ext)
+            input_stat: Already fetched stat of input_path (e.g. from handle_size_exceed)
+            encoder: Video encoder, usually the one the Converter selected
 
         Returns:
             Path to compressed video
@@ -194,8 +894,11 @@ class Splitter:
         Raises:
             ConversionError: If compression fails
         """
-        if not input_path.exists():
-            raise ConversionError(f"Input file not found: {input_path}")
+        if input_stat is None:
+            try:
+                input_stat = input_path.stat()
+            except FileNotFoundError:
+                raise ConversionError(f"Input file not found: {input_path}") from None
 
         if output_path is None:
             output_path = input_path.with_stem(f"{input_path.stem}_compressed")
@@ -208,27 +911,12 @@ class Splitter:
         )
 
         try:
-            # Get duration using ffprobe
-            probe_cmd = [
-                "ffprobe",
-                "-v",
-                "error",
-                "-show_entries",
-                "format=duration",
-                "-of",
-                "default=noprint_wrappers=1:nokey=1",
-                str(input_path),
-            ]
+            if Splitter._remux_if_fits(input_path, output_path, target_size_gb, input_stat):
+                return output_path
 
-            duration_result = subprocess.run(
-                probe_cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
-
-            duration = float(duration_result.stdout.strip())
+            duration = Splitter._probe(input_path, input_stat)["duration"]
+            if duration <= 0:
+                raise ConversionError(f"Could not determine duration of {input_path}")
 
             # Calculate target bitrate
             # Size (bytes) = bitrate (bits/s) * duration (s) / 8
@@ -249,47 +937,50 @@ class Splitter:
             )
 
             # Compress with calculated bitrate
-            cmd = [
-                "ffmpeg",
-                "-i",
-                str(input_path),
-                "-b:v",
-                f"{video_bitrate_kbps}k",
-                "-maxrate",
-                f"{video_bitrate_kbps}k",
-                "-bufsize",
-                f"{video_bitrate_kbps * 2}k",
-                "-b:a",
-                f"{audio_bitrate_kbps}k",
-                "-y",
-                str(output_path),
-            ]
+            cmd = Splitter._compress_command(
+                input_path, output_path, encoder, video_bitrate_kbps, audio_bitrate_kbps
+            )
 
-            logger.debug("ffmpeg_compress_command", cmd=" ".join(cmd))
+            logger.debug("ffmpeg_compress_command", cmd=Lazy(lambda: " ".join(cmd)))
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=3600,  # 1 hour max
-                check=True,
-            )
+            try:
+                _run_ffmpeg(cmd, timeout=3600)  # 1 hour max
+            except subprocess.CalledProcessError as e:
+                if get_encoder_codec(encoder) == EncoderType.LIBX264.value:
+                    raise
+                logger.warning(
+                    "compress_encoder_failed",
+                    encoder=encoder.value,
+                    fallback=EncoderType.LIBX264.value,
+                    error=e.stderr,
+                )
+                cmd = Splitter._compress_command(
+                    input_path,
+                    output_path,
+                    EncoderType.LIBX264,
+                    video_bitrate_kbps,
+                    audio_bitrate_kbps,
+                )
+                _run_ffmpeg(cmd, timeout=3600)
 
-            if not output_path.exists():
-                raise ConversionError("Compression completed but output file not found")
+            try:
+                output_stat = output_path.stat()
+            except FileNotFoundError:
+                raise ConversionError("Compression completed but output file not found") from None
 
-            output_size_gb = Splitter.get_file_size_gb(output_path)
+            output_size_gb = Splitter.get_file_size_gb(output_path, output_stat)
 
             logger.info(
                 "video_compressed",
                 input=str(input_path),
                 output=str(output_path),
-                input_size_gb=Splitter.get_file_size_gb(input_path),
+                input_size_gb=Splitter.get_file_size_gb(input_path, input_stat),
                 output_size_gb=output_size_gb,
                 target_size_gb=target_size_gb,
                 achieved=output_size_gb <= target_size_gb,
             )
 
+            _drop_page_cache(input_path)
             return output_path
 
         except subprocess.CalledProcessError as e:
@@ -305,6 +996,7 @@ class Splitter:
         max_size_gb: float,
         action: OnSizeExceed,
         output_dir: Path | None = None,
+        encoder: EncoderType = EncoderType.LIBX264,
     ) -> list[Path]:
         """Handle file size exceeding maximum according to specified action.
 
@@ -313,6 +1005,7 @@ class Splitter:
             max_size_gb: Maximum allowed size in GB
             action: Action to take (split, compress, warn, skip)
             output_dir: Output directory
+            encoder: Video encoder used if the file has to be compressed
 
         Returns:
             List of output files (may be original, split, or compressed)
@@ -320,7 +1013,12 @@ class Splitter:
         Raises:
             ConversionError: If handling fails
         """
-        current_size_gb = Splitter.get_file_size_gb(input_path)
+        # Stat once; the split/compress helpers reuse it
+        try:
+            input_stat = input_path.stat()
+        except FileNotFoundError:
+            input_stat = None
+        current_size_gb = Splitter.get_file_size_gb(input_path, input_stat)
 
         if current_size_gb <= max_size_gb:
             logger.info("size_check_passed", path=str(input_path), size_gb=current_size_gb)
@@ -334,39 +1032,176 @@ class Splitter:
             action=action.value,
         )
 
-        if action == OnSizeExceed.SPLIT:
-            return Splitter.split_video(input_path, max_size_gb, output_dir)
-
-        elif action == OnSizeExceed.COMPRESS:
-            compressed = Splitter.compress_to_size(
-                input_path,
-                max_size_gb,
-                reduction_factor=0.8,
-                output_path=output_dir / f"{input_path.stem}_compressed{input_path.suffix}"
-                if output_dir
-                else None,
-            )
-            return [compressed]
+        handler = Splitter._HANDLERS.get(action)
+        if handler is None:
+            raise ConversionError(f"Unknown size exceed action: {action}")
+        return handler(input_path, max_size_gb, output_dir, current_size_gb, input_stat, encoder)
 
-        elif action == OnSizeExceed.WARN:
-            logger.warning(
-                "size_warning_only",
-                path=str(input_path),
-                size_gb=current_size_gb,
-                max_size_gb=max_size_gb,
-                message="File exceeds maximum size but action=warn, keeping original",
-            )
-            return [input_path]
+    @staticmethod
+    def _do_split(
+        input_path: Path,
+        max_size_gb: float,
+        output_dir: Path | None,
+        _current_size_gb: float,
+        input_stat: os.stat_result | None,
+        _encoder: EncoderType,
+    ) -> list[Path]:
+        """OnSizeExceed.SPLIT: split into chunks under max_size_gb."""
+        return Splitter.split_video(input_path, max_size_gb, output_dir, input_stat=input_stat)
 
-        elif action == OnSizeExceed.SKIP:
-            logger.warning(
-                "size_skip",
-                path=str(input_path),
-                size_gb=current_size_gb,
-                max_size_gb=max_size_gb,
-                message="File exceeds maximum size and action=skip, returning empty list",
-            )
-            return []
+    @staticmethod
+    def _do_compress(
+        input_path: Path,
+        max_size_gb: float,
+        output_dir: Path | None,
+        _current_size_gb: float,
+        input_stat: os.stat_result | None,
+        encoder: EncoderType,
+    ) -> list[Path]:
+        """OnSizeExceed.COMPRESS: re-encode to fit under max_size_gb."""
+        compressed = Splitter.compress_to_size(
+            input_path,
+            max_size_gb,
+            reduction_factor=0.8,
+            output_path=output_dir / f"{input_path.stem}_compressed{input_path.suffix}"
+            if output_dir
+            else None,
+            input_stat=input_stat,
+            encoder=encoder,
+        )
+        return [compressed]
 
-        else:
-            raise ConversionError(f"Unknown size exceed action: {action}")
+    @staticmethod
+    def _do_warn(
+        input_path: Path,
+        max_size_gb: float,
+        _output_dir: Path | None,
+        current_size_gb: float,
+        _input_stat: os.stat_result | None,
+        _encoder: EncoderType,
+    ) -> list[Path]:
+        """OnSizeExceed.WARN: keep the original file."""
+        logger.warning(
+            "size_warning_only",
+            path=str(input_path),
+            size_gb=current_size_gb,
+            max_size_gb=max_size_gb,
+            message="File exceeds maximum size but action=warn, keeping original",
+        )
+        return [input_path]
+
+    @staticmethod
+    def _do_skip(
+        input_path: Path,
+        max_size_gb: float,
+        _output_dir: Path | None,
+        current_size_gb: float,
+        _input_stat: os.stat_result | None,
+        _encoder: EncoderType,
+    ) -> list[Path]:
+        """OnSizeExceed.SKIP: drop the file."""
+        logger.warning(
+            "size_skip",
+            path=str(input_path),
+            size_gb=current_size_gb,
+            max_size_gb=max_size_gb,
+            message="File exceeds maximum size and action=skip, returning empty list",
+        )
+        return []
+
+    @staticmethod
+    def handle_many(
+        items: list[tuple[Path, OnSizeExceed]],
+        max_size_gb: float,
+        output_dir: Path | None = None,
+        max_workers: int | None = None,
+        encoder: EncoderType = EncoderType.LIBX264,
+    ) -> dict[Path, list[Path]]:
+        """Apply handle_size_exceed to several files in parallel.
+
+        Each worker thread just waits on its own ffmpeg process. Files to
+        split that share a container are batched into one split_many call, so
+        they share a single ffmpeg process; if a batch fails, its files are
+        retried one at a time. Compressions already use every core each, so
+        at most half the CPU count of them run together.
+
+        Args:
+            items: (input file, action) pairs
+            max_size_gb: Maximum allowed size in GB
+            output_dir: Output directory
+            max_workers: Parallel files (defaults to the CPU count; callers
+                usually pass the app's concurrent_conversions setting)
+            encoder: Video encoder used for files that have to be compressed
+
+        Returns:
+            Mapping of input file to its output files, in input order, for
+            files handled successfully (failures are logged and left out)
+        """
+        if not items:
+            return {}
+
+        cpu_count = os.cpu_count() or 1
+        workers = min(len(items), max_workers or cpu_count)
+        compress_slots = threading.BoundedSemaphore(max(1, cpu_count // 2))
+
+        def _handle(item: tuple[Path, OnSizeExceed]) -> list[Path]:
+            input_path, action = item
+            if action == OnSizeExceed.COMPRESS:
+                with compress_slots:
+                    return Splitter.handle_size_exceed(
+                        input_path, max_size_gb, action, output_dir, encoder
+                    )
+            return Splitter.handle_size_exceed(input_path, max_size_gb, action, output_dir, encoder)
+
+        def _split_batch(paths: list[Path]) -> dict[Path, list[Path]]:
+            try:
+                return Splitter.split_many(paths, max_size_gb, output_dir)
+            except Exception as e:
+                logger.warning("batch_split_failed", files=len(paths), error=str(e))
+                return {}
+
+        split_groups: dict[str, list[Path]] = {}
+        for input_path, action in items:
+            if action == OnSizeExceed.SPLIT:
+                split_groups.setdefault(input_path.suffix.lower(), []).append(input_path)
+        batches = [paths for paths in split_groups.values() if len(paths) > 1]
+        batched = {input_path for paths in batches for input_path in paths}
+
+        results: dict[Path, list[Path]] = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yt2audi-split") as pool:
+            batch_futures = [pool.submit(_split_batch, paths) for paths in batches]
+            futures = {
+                item[0]: pool.submit(_handle, item) for item in items if item[0] not in batched
+            }
+
+            batch_results: dict[Path, list[Path]] = {}
+            for batch_future in batch_futures:
+                batch_results.update(batch_future.result())
+            for item in items:
+                if item[0] in batched and item[0] not in batch_results:
+                    futures[item[0]] = pool.submit(_handle, item)
+
+            for input_path, _ in items:
+                if input_path in batch_results:
+                    results[input_path] = batch_results[input_path]
+                    continue
+                try:
+                    results[input_path] = futures[input_path].result()
+                except Exception as e:
+                    logger.error("size_handling_failed", path=str(input_path), error=str(e))
+
+        logger.info(
+            "size_handling_batch_completed",
+            total=len(items),
+            succeeded=len(results),
+            failed=len(items) - len(results),
+        )
+        return results
+
+
+Splitter._HANDLERS = {
+    OnSizeExceed.SPLIT: Splitter._do_split,
+    OnSizeExceed.COMPRESS: Splitter._do_compress,
+    OnSizeExceed.WARN: Splitter._do_warn,
+    OnSizeExceed.SKIP: Splitter._do_skip,
+}
@@ -1,6 +1,7 @@
 """Job/task models for tracking download and conversion progress."""
 
-from datetime import datetime
+import time
+from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -9,6 +10,11 @@ from uuid import UUID, uuid4
 from pydantic import BaseModel, Field
 
 
+def _utcnow() -> datetime:
+    """Current time as an aware UTC datetime."""
+    return datetime.now(UTC)
+
+
 class JobStatus(str, Enum):
     """Job status states."""
 
@@ -48,7 +54,8 @@ class Job(BaseModel):
     # File paths
     downloaded_path: Path | None = Field(default=None)
     converted_path: Path | None = Field(default=None)
-    final_paths: list[Path] = Field(default_factory=list)
+    # Replaced wholesale in mark_completed, so an empty tuple can be shared
+    final_paths: tuple[Path, ...] = Field(default=())
 
     # Metadata
     video_title: str | None = Field(default=None)
@@ -56,17 +63,18 @@ class Job(BaseModel):
     duration_seconds: int | None = Field(default=None)
     file_size_mb: float | None = Field(default=None)
 
-    # Timestamps
-    created_at: datetime = Field(default_factory=datetime.now)
+    # Timestamps (UTC, for display); elapsed time uses the monotonic clock
+    created_at: datetime = Field(default_factory=_utcnow)
     started_at: datetime | None = Field(default=None)
     completed_at: datetime | None = Field(default=None)
+    started_monotonic_ns: int | None = Field(default=None)
 
     # Error tracking
     error_message: str | None = Field(default=None)
     retry_count: int = Field(default=0)
 
-    # Additional data
-    extra_data: dict[str, Any] = Field(default_factory=dict)
+    # Additional data (created on first set_extra)
+    extra_data: dict[str, Any] | None = Field(default=None)
 
     model_config = {
         "populate_by_name": True,
@@ -77,8 +85,9 @@ class Job(BaseModel):
         """Mark job as downloading."""
         self.status = JobStatus.DOWNLOADING
         self.current_stage = "Downloading"
-        if not self.started_at:
-            self.started_at = datetime.now()
+        if self.started_monotonic_ns is None:
+            self.started_monotonic_ns = time.monotonic_ns()
+            self.started_at = _utcnow()
 
     def mark_downloaded(self, path: Path) -> None:
         """Mark job as downloaded."""
@@ -106,8 +115,8 @@ class Job(BaseModel):
         """Mark job as completed."""
         self.status = JobStatus.COMPLETED
         self.current_stage = "Completed"
-        self.final_paths = final_paths
-        self.completed_at = datetime.now()
+        self.final_paths = tuple(final_paths)
+        self.completed_at = _utcnow()
         self.progress_percent = 100.0
 
     def mark_failed(self, error: str) -> None:
@@ -115,13 +124,23 @@ class Job(BaseModel):
         self.status = JobStatus.FAILED
         self.current_stage = "Failed"
         self.error_message = error
-        self.completed_at = datetime.now()
+        self.completed_at = _utcnow()
 
     def mark_cancelled(self) -> None:
         """Mark job as cancelled."""
         self.status = JobStatus.CANCELLED
         self.current_stage = "Cancelled"
-        self.completed_at = datetime.now()
+        self.completed_at = _utcnow()
+
+    def elapsed_seconds(self) -> float | None:
+        """Seconds since the job started, immune to wall-clock changes.
+
+        Returns:
+            Elapsed seconds, or None if the job hasn't started
+        """
+        if self.started_monotonic_ns is None:
+            return None
+        return (time.monotonic_ns() - self.started_monotonic_ns) / 1e9
 
     def update_progress(self, percent: float, stage: str, eta: int | None = None) -> None:
         """Update job progress.
@@ -129,12 +148,30 @@ class Job(BaseModel):
         Args:
             percent: Progress percentage (0-100)
             stage: Current stage description
-            eta: Estimated time remaining in seconds
+            eta: Estimated time remaining in seconds (estimated from elapsed
+                time and progress if not given)
         """
         self.progress_percent = max(0.0, min(100.0, percent))
         self.current_stage = stage
+
+        if eta is None and 0.0 < self.progress_percent < 100.0:
+            elapsed = self.elapsed_seconds()
+            if elapsed is not None:
+                remaining = 100.0 - self.progress_percent
+                eta = int(elapsed * remaining / self.progress_percent)
         self.eta_seconds = eta
 
+    def set_extra(self, key: str, value: Any) -> None:
+        """Store an additional value on the job.
+
+        Args:
+            key: Name of the value
+            value: Value to store
+        """
+        if self.extra_data is None:
+            self.extra_data = {}
+        self.extra_data[key] = value
+
     def increment_retry(self) -> None:
         """Increment retry counter."""
         self.retry_count += 1
@@ -1,9 +1,11 @@
 """Pydantic models for profile configuration."""
 
+import tomllib
 from enum import Enum
 from pathlib import Path
 from typing import Literal
 
+import tomli_w
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -14,6 +16,8 @@ class EncoderType(str, Enum):
     AMF_H264 = "h264_amf"
     QSV_H264 = "h264_qsv"
     LIBX264 = "libx264"
+    # No GPU probing: FFmpeg picks hardware decoding itself, libx264 encodes
+    AUTO = "auto"
 
 
 class OnSizeExceed(str, Enum):
@@ -171,6 +175,9 @@ class DownloadConfig(BaseModel):
     rate_limit_mbps: float | None = Field(default=None, ge=0.1)
     retries: int = Field(default=3, ge=0, le=10)
     fragment_retries: int = Field(default=10, ge=0, le=50)
+    concurrent_fragments: int = Field(default=8, ge=1, le=16)
+    http_chunk_size_mb: float = Field(default=10.0, gt=0, le=100)
+    write_thumbnail: bool = Field(default=True)
 
     # Playlist settings
     playlist_start: int = Field(default=1, ge=1)
@@ -220,15 +227,10 @@ class Profile(BaseModel):
         """
         from yt2audi.exceptions import ConfigError
 
-        if not path.exists():
-            raise ConfigError(f"Profile file not found: {path}")
-
         try:
-            import tomli
-
-            with open(path, "rb") as f:
-                data = tomli.load(f)
-            return cls(**data)
+            return cls.model_validate(tomllib.loads(path.read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            raise ConfigError(f"Profile file not found: {path}") from None
         except Exception as e:
             raise ConfigError(f"Failed to load profile from {path}: {e}") from e
 
@@ -244,8 +246,6 @@ class Profile(BaseModel):
         from yt2audi.exceptions import ConfigError
 
         try:
-            import tomli_w
-
             path.parent.mkdir(parents=True, exist_ok=True)
 
             with open(path, "wb") as f:
@@ -1,8 +1,12 @@
 """USB drive detection and file transfer management."""
 
 import ctypes
+import errno
+import io
 import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +16,69 @@ from yt2audi.exceptions import YT2AudiError
 
 logger = structlog.get_logger(__name__)
 
+_SENDFILE_CHUNK = 1024 * 1024
+_COPY_BUFSIZE = 1024 * 1024
+_MAX_COPY_WORKERS = 4
+
+# Removable-drive scans are reused for this long; status polling would
+# otherwise query every present drive letter (and wake idle drives) each call.
+_DRIVE_CACHE_TTL = 2.0
+_drive_cache: tuple[float, list[Path]] | None = None
+
+
+def _copyfileobj_readinto(
+    fsrc: io.RawIOBase, fdst: io.RawIOBase, length: int = _COPY_BUFSIZE
+) -> None:
+    """Copy between unbuffered file objects through one reused buffer.
+
+    Reads land directly in a preallocated buffer and are written out
+    through a memoryview, so no per-chunk ``bytes`` objects are created.
+
+    Args:
+        fsrc: Source opened with ``buffering=0``.
+        fdst: Destination opened with ``buffering=0``.
+        length: Buffer size in bytes.
+    """
+    buf = bytearray(length)
+    with memoryview(buf) as mv:
+        while n := fsrc.readinto(buf):
+            written = 0
+            # Raw writes may be short on network shares and some USB drivers
+            # (None only comes from non-blocking files, which these never are)
+            while written < n:
+                written += fdst.write(mv[written:n]) or 0
+
+
+def _fastcopy(src: Path, dst: Path) -> None:
+    """Copy a file through the OS copy primitive, keeping metadata.
+
+    On Windows this is ``CopyFileW``, which lets the kernel (and SMB/USB
+    drivers) move the data without a userspace buffer.  On POSIX the
+    data is pushed with ``os.sendfile``.  Any failure of the fast path
+    falls back to a userspace copy with a 1 MiB buffer, whose own errors
+    propagate.
+
+    Args:
+        src: Source file.
+        dst: Destination file (overwritten if it exists).
+    """
+    try:
+        if os.name == "nt":
+            if not ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+                raise ctypes.WinError()
+        else:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+                offset = 0
+                while sent := os.sendfile(out_fd, in_fd, offset, _SENDFILE_CHUNK):
+                    offset += sent
+        shutil.copystat(src, dst)
+    except (OSError, AttributeError) as e:
+        logger.debug("fastcopy_fallback", src=str(src), error=str(e))
+        with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+            _copyfileobj_readinto(fsrc, fdst)
+        shutil.copystat(src, dst)
+
 
 class USBTransferError(YT2AudiError):
     """Raised when USB transfer fails."""
@@ -21,18 +88,28 @@ class USBManager:
     """Manages detection and file transfer to USB drives."""
 
     @staticmethod
-    def get_removable_drives() -> list[Path]:
+    def get_removable_drives(max_age: float = _DRIVE_CACHE_TTL) -> list[Path]:
         """List all removable drives connected to the system (Windows).
 
+        Args:
+            max_age: Reuse the previous scan if it is younger than this many
+                seconds. Pass 0 to force a fresh scan.
+
         Returns:
             List of Path objects representing drive roots.
         """
-        drives = []
+        global _drive_cache
+
         if os.name != "nt":
             # For non-Windows, we could look in /Volumes or /media
             # but for now, we focus on the user's Windows environment.
             return []
 
+        now = time.monotonic()
+        if _drive_cache is not None and now - _drive_cache[0] < max_age:
+            return list(_drive_cache[1])
+
+        drives = []
         bitmask = ctypes.windll.kernel32.GetLogicalDrives()
         for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
             if bitmask & 1:
@@ -42,7 +119,9 @@ class USBManager:
                 if drive_type == 2:
                     drives.append(Path(drive_path))
             bitmask >>= 1
-        return drives
+
+        _drive_cache = (now, drives)
+        return list(drives)
 
     @staticmethod
     def find_best_drive(preferred_path: Optional[str] = None) -> Optional[Path]:
@@ -68,12 +147,38 @@ class USBManager:
         # For now, just take the first one found.
         return removable[0]
 
+    @staticmethod
+    def _copy_workers(sources: list[Path], target_dir: Path) -> int:
+        """Pick how many copies to run at once.
+
+        Overlapping reads and writes only helps when they hit different
+        devices; on a shared device parallel copies just seek against
+        each other, so they stay sequential.
+
+        Args:
+            sources: Files that will be copied.
+            target_dir: Destination directory (must exist).
+
+        Returns:
+            Worker count, at least 1.
+        """
+        if len(sources) < 2:
+            return 1
+        try:
+            target_dev = target_dir.stat().st_dev
+            if any(src.stat().st_dev == target_dev for src in sources):
+                return 1
+        except OSError:
+            return 1
+        return min(_MAX_COPY_WORKERS, len(sources))
+
     @staticmethod
     def copy_to_usb(
         file_paths: list[Path],
         usb_root: Path,
         subdir: str = "Videos",
         delete_original: bool = False,
+        concurrency: int | None = None,
     ) -> list[Path]:
         """Copy files to a USB drive.
 
@@ -82,9 +187,11 @@ class USBManager:
             usb_root: Root path of the USB drive.
             subdir: Subdirectory on the USB to copy into.
             delete_original: Whether to delete the source files after copy.
+            concurrency: Number of files copied at once. Defaults to up to
+                4 when sources live on another device, otherwise 1.
 
         Returns:
-            List of Paths to the files on the USB.
+            List of Paths to the files on the USB, in input order.
 
         Raises:
             USBTransferError: If transfer fails.
@@ -95,33 +202,61 @@ class USBManager:
         except Exception as e:
             raise USBTransferError(f"Failed to create directory {target_dir}: {e}") from e
 
-        copied_paths = []
+        # One stat per source and one statfs for the drive; the running
+        # budget below stands in for re-querying the device per file.
+        sizes: dict[Path, int] = {}
         for src in file_paths:
-            if not src.exists():
+            try:
+                sizes[src] = src.stat().st_size
+            except OSError:
                 logger.warning("source_file_not_found", path=str(src))
-                continue
 
+        try:
+            free = shutil.disk_usage(usb_root).free
+        except OSError as e:
+            raise USBTransferError(f"Failed to query free space on {usb_root}: {e}") from e
+
+        sources = list(sizes)
+        needed = sum(sizes.values())
+        if needed > free:
+            raise USBTransferError(
+                f"Not enough space on {usb_root}. "
+                f"Need {needed / (1024**2):.1f}MB, "
+                f"have {free / (1024**2):.1f}MB"
+            )
+
+        def copy_one(src: Path) -> Path:
             dst = target_dir / src.name
             logger.info("copying_to_usb", src=str(src), dst=str(dst))
-
             try:
-                # Check space
-                usage = shutil.disk_usage(usb_root)
-                if usage.free < src.stat().st_size:
-                    raise USBTransferError(
-                        f"Not enough space on {usb_root}. "
-                        f"Need {src.stat().st_size / (1024**2):.1f}MB, "
-                        f"have {usage.free / (1024**2):.1f}MB"
-                    )
-
-                shutil.copy2(src, dst)
-                copied_paths.append(dst)
-
-                if delete_original:
-                    src.unlink()
-
-            except Exception as e:
-                logger.error("usb_copy_failed", src=str(src), error=str(e))
-                raise USBTransferError(f"Failed to copy {src.name} to USB: {e}") from e
-
-        return copied_paths
+                _fastcopy(src, dst)
+            except OSError as e:
+                if e.errno != errno.ENOSPC:
+                    raise
+                # Something else wrote to the drive since we sampled it;
+                # report what is actually left.
+                left = shutil.disk_usage(usb_root).free
+                raise USBTransferError(
+                    f"Not enough space on {usb_root}. "
+                    f"Need {sizes[src] / (1024**2):.1f}MB, "
+                    f"have {left / (1024**2):.1f}MB"
+                ) from e
+            if delete_original:
+                src.unlink()
+            return dst
+
+        workers = concurrency or USBManager._copy_workers(sources, target_dir)
+        copied: dict[Path, Path] = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yt2audi-usb") as pool:
+            futures = {pool.submit(copy_one, src): src for src in sources}
+            for future in as_completed(futures):
+                src = futures[future]
+                try:
+                    copied[src] = future.result()
+                except Exception as e:
+                    for pending in futures:
+                        pending.cancel()
+                    logger.error("usb_copy_failed", src=str(src), error=str(e))
+                    raise USBTransferError(f"Failed to copy {src.name} to USB: {e}") from e
+
+        return [copied[src] for src in sources]
@@ -1,30 +1,39 @@
 """Utility functions for YT2Audi."""
 
-from yt2audi.utils.logging import configure_logging, get_logger
+from yt2audi.utils.eventloop import install_uvloop
+from yt2audi.utils.logging import Lazy, configure_logging, get_logger
 from yt2audi.utils.paths import (
     ensure_extension,
+    find_thumbnail,
     get_temp_dir,
     get_unique_path,
     sanitize_filename,
 )
 from yt2audi.utils.validation import (
+    extract_video_id,
     is_playlist_url,
     is_valid_url,
     is_youtube_url,
+    resolve_safe,
     sanitize_path,
     validate_file_path,
 )
 
 __all__ = [
+    "Lazy",
     "configure_logging",
     "get_logger",
+    "install_uvloop",
     "ensure_extension",
+    "find_thumbnail",
     "get_temp_dir",
     "get_unique_path",
     "sanitize_filename",
+    "extract_video_id",
     "is_playlist_url",
     "is_valid_url",
     "is_youtube_url",
+    "resolve_safe",
     "sanitize_path",
     "validate_file_path",
 ]
@@ -0,0 +1,29 @@
+"""Event loop setup."""
+
+import asyncio
+
+import structlog
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore[assignment]
+
+logger = structlog.get_logger(__name__)
+
+
+def install_uvloop() -> bool:
+    """Use uvloop for new event loops if it is installed.
+
+    uvloop is an optional speedup (not available on Windows); without it the
+    standard asyncio loop is used.
+
+    Returns:
+        True if uvloop was installed as the event loop policy, False otherwise
+    """
+    if uvloop is None:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("uvloop_installed")
+    return True
@@ -1,14 +1,27 @@
 """Logging configuration using structlog."""
 
+import functools
 import logging
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import structlog
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from yt2audi.models.profile import LogFormat, LogLevel, LoggingConfig
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """orjson serializer for JSONRenderer, decoded for the text PrintLogger."""
+    return orjson.dumps(obj, **kwargs).decode("utf-8")
+
+
 def configure_logging(config: LoggingConfig) -> None:
     """Configure structured logging.
 
@@ -27,28 +40,38 @@ def configure_logging(config: LoggingConfig) -> None:
     log_file = expand_path(config.log_file)
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
+    level: int = getattr(logging, config.level.value)
+
     # Configure standard library logging
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, config.level.value),
+        level=level,
     )
 
-    # Select processors based on format
+    # Select processors based on format. Stack rendering walks frames on every
+    # call, so it is only installed when debugging.
+    processors: list[Any] = [
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+    ]
+    if config.level == LogLevel.DEBUG:
+        processors.append(structlog.processors.StackInfoRenderer())
+
     if config.format == LogFormat.JSON:
-        processors = [
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.StackInfoRenderer(),
-            structlog.dev.set_exc_info,
+        processors += [
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.JSONRenderer(),
+            # Only does work for events carrying exc_info (logger.exception)
+            structlog.processors.format_exc_info,
         ]
+        # orjson (optional speedup) serializes; output still goes through
+        # PrintLogger, like every other format
+        if orjson is not None:
+            processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
+        else:
+            processors.append(structlog.processors.JSONRenderer())
     else:  # CONSOLE
-        processors = [
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.StackInfoRenderer(),
+        processors += [
             structlog.dev.set_exc_info,
             structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S", utc=False),
             structlog.dev.ConsoleRenderer(colors=True),
@@ -57,18 +80,20 @@ def configure_logging(config: LoggingConfig) -> None:
     # Configure structlog
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, config.level.value)
-        ),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """Get a logger instance.
 
+    The same lazy proxy is returned for repeated names; it binds to the
+    current configuration on first use.
+
     Args:
         name: Logger name (usually __name__)
 
@@ -76,3 +101,29 @@ def get_logger(name: str) -> structlog.stdlib.BoundLogger:
         Configured structlog logger
     """
     return structlog.get_logger(name)
+
+
+class Lazy:
+    """Log value computed only when an event is actually rendered.
+
+    Loggers from make_filtering_bound_logger drop events below the configured
+    level before any processor runs, so wrapping an expensive value (joined
+    command lines, path lists) means suppressed events never build it.
+
+    Example:
+        logger.debug("ffmpeg_command", cmd=Lazy(lambda: " ".join(cmd)))
+    """
+
+    __slots__ = ("_func",)
+
+    def __init__(self, func: Callable[[], Any]) -> None:
+        self._func = func
+
+    def __structlog__(self) -> Any:
+        """Value used by structlog's JSONRenderer."""
+        return self._func()
+
+    def __repr__(self) -> str:
+        return str(self._func())
+
+    __str__ = __repr__
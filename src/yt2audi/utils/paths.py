@@ -1,9 +1,17 @@
 """Path utilities."""
 
+import functools
 import re
 import tempfile
 from pathlib import Path
 
+# Thumbnail formats yt-dlp may write next to a video, in preference order
+_THUMBNAIL_EXTENSIONS = (".jpg", ".webp", ".png")
+
+# Characters invalid in Windows/Unix filenames, as a str.translate table
+_INVALID_CHARS_TABLE = str.maketrans("", "", '<>:"/\\|?*')
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def sanitize_filename(filename: str, max_length: int = 255) -> str:
     """Sanitize filename to remove problematic characters.
@@ -21,16 +29,17 @@ def sanitize_filename(filename: str, max_length: int = 255) -> str:
     - Leading/trailing dots and spaces
     """
     # Remove emojis and non-ASCII characters
-    filename = filename.encode("ascii", "ignore").decode("ascii")
+    if not filename.isascii():
+        filename = filename.encode("ascii", "ignore").decode("ascii")
 
     # Remove invalid characters for Windows/Unix
-    filename = re.sub(r'[<>:"/\\|?*]', "", filename)
+    filename = filename.translate(_INVALID_CHARS_TABLE)
 
     # Remove leading/trailing dots and spaces
     filename = filename.strip(". ")
 
     # Replace multiple spaces with underscores (to match yt-dlp restrictfilenames)
-    filename = re.sub(r"\s+", "_", filename)
+    filename = _WHITESPACE_RE.sub("_", filename)
 
     # Truncate if too long (leave room for extension)
     if len(filename) > max_length:
@@ -43,9 +52,12 @@ def sanitize_filename(filename: str, max_length: int = 255) -> str:
     return filename
 
 
+@functools.lru_cache(maxsize=1)
 def get_temp_dir() -> Path:
     """Get temporary directory for downloads.
 
+    Resolved and created once per process.
+
     Returns:
         Path to temp directory
     """
@@ -67,10 +79,12 @@ def ensure_extension(path: Path, extension: str) -> Path:
     if not extension.startswith("."):
         extension = f".{extension}"
 
-    if path.suffix.lower() != extension.lower():
-        return path.with_suffix(extension)
+    # Exact match is the common case and needs no case folding
+    suffix = path.suffix
+    if suffix == extension or suffix.lower() == extension.lower():
+        return path
 
-    return path
+    return path.with_suffix(extension)
 
 
 def get_unique_path(path: Path) -> Path:
@@ -86,13 +100,46 @@ def get_unique_path(path: Path) -> Path:
         video.mp4 → video.mp4 (if doesn't exist)
         video.mp4 → video_1.mp4 (if exists)
         video.mp4 → video_2.mp4 (if video_1.mp4 also exists)
+
+    Numbered copies are assumed to be contiguous, which holds when this
+    function created them.
     """
     if not path.exists():
         return path
 
-    counter = 1
-    while True:
-        new_path = path.with_stem(f"{path.stem}_{counter}")
-        if not new_path.exists():
-            return new_path
-        counter += 1
+    stem = path.stem
+
+    def numbered(n: int) -> Path:
+        return path.with_stem(f"{stem}_{n}")
+
+    # Gallop to a free number, then binary-search back to the first free one
+    # after the taken run: O(log N) exists() calls instead of O(N). If the
+    # numbering has holes, a later free number may be returned instead.
+    taken, free = 0, 1
+    while numbered(free).exists():
+        taken, free = free, free * 2
+
+    while free - taken > 1:
+        mid = (taken + free) // 2
+        if numbered(mid).exists():
+            taken = mid
+        else:
+            free = mid
+
+    return numbered(free)
+
+
+def find_thumbnail(video_path: Path) -> Path | None:
+    """Find the thumbnail yt-dlp wrote alongside a downloaded video.
+
+    Args:
+        video_path: Path to the downloaded video
+
+    Returns:
+        Path to the thumbnail, or None if there is none
+    """
+    for extension in _THUMBNAIL_EXTENSIONS:
+        candidate = video_path.with_suffix(extension)
+        if candidate.exists():
+            return candidate
+    return None
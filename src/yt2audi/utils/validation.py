@@ -1,8 +1,38 @@
 """URL and input validation utilities."""
 
+import os
 import re
+from functools import lru_cache
 from urllib.parse import urlparse
 
+# Schemes accepted by is_valid_url without a full urlparse
+_COMMON_SCHEMES = frozenset({"http", "https"})
+
+# Supported YouTube URL shapes in one alternation, scheme optional (see is_youtube_url)
+_YOUTUBE_RE = re.compile(
+    r"(?:https?://)?(?:www\.)?"
+    r"(?:youtube\.com/(?:watch\?v=|playlist\?list=|channel/|@)|youtu\.be/)[\w-]+"
+)
+
+# Single-video URL shapes with the 11-character video ID as group 1
+_VIDEO_ID_RE = re.compile(
+    r"(?:https?://)?(?:www\.|m\.|music\.)?"
+    r"(?:youtube\.com/(?:watch\?(?:[^#]*&)?v=|shorts/|embed/|live/)|youtu\.be/)"
+    r"([\w-]{11})(?![\w-])"
+)
+
+# Shell metacharacters rejected by sanitize_path
+_SHELL_METACHAR_RE = re.compile(r"[&|;$`\n\r<>]")
+
+# Windows reserved device names rejected by sanitize_path
+_RESERVED_NAMES = frozenset({
+    "CON", "PRN", "AUX", "NUL", "COM1", "COM2", "COM3", "COM4",
+    "COM5", "COM6", "COM7", "COM8", "COM9", "LPT1", "LPT2",
+    "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9",
+})
+
+_UNIX_SPECIAL_FILES = frozenset({"/dev/null", "/dev/zero", "/dev/random"})
+
 
 def is_valid_url(url: str) -> bool:
     """Check if string is a valid URL.
@@ -11,8 +41,28 @@ def is_valid_url(url: str) -> bool:
         url: URL string to validate
 
     Returns:
-        True if valid URL, False otherwise
+        True if valid URL, False otherwise (including for non-strings)
     """
+    # Checked before the cache, which would raise on unhashable input
+    if not isinstance(url, str):
+        return False
+    return _is_valid_url(url)
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_url(url: str) -> bool:
+    """Memoized body of is_valid_url for string input."""
+    # Without "://" urlparse can never report both a scheme and a netloc
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        return False
+    if scheme in _COMMON_SCHEMES and rest[:1].isalnum():
+        # Brackets in the host (IPv6 literals) need urlparse's checks
+        netloc = rest.partition("/")[0].partition("?")[0].partition("#")[0]
+        if "[" not in netloc and "]" not in netloc:
+            return True
+
+    # Uncommon schemes and odd inputs get the full parse
     try:
         result = urlparse(url)
         return all([result.scheme, result.netloc])
@@ -20,6 +70,7 @@ def is_valid_url(url: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=1024)
 def is_youtube_url(url: str) -> bool:
     """Check if URL is a YouTube URL.
 
@@ -36,15 +87,21 @@ def is_youtube_url(url: str) -> bool:
     - youtube.com/channel/...
     - youtube.com/@username
     """
-    youtube_patterns = [
-        r"(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+",
-        r"(?:https?://)?(?:www\.)?youtu\.be/[\w-]+",
-        r"(?:https?://)?(?:www\.)?youtube\.com/playlist\?list=[\w-]+",
-        r"(?:https?://)?(?:www\.)?youtube\.com/channel/[\w-]+",
-        r"(?:https?://)?(?:www\.)?youtube\.com/@[\w-]+",
-    ]
+    return _YOUTUBE_RE.match(url) is not None
 
-    return any(re.match(pattern, url) for pattern in youtube_patterns)
+
+@lru_cache(maxsize=1024)
+def extract_video_id(url: str) -> str | None:
+    """Extract the video ID from a single-video YouTube URL without any network access.
+
+    Args:
+        url: URL string to parse
+
+    Returns:
+        Video ID, or None if the URL is not a recognized single-video URL
+    """
+    match = _VIDEO_ID_RE.match(url)
+    return match.group(1) if match else None
 
 
 def is_playlist_url(url: str) -> bool:
@@ -97,6 +154,10 @@ def sanitize_path(path: str) -> str:
     Args:
         path: File path to sanitize
 
+    Normalization is purely lexical (no filesystem access), so relative
+    paths stay relative; use resolve_safe() when an absolute, symlink-free
+    path is needed.
+
     Returns:
         Sanitized path string
 
@@ -116,40 +177,54 @@ def sanitize_path(path: str) -> str:
         raise ValueError(f"Path contains null bytes: {path}")
 
     # Check for shell metacharacters (command injection prevention)
-    dangerous_chars = ['&', '|', ';', '$', '`', '\n', '\r', '<', '>']
-    for char in dangerous_chars:
-        if char in path:
-            raise ValueError(
-                f"Path contains dangerous shell metacharacter '{char}': {path}"
-            )
-
-    # Convert to Path object for normalization
-    try:
-        normalized_path = Path(path).resolve()
-    except (ValueError, OSError) as e:
-        raise ValueError(f"Invalid path: {path}") from e
-
-    # Check for path traversal after normalization
-    path_str = str(normalized_path)
-    if ".." in Path(path_str).parts:
+    match = _SHELL_METACHAR_RE.search(path)
+    if match:
+        raise ValueError(
+            f"Path contains dangerous shell metacharacter '{match.group()}': {path}"
+        )
+
+    # Lexical normalization: no stat per component, unlike resolve()
+    path_str = os.path.normpath(path)
+    normalized_path = Path(path_str)
+
+    # Only leading ".." survive normalization, i.e. escapes above the base
+    if ".." in normalized_path.parts:
         raise ValueError(f"Path traversal detected: {path}")
 
     # Check for dangerous filenames (Windows reserved names)
-    dangerous_names = {
-        'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4',
-        'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2',
-        'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-    }
-    
-    path_parts = normalized_path.parts
-    for part in path_parts:
-        clean_part = part.upper().split('.')[0]  # Remove extension
-        if clean_part in dangerous_names:
-            raise ValueError(f"Path contains reserved filename: {part}")
+    reserved = next(
+        (
+            part
+            for part in normalized_path.parts
+            if part.upper().partition(".")[0] in _RESERVED_NAMES  # Ignore extension
+        ),
+        None,
+    )
+    if reserved is not None:
+        raise ValueError(f"Path contains reserved filename: {reserved}")
 
     # Check for Unix special files
-    unix_dangerous = {'/dev/null', '/dev/zero', '/dev/random'}
-    if path_str in unix_dangerous:
+    if path_str in _UNIX_SPECIAL_FILES:
         raise ValueError(f"Path is a dangerous Unix special file: {path_str}")
 
-    return str(normalized_path)
+    return path_str
+
+
+def resolve_safe(path: str) -> str:
+    """Sanitize a path and resolve it to an absolute canonical path.
+
+    Args:
+        path: File path to sanitize
+
+    Returns:
+        Absolute path with symlinks resolved
+
+    Raises:
+        ValueError: If the path fails sanitize_path() or cannot be resolved
+    """
+    from pathlib import Path
+
+    try:
+        return str(Path(sanitize_path(path)).resolve())
+    except OSError as e:
+        raise ValueError(f"Invalid path: {path}") from e
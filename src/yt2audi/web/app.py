@@ -1,30 +1,46 @@
 import asyncio
+import json
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Dict, Any, List
 
 from fastapi import FastAPI, Request, BackgroundTasks, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from pydantic import BaseModel
 from contextlib import asynccontextmanager
 
+import structlog
+
 from yt2audi.core.pipeline import ProcessingPipeline
 from yt2audi.config.loader import load_profile, list_available_profiles
 from yt2audi.models.profile import Profile
 from yt2audi.transfer import USBManager
 
+logger = structlog.get_logger(__name__)
+
 # --- Global State ---
 # In a real production app, this might be a database or Redis.
 # For a local desktop app, in-memory is fine.
 class JobStore:
-    jobs: Dict[str, Dict[str, Any]] = {}
+    # Mutated from request handlers and the pipeline's worker threads
+    jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    _lock = threading.Lock()
+    # Finished jobs beyond this many are forgotten, oldest first
+    MAX_JOBS = 500
+    _FINISHED = frozenset({"complete", "error"})
+    # Status streams waiting for a change, with the loop each one lives on
+    _listeners: Dict[asyncio.Event, asyncio.AbstractEventLoop] = {}
     
     @classmethod
     def create_job(cls, url: str) -> str:
         job_id = str(uuid.uuid4())[:8]
-        cls.jobs[job_id] = {
+        job = {
             "id": job_id, 
             "url": url, 
             "status": "pending", 
@@ -32,21 +48,80 @@ class JobStore:
             "stage": "Initializing",
             "title": url # placeholder
         }
+        with cls._lock:
+            cls.jobs[job_id] = job
+            if len(cls.jobs) > cls.MAX_JOBS:
+                cls._evict_finished()
+            cls._notify()
         return job_id
 
+    @classmethod
+    def _evict_finished(cls) -> None:
+        # Caller holds _lock. Running jobs are never dropped, so the store
+        # can exceed MAX_JOBS while that many are in flight.
+        excess = len(cls.jobs) - cls.MAX_JOBS
+        stale = [
+            job_id for job_id, job in cls.jobs.items()
+            if job["status"] in cls._FINISHED
+        ][:excess]
+        for job_id in stale:
+            del cls.jobs[job_id]
+
     @classmethod
     def update_job(cls, job_id: str, **kwargs):
-        if job_id in cls.jobs:
-            cls.jobs[job_id].update(kwargs)
+        with cls._lock:
+            job = cls.jobs.get(job_id)
+            if job is not None:
+                job.update(kwargs)
+                cls._notify()
+
+    @classmethod
+    def subscribe(cls) -> asyncio.Event:
+        """Return an event set whenever a job is created or updated."""
+        changed = asyncio.Event()
+        with cls._lock:
+            cls._listeners[changed] = asyncio.get_running_loop()
+        return changed
+
+    @classmethod
+    def unsubscribe(cls, changed: asyncio.Event) -> None:
+        with cls._lock:
+            cls._listeners.pop(changed, None)
+
+    @classmethod
+    def _notify(cls) -> None:
+        # Caller holds _lock. Updates arrive from worker threads too, so the
+        # events are set on their own loops.
+        for changed, loop in cls._listeners.items():
+            loop.call_soon_threadsafe(changed.set)
 
     @classmethod
     def get_active_jobs(cls) -> List[Dict[str, Any]]:
         # Return jobs that aren't "complete" (or keep complete for a bit?)
-        # For now, return all recent
-        return list(cls.jobs.values())
+        # For now, return all recent. Copies so callers can serialize the
+        # snapshot without holding the lock.
+        with cls._lock:
+            return [dict(job) for job in cls.jobs.values()]
 
 job_store = JobStore()
 
+# Shown when no profile files can be found
+_FALLBACK_PROFILES = [
+    {"id": "audi_q5", "name": "Audi Q5 (Best Quality)"},
+    {"id": "mp3", "name": "Audio Only (MP3)"}
+]
+
+def scan_profiles() -> List[Dict[str, str]]:
+    """List available profiles as {"id", "name"} entries for the UI."""
+    profiles = []
+    for profile_id in list_available_profiles():
+        try:
+            name = load_profile(profile_id).profile.name
+        except Exception:
+            name = profile_id
+        profiles.append({"id": profile_id, "name": name})
+    return profiles or list(_FALLBACK_PROFILES)
+
 # --- Dependencies ---
 pipeline_instance: ProcessingPipeline = None
 default_profile: Profile = None
@@ -69,10 +144,11 @@ async def lifespan(app: FastAPI):
             from yt2audi.models.profile import Profile as ProfileModel
             default_profile = ProfileModel() 
 
+    app.state.profiles_cache = scan_profiles()
     pipeline_instance = ProcessingPipeline(default_profile)
     yield
     # Shutdown
-    pass
+    pipeline_instance.close()
 
 app = FastAPI(title="YT2Audi Web", lifespan=lifespan)
 
@@ -90,12 +166,32 @@ class QueueRequest(BaseModel):
     auto_copy_usb: bool = False
 
 # --- Helpers ---
+_PROGRESS_MIN_STEP = 1.0
+_PROGRESS_MIN_INTERVAL = 0.2
+_STATUS_STREAM_IDLE_SECONDS = 5.0
+
 async def run_pipeline_task(job_id: str, request: QueueRequest):
     """Background task to run the pipeline for a single video."""
-    def progress_callback(item_url: str, percent: float, stage: str):
-        job_store.update_job(job_id, progress=percent, stage=stage, status="processing")
+    # Last written percent, stage and time; ticks arrive far faster than the
+    # UI polls, so only stage changes, 1% steps or 200ms gaps are stored.
+    last_percent = -_PROGRESS_MIN_STEP
+    last_stage: str | None = None
+    last_time = 0.0
+
+    def progress_callback(item_url: str, percent: float, stage: str) -> None:
+        nonlocal last_percent, last_stage, last_time
         if percent >= 100:
-             job_store.update_job(job_id, status="complete", stage="Finished")
+            job_store.update_job(job_id, progress=percent, status="complete", stage="Finished")
+            return
+        now = time.monotonic()
+        if (
+            stage == last_stage
+            and percent - last_percent < _PROGRESS_MIN_STEP
+            and now - last_time < _PROGRESS_MIN_INTERVAL
+        ):
+            return
+        last_percent, last_stage, last_time = percent, stage, now
+        job_store.update_job(job_id, progress=percent, stage=stage, status="processing")
 
     try:
         # 1. Determine Output Directory
@@ -136,11 +232,10 @@ async def run_pipeline_task(job_id: str, request: QueueRequest):
             pipeline_instance.profile.transfer.usb_auto_copy = original_usb_setting
 
     except Exception as e:
-        import traceback
-        error_msg = f"{str(e)}\n{traceback.format_exc()}"
-        print(f"Job {job_id} failed: {error_msg}") # Log to console for debugging
+        # The logging pipeline renders the traceback only if the event is emitted
+        logger.exception("job_failed", job_id=job_id, url=request.url)
         # Truncate for UI but keep critical info
-        ui_msg = str(e)[:200]
+        ui_msg = f"{type(e).__name__}: {e}"[:200]
         job_store.update_job(job_id, status="error", stage=ui_msg, progress=0)
 
 # --- Routes ---
@@ -154,8 +249,7 @@ async def queue_video(req: QueueRequest, background_tasks: BackgroundTasks):
     background_tasks.add_task(run_pipeline_task, job_id, req)
     return {"id": job_id, "status": "queued"}
 
-@app.get("/api/status")
-async def get_status():
+def status_snapshot() -> Dict[str, Any]:
     return {
         "jobs": job_store.get_active_jobs(),
         "system": {
@@ -164,10 +258,46 @@ async def get_status():
         }
     }
 
+@app.get("/api/status")
+async def get_status():
+    return status_snapshot()
+
+@app.get("/api/status/stream")
+async def stream_status(request: Request) -> StreamingResponse:
+    """Push the status as Server-Sent Events whenever it changes."""
+    async def events() -> AsyncIterator[str]:
+        changed = job_store.subscribe()
+        last: Dict[str, Any] | None = None
+        try:
+            while not await request.is_disconnected():
+                changed.clear()
+                # The USB scan blocks; keep it off the event loop
+                status = await asyncio.to_thread(status_snapshot)
+                if status != last:
+                    last = status
+                    yield f"data: {json.dumps(status)}\n\n"
+                # Jobs wake us directly; the timeout picks up USB plug events
+                # and notices disconnected clients.
+                try:
+                    await asyncio.wait_for(changed.wait(), _STATUS_STREAM_IDLE_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            job_store.unsubscribe(changed)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
 @app.get("/api/profiles")
 async def get_profiles():
-    # Return mock profiles for now, or real ones if available
-    return [
-        {"id": "audi_q5", "name": "Audi Q5 (Best Quality)"},
-        {"id": "mp3", "name": "Audio Only (MP3)"}
-    ]
+    # Scanned once at startup; POST /api/profiles/refresh rescans
+    return app.state.profiles_cache
+
+@app.post("/api/profiles/refresh")
+async def refresh_profiles() -> List[Dict[str, str]]:
+    profiles = await asyncio.to_thread(scan_profiles)
+    app.state.profiles_cache = profiles
+    return profiles
@@ -1,6 +1,6 @@
 document.addEventListener('DOMContentLoaded', () => {
-    // Start polling loop
-    setInterval(fetchStatus, 1000);
+    // Server pushes status changes; fall back to polling without SSE support
+    startStatusUpdates();
     loadProfiles();
 
     // Allow Enter key in input
@@ -58,33 +58,53 @@ async function submitVideo() {
     }
 }
 
+let statusPoller = null;
+
+function startStatusUpdates() {
+    if (!window.EventSource) {
+        statusPoller = setInterval(fetchStatus, 1000);
+        return;
+    }
+    const source = new EventSource('/api/status/stream');
+    source.onmessage = (event) => applyStatus(JSON.parse(event.data));
+    source.onerror = () => {
+        // The stream reconnects on its own; poll meanwhile so the UI stays live
+        if (source.readyState === EventSource.CLOSED && !statusPoller) {
+            statusPoller = setInterval(fetchStatus, 1000);
+        }
+    };
+}
+
 async function fetchStatus() {
     try {
         const response = await fetch('/api/status');
         if (response.ok) {
-            const data = await response.json();
-            updateDashboard(data);
-
-            // Auto-update USB Checkbox
-            const usbCheckbox = document.getElementById('usb-checkbox');
-            const usbLabel = document.querySelector('label[for="usb-checkbox"]');
-
-            if (data.system.usb_connected) {
-                usbCheckbox.disabled = false;
-                usbCheckbox.parentElement.style.opacity = '1';
-                usbCheckbox.parentElement.title = "USB Drive Detected";
-            } else {
-                usbCheckbox.checked = false;
-                usbCheckbox.disabled = true;
-                usbCheckbox.parentElement.style.opacity = '0.5';
-                usbCheckbox.parentElement.title = "No USB Drive Detected";
-            }
+            applyStatus(await response.json());
         }
     } catch (error) {
         console.error('Status fetch failed', error);
     }
 }
 
+function applyStatus(data) {
+    updateDashboard(data);
+
+    // Auto-update USB Checkbox
+    const usbCheckbox = document.getElementById('usb-checkbox');
+    const usbLabel = document.querySelector('label[for="usb-checkbox"]');
+
+    if (data.system.usb_connected) {
+        usbCheckbox.disabled = false;
+        usbCheckbox.parentElement.style.opacity = '1';
+        usbCheckbox.parentElement.title = "USB Drive Detected";
+    } else {
+        usbCheckbox.checked = false;
+        usbCheckbox.disabled = true;
+        usbCheckbox.parentElement.style.opacity = '0.5';
+        usbCheckbox.parentElement.title = "No USB Drive Detected";
+    }
+}
+
 function updateDashboard(data) {
     // Update System Status
     const usbIndicator = document.getElementById('status-usb');
@@ -1,5 +1,6 @@
 """Shared pytest fixtures for YT2Audi tests."""
 
+import functools
 import tempfile
 from pathlib import Path
 from typing import Generator
@@ -46,12 +47,12 @@ def sample_video_path(temp_dir: Path) -> Path:
     return video_path
 
 
-@pytest.fixture
-def sample_profile() -> Profile:
-    """Create a sample Audi Q5 profile for testing.
+@pytest.fixture(scope="session")
+def sample_profile_template() -> Profile:
+    """Build and validate the sample Audi Q5 profile once per session/worker.
 
     Returns:
-        A valid Profile instance with default Audi Q5 settings
+        A valid Profile instance; copy it rather than mutating it
     """
     return Profile(
         profile=ProfileMeta(
@@ -126,6 +127,60 @@ def sample_profile() -> Profile:
     )
 
 
+@pytest.fixture
+def sample_profile(sample_profile_template: Profile) -> Profile:
+    """Create a sample Audi Q5 profile for testing.
+
+    Args:
+        sample_profile_template: Session-wide validated profile
+
+    Returns:
+        A deep copy tests may freely modify
+    """
+    return sample_profile_template.model_copy(deep=True)
+
+
+# Bundled profile shipped in the repository, relative to the project root
+BUNDLED_PROFILE_PATH = Path(__file__).parent.parent / "configs" / "profiles" / "audi_q5_mmi.toml"
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_profile_from_toml(path: Path, mtime_ns: int) -> Profile:
+    """Parse and validate a profile TOML once per file version.
+
+    Args:
+        path: Profile TOML file
+        mtime_ns: Modification time, so edited files are re-read
+
+    Returns:
+        Shared validated Profile; callers must copy before mutating
+    """
+    return Profile.from_toml_file(path)
+
+
+def load_profile_cached(path: Path) -> Profile:
+    """Load a profile TOML through the per-process cache.
+
+    Args:
+        path: Profile TOML file
+
+    Returns:
+        A deep copy of the cached Profile
+    """
+    cached = _cached_profile_from_toml(path, path.stat().st_mtime_ns)
+    return cached.model_copy(deep=True)
+
+
+@pytest.fixture
+def bundled_profile() -> Profile:
+    """Load the bundled Audi Q5 MMI profile, parsed once per session/worker.
+
+    Returns:
+        A deep copy tests may freely modify
+    """
+    return load_profile_cached(BUNDLED_PROFILE_PATH)
+
+
 @pytest.fixture
 def minimal_profile() -> Profile:
     """Create a minimal valid profile for testing.
@@ -3,11 +3,19 @@
 import json
 import time
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 from yt2audi.core.cache import MetadataCache
 
+
+def load_cache_from(text: str, **kwargs) -> MetadataCache:
+    """Build a MetadataCache whose cache file holds ``text``, without disk I/O."""
+    with patch.object(Path, "exists", return_value=True), \
+            patch("yt2audi.core.cache.open", mock_open(read_data=text), create=True):
+        return MetadataCache(cache_file=Path("cache.json"), **kwargs)
+
+
 class TestMetadataCache:
     """Test suite for MetadataCache class."""
 
@@ -17,35 +25,39 @@ class TestMetadataCache:
             cache = MetadataCache()
             assert cache.cache_file == tmp_path / "cache" / "metadata.json"
 
-    def test_load_cache_success(self, tmp_path):
-        """Test successful cache loading from disk."""
-        cache_file = tmp_path / "cache.json"
+    def test_load_cache_success(self):
+        """Test successful cache loading."""
         data = {"url1": {"data": {"id": "1"}, "_cached_at": time.time()}}
-        cache_file.write_text(json.dumps(data))
-        
-        cache = MetadataCache(cache_file=cache_file)
+
+        cache = load_cache_from(json.dumps(data))
         assert cache.get("url1") == {"id": "1"}
 
-    def test_load_cache_corrupted(self, tmp_path):
+    def test_load_cache_corrupted(self):
         """Test handling of corrupted cache file."""
-        cache_file = tmp_path / "bad.json"
-        cache_file.write_text("{broken json")
-        
-        cache = MetadataCache(cache_file=cache_file)
+        cache = load_cache_from("{broken json")
         assert cache._cache == {}
 
-    def test_get_expired(self, tmp_path):
+    def test_get_expired(self):
         """Test that expired entries are handled correctly."""
-        cache_file = tmp_path / "cache.json"
-        # 10 days ago
+        cache = load_cache_from(json.dumps({}), expiration_days=7)
+        # Inserted after load, so only get() can expire it (10 days ago)
         old_time = time.time() - (10 * 24 * 60 * 60)
-        data = {"url_old": {"data": {"id": "old"}, "_cached_at": old_time}}
-        cache_file.write_text(json.dumps(data))
-        
-        cache = MetadataCache(cache_file=cache_file, expiration_days=7)
+        cache._cache["url_old"] = {"data": {"id": "old"}, "_cached_at": old_time}
+
         assert cache.get("url_old") is None
         assert "url_old" not in cache._cache
 
+    def test_load_prunes_expired(self):
+        """Test that expired entries are dropped when the cache is loaded."""
+        old_time = time.time() - (10 * 24 * 60 * 60)
+        data = {
+            "url_old": {"data": {"id": "old"}, "_cached_at": old_time},
+            "url_new": {"data": {"id": "new"}, "_cached_at": time.time()},
+        }
+
+        cache = load_cache_from(json.dumps(data), expiration_days=7)
+        assert list(cache._cache) == ["url_new"]
+
     def test_set_and_save(self, tmp_path):
         """Test setting an entry and verify it's saved to disk."""
         cache_file = tmp_path / "new_cache.json"
@@ -59,6 +71,7 @@ class TestMetadataCache:
             saved_data = json.load(f)
             assert "url123" in saved_data
             assert saved_data["url123"]["data"] == info
+        assert list(tmp_path.glob("*.tmp")) == []
 
     def test_clear(self, tmp_path):
         """Test clearing the cache."""
@@ -115,6 +115,28 @@ class TestConverter:
         # Should fallback to f"{title}_{id}.{ext}" or similar
         assert "Safe" in path.name
 
+    def test_get_output_path_is_memoized(self, converter, tmp_path):
+        """Test that repeated predictions for the same video skip sanitization."""
+        info = {"title": "My Video", "id": "123", "uploader": "Me"}
+        first = converter.get_output_path(info, tmp_path)
+
+        with patch("yt2audi.core.converter.sanitize_filename") as mock_sanitize:
+            assert converter.get_output_path(dict(info), tmp_path) is first
+            mock_sanitize.assert_not_called()
+
+        assert converter.get_output_path(info, tmp_path / "other") == tmp_path / "other" / first.name
+
+    @patch("yt2audi.core.converter._OUTPUT_PATH_CACHE_SIZE", 2)
+    def test_get_output_path_cache_is_bounded(self, converter, tmp_path):
+        """Test that the least recently used prediction is evicted past the cap."""
+        first = converter.get_output_path({"id": "1"}, tmp_path)
+        converter.get_output_path({"id": "2"}, tmp_path)
+        assert converter.get_output_path({"id": "1"}, tmp_path) is first
+        converter.get_output_path({"id": "3"}, tmp_path)
+
+        assert len(converter._output_path_cache) == 2
+        assert [key[0] for key in converter._output_path_cache] == ["1", "3"]
+
     def test_build_ffmpeg_command_with_thumbnail(self, converter):
         """Test FFmpeg command with thumbnail inclusion."""
         meta = MagicMock(width=1920, height=1080, fps=30)
@@ -124,6 +146,17 @@ class TestConverter:
             assert str(thumb) in cmd
             assert "attached_pic" in cmd
 
+    def test_build_ffmpeg_command_auto_encoder(self, converter):
+        """Test that the AUTO encoder adds -hwaccel auto as an input option."""
+        from yt2audi.models.profile import EncoderType
+
+        converter.encoder = EncoderType.AUTO
+        meta = MagicMock(width=1280, height=720, fps=30)
+        cmd = converter.build_ffmpeg_command(Path("in.mp4"), Path("out.mp4"), meta)
+
+        assert cmd[:5] == ["ffmpeg", "-hwaccel", "auto", "-i", "in.mp4"]
+        assert cmd[cmd.index("-c:v:0") + 1] == "libx264"
+
     @patch("subprocess.Popen")
     @patch("yt2audi.core.converter.Converter.probe_video")
     def test_convert_video_sync_success(self, mock_probe, mock_popen, converter, tmp_path):
@@ -1,6 +1,8 @@
 """Unit tests for the Downloader class."""
 
 import asyncio
+import os
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -14,9 +16,10 @@ def mock_profile(sample_profile):
     return sample_profile
 
 @pytest.fixture
-def downloader(mock_profile):
-    """Fixture for Downloader instance."""
-    return Downloader(mock_profile)
+def downloader(mock_profile, tmp_path):
+    """Fixture for Downloader instance (config dir kept under tmp_path)."""
+    with patch("yt2audi.core.downloader.get_config_dir", return_value=tmp_path):
+        return Downloader(mock_profile)
 
 class TestDownloader:
     """Test suite for Downloader class."""
@@ -34,7 +37,7 @@ class TestDownloader:
         assert "bestvideo" in format_str
         assert "bestaudio" in format_str
 
-    @patch("yt2audi.config.expand_path")
+    @patch("yt2audi.core.downloader.expand_path")
     def test_get_ydl_opts(self, mock_expand, downloader):
         """Test building yt-dlp options."""
         mock_expand.return_value = Path("/tmp/archive.txt")
@@ -46,6 +49,44 @@ class TestDownloader:
         assert opts["outtmpl"] == "output.mp4"
         assert "download_archive" in opts
         assert opts["download_archive"] == str(Path("/tmp/archive.txt"))
+        assert opts["concurrent_fragment_downloads"] == downloader.download_config.concurrent_fragments
+        assert opts["http_chunk_size"] == 10 * 1024 * 1024
+        assert opts["cachedir"] == str(downloader.ydl_cache_dir)
+        assert opts["cookiefile"] == str(downloader.session_cookie_file)
+
+    def test_session_cookie_jar_is_private(self, downloader):
+        """Test that the fallback cookie jar is created readable by the user only."""
+        jar = downloader.session_cookie_file
+
+        assert jar.read_text().startswith("# Netscape HTTP Cookie File")
+        if os.name != "nt":
+            assert jar.stat().st_mode & 0o777 == 0o600
+            assert jar.parent.stat().st_mode & 0o777 == 0o700
+
+    @pytest.mark.parametrize(
+        "setting", [{"cookies_from_browser": "chrome"}, {"cookies_file": "missing.txt"}]
+    )
+    def test_configured_cookies_skip_session_jar(self, mock_profile, tmp_path, setting):
+        """Test that configured cookies are never saved into the session jar."""
+        for key, value in setting.items():
+            setattr(mock_profile.download, key, value)
+        with patch("yt2audi.core.downloader.get_config_dir", return_value=tmp_path):
+            downloader = Downloader(mock_profile)
+
+        opts = downloader._get_ydl_opts("a.mp4")
+
+        assert "cookiefile" not in opts
+        assert not downloader.session_cookie_file.exists()
+
+    def test_get_ydl_opts_copies_template(self, downloader):
+        """Test that per-call keys never leak into the shared options template."""
+        hook = MagicMock()
+        opts = downloader._get_ydl_opts("a.mp4", hook)
+
+        assert opts["outtmpl"] == "a.mp4"
+        assert opts["progress_hooks"] == [hook]
+        assert "outtmpl" not in downloader._opts_template
+        assert "progress_hooks" not in downloader._get_ydl_opts("b.mp4")
 
     @patch("yt_dlp.YoutubeDL")
     @patch("yt2audi.utils.is_valid_url")
@@ -71,6 +112,70 @@ class TestDownloader:
         assert info["id"] == "test_id"
         mock_ydl.download.assert_called_once()
 
+    @patch("yt_dlp.YoutubeDL")
+    def test_download_video_reuses_info_dict(self, mock_ydl_class, downloader, tmp_path):
+        """Test that a live-extracted info dict is downloaded without re-extraction."""
+        url = "https://youtube.com/watch?v=123"
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl.extract_info.return_value = {"id": "test_id", "title": "test_title"}
+        with patch.object(downloader.cache, "get", return_value=None), \
+                patch.object(downloader.cache, "set"):
+            info = downloader.extract_info(url)
+        mock_ydl.extract_info.reset_mock()
+
+        mock_ydl.process_ie_result.return_value = {**info, "ext": "mp4"}
+        output_path = tmp_path / "test_title_test_id.mp4"
+        output_path.touch()
+        mock_ydl.prepare_filename.return_value = str(output_path)
+
+        result, result_info = downloader.download_video(url, output_dir=tmp_path, info_dict=info)
+
+        assert result == output_path
+        assert result_info["ext"] == "mp4"
+        mock_ydl.process_ie_result.assert_called_once_with(info, download=True)
+        assert mock_ydl.process_ie_result.call_args.args[0] is not info
+        mock_ydl.extract_info.assert_not_called()
+        mock_ydl.download.assert_not_called()
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_download_video_reextracts_cached_info(self, mock_ydl_class, downloader, tmp_path):
+        """Test that cached info (with possibly expired stream URLs) is re-extracted."""
+        url = "https://youtube.com/watch?v=123"
+        cached = {"id": "test_id", "title": "test_title", "ext": "mp4"}
+        with patch.object(downloader.cache, "get", return_value=cached):
+            info = downloader.extract_info(url)
+        assert info is cached
+
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl.extract_info.return_value = dict(cached)
+        output_path = tmp_path / "test_title_test_id.mp4"
+        output_path.touch()
+        mock_ydl.prepare_filename.return_value = str(output_path)
+
+        with patch("yt2audi.core.downloader.time.sleep") as mock_sleep:
+            result, _ = downloader.download_video(url, output_dir=tmp_path, info_dict=info)
+
+        assert result == output_path
+        mock_ydl.process_ie_result.assert_not_called()
+        mock_ydl.extract_info.assert_called_once_with(url, download=False)
+        mock_ydl.download.assert_called_once_with([url])
+        mock_sleep.assert_not_called()
+
+    def test_take_live_info_expires(self, downloader):
+        """Test that live info older than the stream-URL lifetime is not reused."""
+        info = {"id": "x"}
+        downloader._live_info["url"] = (info, 0.0)
+        with patch("yt2audi.core.downloader.time.monotonic", return_value=7200.0):
+            assert downloader._take_live_info("url", info) is None
+
+        downloader._live_info["url"] = (info, time.monotonic())
+        assert downloader._take_live_info("url", {"id": "x"}) is None
+        downloader._live_info["url"] = (info, time.monotonic())
+        assert downloader._take_live_info("url", info) is info
+        assert "url" not in downloader._live_info
+
     @patch("yt_dlp.YoutubeDL")
     @patch("yt2audi.utils.is_valid_url", return_value=True)
     def test_download_video_failure(self, mock_valid, mock_ydl_class, downloader, tmp_path):
@@ -97,7 +202,7 @@ class TestDownloader:
             mock_download.return_value = (Path("test.mp4"), {"id": "test"})
             result, info = await downloader.download_video_async("url")
             assert result == Path("test.mp4")
-            mock_download.assert_called_once_with("url", None, None)
+            mock_download.assert_called_once_with("url", None, None, None)
 
     @pytest.mark.asyncio
     async def test_download_batch_async(self, downloader, tmp_path):
@@ -144,3 +249,84 @@ class TestDownloader:
         
         urls = downloader.get_playlist_urls("url")
         assert urls == []
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_extract_info_uses_flat_extraction(self, mock_ydl_class, downloader):
+        """Test that extract_info uses the fast flat-extraction options."""
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl.extract_info.return_value = {"id": "abc"}
+
+        with patch.object(downloader.cache, "get", return_value=None), \
+             patch.object(downloader.cache, "set") as mock_set, \
+             patch.object(downloader, "_build_optimized_format_string") as mock_build:
+            info = downloader.extract_info("https://youtube.com/watch?v=abc")
+
+        assert info == {"id": "abc"}
+        opts = mock_ydl_class.call_args.args[0]
+        assert opts["skip_download"] is True
+        assert opts["extract_flat"] == "in_playlist"
+        assert opts["format"] == "bestaudio/best"
+        mock_build.assert_not_called()
+        mock_set.assert_called_once_with("https://youtube.com/watch?v=abc", {"id": "abc"})
+
+    @pytest.mark.asyncio
+    async def test_iter_download_batch_async_streams_in_completion_order(self, downloader, tmp_path):
+        """Test that finished downloads are yielded before slower ones complete."""
+        delays = {"slow": 0.05, "fast": 0.0, "fail": 0.0}
+
+        async def mock_dl_async(url, output_dir=None, progress_callback=None):
+            await asyncio.sleep(delays[url])
+            if url == "fail":
+                raise Exception("boom")
+            return tmp_path / f"{url}.mp4", {"id": url}
+
+        with patch.object(downloader, "download_video_async", side_effect=mock_dl_async):
+            ids = [
+                info["id"]
+                async for _, info in downloader.iter_download_batch_async(["slow", "fast", "fail"])
+            ]
+
+        assert ids == ["fast", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_iter_download_batch_async_bounds_in_flight(self, downloader, tmp_path):
+        """Test that no more than max_concurrent downloads run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def mock_dl_async(url, output_dir=None, progress_callback=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return tmp_path / f"{url}.mp4", {"id": url}
+
+        urls = [f"u{i}" for i in range(5)]
+        with patch.object(downloader, "download_video_async", side_effect=mock_dl_async):
+            results = [
+                r async for r in downloader.iter_download_batch_async(urls, max_concurrent=2)
+            ]
+
+        assert len(results) == 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_iter_download_batch_async_throttles_progress(self, downloader, tmp_path):
+        """Test that rapid progress updates are throttled but 'finished' always passes."""
+        received = []
+
+        async def mock_dl_async(url, output_dir=None, progress_callback=None):
+            for _ in range(5):
+                progress_callback({"status": "downloading"})
+            progress_callback({"status": "finished"})
+            return tmp_path / f"{url}.mp4", {"id": url}
+
+        with patch.object(downloader, "download_video_async", side_effect=mock_dl_async):
+            async for _ in downloader.iter_download_batch_async(
+                ["a"], progress_callback=lambda url, d: received.append((url, d["status"]))
+            ):
+                pass
+
+        assert received == [("a", "downloading"), ("a", "finished")]
@@ -7,8 +7,9 @@ from yt2audi.core.downloader import Downloader
 from yt2audi.exceptions import DownloadError
 
 @pytest.fixture
-def downloader(sample_profile):
-    return Downloader(sample_profile)
+def downloader(sample_profile, tmp_path):
+    with patch("yt2audi.core.downloader.get_config_dir", return_value=tmp_path):
+        return Downloader(sample_profile)
 
 class TestDownloaderExtended:
     """Extended tests for Downloader coverage."""
@@ -54,13 +55,14 @@ class TestDownloaderExtended:
         out_dir.mkdir()
         (out_dir / "vid1.mp4").touch()
         (out_dir / "vid2.mp4").touch()
+        (out_dir / "vid1.jpg").touch()
+        (out_dir / "folder.mp4").mkdir()
         
-        # We need to patch pathlib glob or rely on actual files. 
-        # Since implementation uses output_dir.glob("*"), we use real tmp_path.
+        # The implementation scans the real directory, so we use real tmp_path.
         
         results = downloader.download_playlist("https://playlist", output_dir=out_dir)
         
-        assert len(results) == 2
+        assert results == [out_dir / "vid1.mp4", out_dir / "vid2.mp4"]
         mock_ydl.download.assert_called_once()
         # Verify opts include playlistend if set
         downloader.download_config.playlist_end = 5
@@ -97,3 +99,156 @@ class TestDownloaderExtended:
         
         with pytest.raises(DownloadError, match="Failed to download playlist"):
             downloader.download_playlist("https://playlist", output_dir=tmp_path)
+
+    @patch("yt2audi.core.downloader.time.sleep")
+    def test_download_video_retries_then_succeeds(self, mock_sleep, downloader, tmp_path):
+        """Test that transient download errors are retried with backoff."""
+        expected = (tmp_path / "video.mp4", {"id": "1"})
+        with patch.object(
+            downloader,
+            "_download_video_once",
+            side_effect=[DownloadError("boom"), ConnectionError("reset"), expected],
+        ) as mock_once:
+            result = downloader.download_video("https://youtube.com/watch?v=1", tmp_path)
+
+        assert result == expected
+        assert mock_once.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [4, 8]
+
+    @patch("yt2audi.core.downloader.time.sleep")
+    @patch("yt2audi.core.downloader.is_valid_url", return_value=True)
+    def test_download_video_validates_url_once(self, mock_valid, mock_sleep, downloader, tmp_path):
+        """Test that retries do not re-validate the URL."""
+        expected = (tmp_path / "video.mp4", {"id": "1"})
+        with patch.object(
+            downloader, "_download_video_once", side_effect=[DownloadError("boom"), expected]
+        ):
+            downloader.download_video("https://youtube.com/watch?v=1", tmp_path)
+
+        mock_valid.assert_called_once_with("https://youtube.com/watch?v=1")
+
+    @patch("yt2audi.core.downloader.time.sleep")
+    def test_download_video_gives_up_after_max_attempts(self, mock_sleep, downloader, tmp_path):
+        """Test that the last error is re-raised once attempts are exhausted."""
+        with patch.object(
+            downloader, "_download_video_once", side_effect=DownloadError("boom")
+        ) as mock_once:
+            with pytest.raises(DownloadError, match="boom"):
+                downloader.download_video("https://youtube.com/watch?v=1", tmp_path)
+
+        assert mock_once.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    def test_download_batch_runs_on_worker_pool(self, downloader, tmp_path):
+        """Test that sync batches download concurrently and skip failures."""
+        def mock_download(url, output_dir=None, progress_callback=None):
+            if url == "bad":
+                raise DownloadError("boom")
+            return tmp_path / f"{url}.mp4", {"id": url}
+
+        with patch.object(downloader, "download_video", side_effect=mock_download):
+            results = downloader.download_batch(["a", "bad", "b"], tmp_path, max_concurrent=2)
+
+        assert sorted(info["id"] for _, info in results) == ["a", "b"]
+        assert downloader._pool._max_workers == 2
+        downloader.close()
+
+    def test_format_string_is_cached(self, downloader):
+        """Test that the format string is built once per set of profile inputs."""
+        first = downloader._build_optimized_format_string()
+        with patch("yt2audi.core.downloader.logger") as mock_logger:
+            assert downloader._build_optimized_format_string() is first
+            mock_logger.debug.assert_not_called()
+
+        downloader.profile.video.max_height = 1080
+        assert downloader._build_optimized_format_string() != first
+
+    @pytest.mark.asyncio
+    async def test_async_calls_share_bounded_pool(self, downloader):
+        """Test that async wrappers reuse one bounded worker pool."""
+        with patch.object(downloader, "extract_info", return_value={"id": "1"}):
+            await downloader.extract_info_async("https://youtube.com/watch?v=1")
+            pool = downloader._pool
+            await downloader.extract_info_async("https://youtube.com/watch?v=2")
+
+        assert pool is not None
+        assert downloader._pool is pool
+        assert pool._max_workers == 3
+
+        # Batch downloads resize the pool to the requested concurrency
+        assert downloader._get_pool(5)._max_workers == 5
+
+        downloader.close()
+        assert downloader._pool is None
+
+    def test_pool_size_from_constructor(self, sample_profile, tmp_path):
+        """Test that the default pool size can be set per downloader."""
+        with patch("yt2audi.core.downloader.get_config_dir", return_value=tmp_path):
+            downloader = Downloader(sample_profile, max_workers=8)
+
+        assert downloader._get_pool()._max_workers == 8
+        downloader.close()
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_youtubedl_instance_reused_across_downloads(self, mock_ydl_class, downloader, tmp_path):
+        """Test that one YoutubeDL is reused for repeated calls with the same options."""
+        mock_ydl = MagicMock()
+        mock_ydl.params = {"outtmpl": {"default": "first"}}
+        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl.extract_info.return_value = {"id": "1"}
+        output_path = tmp_path / "video.mp4"
+        output_path.touch()
+        mock_ydl.prepare_filename.return_value = str(output_path)
+
+        hook = MagicMock()
+        downloader.download_video("https://youtube.com/watch?v=1", tmp_path, hook)
+        other_dir = tmp_path / "other"
+        downloader.download_video("https://youtube.com/watch?v=2", other_dir)
+
+        mock_ydl_class.assert_called_once()
+        assert mock_ydl.params["outtmpl"]["default"] == str(other_dir / "%(title)s_%(id)s.%(ext)s")
+
+        # The stable hook forwards only to the active call's callback
+        dispatch = mock_ydl_class.call_args.args[0]["progress_hooks"][0]
+        dispatch({"status": "downloading"})
+        hook.assert_not_called()
+
+        downloader.close()
+        mock_ydl_class.return_value.__exit__.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_extract_info_async_single_flight(self, downloader):
+        """Test that concurrent extractions of the same URL hit yt-dlp once."""
+        import asyncio
+        import threading
+
+        release = threading.Event()
+
+        def slow_extract(url):
+            release.wait(5)
+            return {"id": url[-1]}
+
+        with patch.object(downloader, "extract_info", side_effect=slow_extract) as mock_extract:
+            url = "https://youtube.com/watch?v=1"
+            pending = asyncio.gather(
+                downloader.extract_info_async(url), downloader.extract_info_async(url)
+            )
+            await asyncio.sleep(0)
+            release.set()
+            first, second = await pending
+
+        assert first == second == {"id": "1"}
+        mock_extract.assert_called_once_with(url)
+        assert downloader._inflight == {}
+        downloader.close()
+
+    @pytest.mark.parametrize(
+        ("max_height", "expected"),
+        [(360, 480), (480, 480), (481, 720), (540, 720), (576, 720), (720, 720),
+         (1080, 1080), (1440, 1440)],
+    )
+    def test_download_height_ladder(self, downloader, max_height, expected):
+        """Test mapping of target height to download height, including boundaries."""
+        downloader.profile.video.max_height = max_height
+        fmt = downloader._build_optimized_format_string()
+        assert fmt.startswith(f"bestvideo[height<={expected}]")
@@ -0,0 +1,25 @@
+"""Unit tests for event loop setup."""
+
+from unittest.mock import MagicMock, patch
+
+from yt2audi.utils import eventloop
+from yt2audi.utils.eventloop import install_uvloop
+
+
+class TestInstallUvloop:
+    """Test suite for install_uvloop."""
+
+    def test_without_uvloop(self):
+        """Test that the default loop is kept when uvloop is missing."""
+        with patch.object(eventloop, "uvloop", None), \
+             patch("asyncio.set_event_loop_policy") as mock_set_policy:
+            assert install_uvloop() is False
+            mock_set_policy.assert_not_called()
+
+    def test_with_uvloop(self):
+        """Test that the uvloop policy is installed when available."""
+        fake_uvloop = MagicMock()
+        with patch.object(eventloop, "uvloop", fake_uvloop), \
+             patch("asyncio.set_event_loop_policy") as mock_set_policy:
+            assert install_uvloop() is True
+            mock_set_policy.assert_called_once_with(fake_uvloop.EventLoopPolicy.return_value)
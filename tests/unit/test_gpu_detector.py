@@ -1,6 +1,8 @@
 """Unit tests for GPU detection logic."""
 
 import subprocess
+import threading
+from collections.abc import Iterator
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -8,19 +10,32 @@ import pytest
 from yt2audi.core.gpu_detector import (
     GPUInfo,
     GPUVendor,
+    _scan_pci_vendors,
     check_ffmpeg_encoder,
     detect_amd_gpu,
     detect_available_gpus,
+    detect_available_gpus_async,
     detect_intel_gpu,
     detect_nvidia_gpu,
+    get_encoder_codec,
     get_encoder_extra_args,
     get_encoder_preset,
+    get_hwaccel_args,
+    reset_gpu_cache,
     select_best_encoder,
 )
 from yt2audi.exceptions import GPUDetectionError
 from yt2audi.models.profile import EncoderType
 
 
+@pytest.fixture(autouse=True)
+def clear_gpu_cache() -> Iterator[None]:
+    """Start every test with empty detection caches and FFmpeg on PATH."""
+    reset_gpu_cache()
+    with patch("yt2audi.core.gpu_detector.shutil.which", return_value="/usr/bin/ffmpeg"):
+        yield
+
+
 class TestGPUInfo:
     """Test suite for GPUInfo class."""
 
@@ -94,6 +109,35 @@ class TestDetectNvidiaGPU:
 
         assert result is None
 
+    @patch("yt2audi.core.gpu_detector.atexit")
+    @patch("yt2audi.core.gpu_detector._nvml_initialized", False)
+    @patch("yt2audi.core.gpu_detector.nvml")
+    def test_nvml_initialized_once(self, mock_nvml: Mock, mock_atexit: Mock) -> None:
+        """Test that NVML is initialized once and shut down only at exit."""
+        mock_nvml.nvmlDeviceGetCount.return_value = 1
+        mock_nvml.nvmlDeviceGetName.return_value = "NVIDIA RTX 4090"
+
+        detect_nvidia_gpu()
+        detect_nvidia_gpu()
+
+        mock_nvml.nvmlInit.assert_called_once()
+        mock_nvml.nvmlShutdown.assert_not_called()
+        mock_atexit.register.assert_called_once_with(mock_nvml.nvmlShutdown)
+
+    @patch("yt2audi.core.gpu_detector._NVML_INIT_TIMEOUT", 0.05)
+    @patch("yt2audi.core.gpu_detector._nvml_initialized", False)
+    @patch("yt2audi.core.gpu_detector.nvml")
+    def test_nvml_init_hang_times_out(self, mock_nvml: Mock) -> None:
+        """Test that a hanging nvmlInit is abandoned instead of blocking detection."""
+        release = threading.Event()
+        mock_nvml.nvmlInit.side_effect = lambda: release.wait(5)
+
+        try:
+            assert detect_nvidia_gpu() is None
+            mock_nvml.nvmlDeviceGetCount.assert_not_called()
+        finally:
+            release.set()
+
     @patch("yt2audi.core.gpu_detector.nvml", None)
     def test_detect_nvidia_gpu_import_error(self) -> None:
         """Test NVIDIA GPU detection when py3nvml not available."""
@@ -101,34 +145,62 @@ class TestDetectNvidiaGPU:
         # Should handle import error gracefully
         assert result is None
 
+    def test_py3nvml_imported_lazily(self) -> None:
+        """Test that py3nvml is only imported by the first NVIDIA probe."""
+        from yt2audi.core import gpu_detector
+
+        with patch.object(gpu_detector, "nvml", gpu_detector._NVML_NOT_LOADED), \
+             patch.dict("sys.modules", {"py3nvml": None, "py3nvml.py3nvml": None}):
+            assert gpu_detector.nvml is gpu_detector._NVML_NOT_LOADED
+            assert detect_nvidia_gpu() is None
+            # A failed import is remembered as "not installed"
+            assert gpu_detector.nvml is None
+
+
+class TestScanPciVendors:
+    """Test suite for sysfs PCI vendor scanning."""
+
+    def test_scan_pci_vendors(self, tmp_path) -> None:
+        """Test mapping DRM card vendor IDs to GPU vendors."""
+        for card, vendor_id in [("card0", "0x8086\n"), ("card1", "0x1002\n"), ("card2", "0x1af4\n")]:
+            device = tmp_path / card / "device"
+            device.mkdir(parents=True)
+            (device / "vendor").write_text(vendor_id)
+
+        with patch("yt2audi.core.gpu_detector._DRM_CLASS_DIR", tmp_path):
+            assert _scan_pci_vendors() == {"intel", "amd"}
+
+    def test_scan_pci_vendors_no_sysfs(self, tmp_path) -> None:
+        """Test that a missing sysfs tree yields no vendors."""
+        with patch("yt2audi.core.gpu_detector._DRM_CLASS_DIR", tmp_path / "missing"):
+            assert _scan_pci_vendors() == frozenset()
+
 
 class TestDetectAMDGPU:
     """Test suite for AMD GPU detection."""
 
-    @patch("yt2audi.core.gpu_detector.GPUtil")
-    def test_detect_amd_gpu_via_gputil(self, mock_gputil: Mock) -> None:
-        """Test AMD GPU detection via GPUtil."""
-        # Mock GPU object
-        mock_gpu = MagicMock()
-        mock_gpu.name = "AMD Radeon RX 6800"
-        mock_gputil.getGPUs.return_value = [mock_gpu]
+    @patch("yt2audi.core.gpu_detector.check_ffmpeg_encoder")
+    @patch("yt2audi.core.gpu_detector._scan_pci_vendors")
+    def test_detect_amd_gpu_via_pci(self, mock_scan: Mock, mock_check_encoder: Mock) -> None:
+        """Test AMD GPU detection via PCI vendor ID."""
+        mock_scan.return_value = frozenset({"amd"})
 
         result = detect_amd_gpu()
 
         assert result is not None
         assert result.vendor == GPUVendor.AMD
-        assert "6800" in result.name
+        mock_check_encoder.assert_not_called()
 
     @patch("yt2audi.core.gpu_detector.check_ffmpeg_encoder")
-    @patch("yt2audi.core.gpu_detector.GPUtil")
+    @patch("yt2audi.core.gpu_detector._scan_pci_vendors")
     def test_detect_amd_gpu_via_ffmpeg_fallback(
         self,
-        mock_gputil: Mock,
+        mock_scan: Mock,
         mock_check_encoder: Mock,
     ) -> None:
         """Test AMD GPU detection via FFmpeg fallback."""
-        # GPUtil fails
-        mock_gputil.getGPUs.side_effect = Exception("GPUtil not available")
+        # No AMD device on the PCI bus (or not Linux)
+        mock_scan.return_value = frozenset()
         # FFmpeg encoder check succeeds
         mock_check_encoder.return_value = True
 
@@ -139,14 +211,14 @@ class TestDetectAMDGPU:
         assert "via FFmpeg" in result.name
 
     @patch("yt2audi.core.gpu_detector.check_ffmpeg_encoder")
-    @patch("yt2audi.core.gpu_detector.GPUtil")
+    @patch("yt2audi.core.gpu_detector._scan_pci_vendors")
     def test_detect_amd_gpu_not_found(
         self,
-        mock_gputil: Mock,
+        mock_scan: Mock,
         mock_check_encoder: Mock,
     ) -> None:
         """Test AMD GPU detection when no GPU found."""
-        mock_gputil.getGPUs.return_value = []
+        mock_scan.return_value = frozenset({"intel"})
         mock_check_encoder.return_value = False
 
         result = detect_amd_gpu()
@@ -157,12 +229,10 @@ class TestDetectAMDGPU:
 class TestDetectIntelGPU:
     """Test suite for Intel GPU detection."""
 
-    @patch("yt2audi.core.gpu_detector.GPUtil")
-    def test_detect_intel_gpu_via_gputil(self, mock_gputil: Mock) -> None:
-        """Test Intel GPU detection via GPUtil."""
-        mock_gpu = MagicMock()
-        mock_gpu.name = "Intel UHD Graphics 630"
-        mock_gputil.getGPUs.return_value = [mock_gpu]
+    @patch("yt2audi.core.gpu_detector._scan_pci_vendors")
+    def test_detect_intel_gpu_via_pci(self, mock_scan: Mock) -> None:
+        """Test Intel GPU detection via PCI vendor ID."""
+        mock_scan.return_value = frozenset({"intel"})
 
         result = detect_intel_gpu()
 
@@ -171,14 +241,14 @@ class TestDetectIntelGPU:
         assert "Intel" in result.name
 
     @patch("yt2audi.core.gpu_detector.check_ffmpeg_encoder")
-    @patch("yt2audi.core.gpu_detector.GPUtil")
+    @patch("yt2audi.core.gpu_detector._scan_pci_vendors")
     def test_detect_intel_gpu_via_ffmpeg_fallback(
         self,
-        mock_gputil: Mock,
+        mock_scan: Mock,
         mock_check_encoder: Mock,
     ) -> None:
         """Test Intel GPU detection via FFmpeg fallback."""
-        mock_gputil.getGPUs.side_effect = Exception("GPUtil error")
+        mock_scan.return_value = frozenset()
         mock_check_encoder.return_value = True
 
         result = detect_intel_gpu()
@@ -215,6 +285,62 @@ class TestCheckFFmpegEncoder:
 
         assert result is False
 
+    @patch("subprocess.run")
+    def test_check_ffmpeg_encoder_is_cached(self, mock_run: Mock) -> None:
+        """Test that one `ffmpeg -encoders` run answers every encoder check."""
+        mock_run.return_value = Mock(
+            returncode=0,
+            stdout=(
+                "Encoders:\n"
+                " V..... = Video\n"
+                " ------\n"
+                " V....D libx264              libx264 H.264 / AVC\n"
+                " V..... h264_nvenc           NVIDIA NVENC H.264 encoder\n"
+            ),
+        )
+
+        assert check_ffmpeg_encoder("h264_nvenc") is True
+        assert check_ffmpeg_encoder("libx264") is True
+        assert check_ffmpeg_encoder("h264_qsv") is False
+        # Substrings of listed names are not encoders
+        assert check_ffmpeg_encoder("h264") is False
+        mock_run.assert_called_once()
+
+    @patch("subprocess.run")
+    def test_check_ffmpeg_encoder_failure_not_cached(self, mock_run: Mock) -> None:
+        """Test that a failed probe is retried on the next check."""
+        mock_run.side_effect = [
+            FileNotFoundError("ffmpeg not found"),
+            Mock(returncode=0, stdout=" V..... libx264   libx264 H.264 / AVC\n"),
+        ]
+
+        assert check_ffmpeg_encoder("libx264") is False
+        assert check_ffmpeg_encoder("libx264") is True
+
+    @patch("subprocess.run")
+    def test_check_ffmpeg_encoder_missing_binary(self, mock_run: Mock) -> None:
+        """Test that a missing ffmpeg binary spawns nothing and is not cached."""
+        with patch("yt2audi.core.gpu_detector.shutil.which", return_value=None) as mock_which:
+            assert check_ffmpeg_encoder("libx264") is False
+            assert check_ffmpeg_encoder("h264_nvenc") is False
+
+        assert mock_which.call_count == 2
+        mock_run.assert_not_called()
+
+        # FFmpeg installed later is picked up
+        mock_run.return_value = Mock(returncode=0, stdout=" V....D libx264              libx264 H.264\n")
+        with patch("yt2audi.core.gpu_detector.shutil.which", return_value="/usr/bin/ffmpeg"):
+            assert check_ffmpeg_encoder("libx264") is True
+
+    @patch("subprocess.run")
+    def test_check_ffmpeg_encoder_uses_resolved_binary(self, mock_run: Mock) -> None:
+        """Test that the probe runs the binary found on PATH."""
+        mock_run.return_value = Mock(returncode=0, stdout=" V..... libx264   libx264 H.264 / AVC\n")
+
+        check_ffmpeg_encoder("libx264")
+
+        assert mock_run.call_args.args[0][0] == "/usr/bin/ffmpeg"
+
     @patch("subprocess.run")
     def test_check_ffmpeg_encoder_timeout(self, mock_run: Mock) -> None:
         """Test FFmpeg encoder check timeout."""
@@ -276,6 +402,48 @@ class TestDetectAvailableGPUs:
 
         assert len(result) == 0
 
+    @patch("yt2audi.core.gpu_detector.detect_intel_gpu")
+    @patch("yt2audi.core.gpu_detector.detect_amd_gpu")
+    @patch("yt2audi.core.gpu_detector.detect_nvidia_gpu")
+    def test_detect_probes_run_concurrently(
+        self,
+        mock_nvidia: Mock,
+        mock_amd: Mock,
+        mock_intel: Mock,
+    ) -> None:
+        """Test that vendor probes overlap instead of running one after another."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def probe() -> None:
+            # Only passes if all three probes are running at the same time
+            barrier.wait()
+            return None
+
+        mock_nvidia.side_effect = probe
+        mock_amd.side_effect = probe
+        mock_intel.side_effect = probe
+
+        assert detect_available_gpus() == []
+
+    @pytest.mark.asyncio
+    @patch("yt2audi.core.gpu_detector.detect_intel_gpu")
+    @patch("yt2audi.core.gpu_detector.detect_amd_gpu")
+    @patch("yt2audi.core.gpu_detector.detect_nvidia_gpu")
+    async def test_detect_available_gpus_async(
+        self,
+        mock_nvidia: Mock,
+        mock_amd: Mock,
+        mock_intel: Mock,
+    ) -> None:
+        """Test async detection returns the same GPUs as the sync call."""
+        mock_nvidia.return_value = GPUInfo(GPUVendor.NVIDIA, "RTX 4090", True)
+        mock_amd.return_value = None
+        mock_intel.return_value = None
+
+        result = await detect_available_gpus_async()
+
+        assert [gpu.vendor for gpu in result] == [GPUVendor.NVIDIA]
+
 
 class TestSelectBestEncoder:
     """Test suite for encoder selection logic."""
@@ -344,6 +512,74 @@ class TestSelectBestEncoder:
         with pytest.raises(GPUDetectionError, match="No video encoder available"):
             select_best_encoder(priority)
 
+    @patch("yt2audi.core.gpu_detector.check_ffmpeg_encoder")
+    @patch("yt2audi.core.gpu_detector.detect_available_gpus")
+    def test_select_best_encoder_is_cached(
+        self,
+        mock_detect: Mock,
+        mock_check: Mock,
+    ) -> None:
+        """Test that repeated selections reuse the first result."""
+        mock_detect.return_value = []
+        mock_check.return_value = True
+
+        priority = [EncoderType.NVENC_H264, EncoderType.LIBX264]
+
+        assert select_best_encoder(priority) == EncoderType.LIBX264
+        assert select_best_encoder(list(priority)) == EncoderType.LIBX264
+        mock_detect.assert_called_once()
+
+        reset_gpu_cache()
+        select_best_encoder(priority)
+        assert mock_detect.call_count == 2
+
+    @patch("yt2audi.core.gpu_detector.logger")
+    @patch("yt2audi.core.gpu_detector.check_ffmpeg_encoder", return_value=True)
+    @patch("yt2audi.core.gpu_detector.detect_available_gpus")
+    def test_select_best_encoder_logs_only_choice_at_info(
+        self,
+        mock_detect: Mock,
+        mock_check: Mock,
+        mock_logger: Mock,
+    ) -> None:
+        """Test that probe details are logged at debug and only the choice at info."""
+        mock_detect.return_value = [GPUInfo(GPUVendor.NVIDIA, "RTX 4090", True)]
+
+        select_best_encoder([EncoderType.NVENC_H264, EncoderType.LIBX264])
+
+        mock_logger.info.assert_called_once_with("encoder_selected", encoder="h264_nvenc")
+        debug_events = [c.args[0] for c in mock_logger.debug.call_args_list]
+        assert "gpus_detected" in debug_events
+
+    @patch("yt2audi.core.gpu_detector.check_ffmpeg_encoder")
+    @patch("yt2audi.core.gpu_detector.detect_available_gpus")
+    def test_select_best_encoder_auto_skips_probing(
+        self,
+        mock_detect: Mock,
+        mock_check: Mock,
+    ) -> None:
+        """Test that AUTO first in priority is returned without any GPU or FFmpeg probe."""
+        result = select_best_encoder([EncoderType.AUTO, EncoderType.NVENC_H264])
+
+        assert result == EncoderType.AUTO
+        mock_detect.assert_not_called()
+        mock_check.assert_not_called()
+
+    @patch("yt2audi.core.gpu_detector.check_ffmpeg_encoder")
+    @patch("yt2audi.core.gpu_detector.detect_available_gpus")
+    def test_select_best_encoder_auto_as_fallback(
+        self,
+        mock_detect: Mock,
+        mock_check: Mock,
+    ) -> None:
+        """Test that AUTO later in priority is used when earlier GPUs are missing."""
+        mock_detect.return_value = []
+        mock_check.side_effect = lambda name: name == "libx264"
+
+        result = select_best_encoder([EncoderType.NVENC_H264, EncoderType.AUTO])
+
+        assert result == EncoderType.AUTO
+
 
 class TestGetEncoderPreset:
     """Test suite for encoder preset mapping."""
@@ -399,3 +635,11 @@ class TestGetEncoderExtraArgs:
         args = get_encoder_extra_args(EncoderType.LIBX264, quality_cq=23)
         assert "-crf:v:0" in args
         assert "23" in args
+
+    def test_get_auto_args(self) -> None:
+        """Test that AUTO decodes via -hwaccel auto and encodes with libx264."""
+        assert get_encoder_extra_args(EncoderType.AUTO, quality_cq=23) == ["-crf:v:0", "23"]
+        assert get_encoder_codec(EncoderType.AUTO) == "libx264"
+        assert get_hwaccel_args(EncoderType.AUTO) == ["-hwaccel", "auto"]
+        assert get_encoder_codec(EncoderType.NVENC_H264) == "h264_nvenc"
+        assert get_hwaccel_args(EncoderType.NVENC_H264) == []
@@ -4,7 +4,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-from yt2audi.core.history import HistoryManager
+from yt2audi.core.history import HistoryManager, _BloomFilter
 
 class TestHistoryManager:
     """Test suite for HistoryManager class."""
@@ -20,6 +20,17 @@ class TestHistoryManager:
         assert hm.is_processed("id3")
         assert not hm.is_processed("id4")
 
+    def test_init_load_empty_and_crlf(self, tmp_path):
+        """Test loading an empty file and Windows line endings."""
+        h_file = tmp_path / "history.txt"
+        h_file.write_bytes(b"")
+        assert not HistoryManager(h_file).is_processed("id1")
+
+        h_file.write_bytes(b"id1\r\nid2\r\n")
+        hm = HistoryManager(h_file)
+        assert hm.is_processed("id1")
+        assert hm.is_processed("id2")
+
     def test_mark_completed(self, tmp_path):
         """Test marking a video as completed."""
         h_file = tmp_path / "history.txt"
@@ -29,6 +40,7 @@ class TestHistoryManager:
         assert hm.is_processed("new_id")
         
         # Verify it was appended to file
+        hm.flush()
         content = h_file.read_text()
         assert "new_id" in content
 
@@ -48,3 +60,114 @@ class TestHistoryManager:
         mock_get_config.return_value = tmp_path
         hm = HistoryManager()
         assert hm.history_file == tmp_path / "history.txt"
+
+    def test_file_kept_open_between_writes(self, tmp_path):
+        """Test that IDs are appended through one handle and survive close/reopen."""
+        h_file = tmp_path / "history.txt"
+
+        with HistoryManager(h_file) as hm:
+            with patch("builtins.open", wraps=open) as mock_open:
+                hm.mark_completed("a")
+                hm.mark_completed("b")
+                hm.mark_completed("a")
+            assert mock_open.call_count == 1
+            hm.flush()
+            assert h_file.read_text() == "a\nb\n"
+
+        assert hm._fh is None
+        hm.mark_completed("c")
+        hm.close()
+        assert h_file.read_text() == "a\nb\nc\n"
+
+    def test_clear_closes_open_file(self, tmp_path):
+        """Test that clearing after writes removes the file and restarts cleanly."""
+        h_file = tmp_path / "history.txt"
+        hm = HistoryManager(h_file)
+        hm.mark_completed("a")
+
+        hm.clear()
+        assert not h_file.exists()
+
+        hm.mark_completed("b")
+        hm.close()
+        assert h_file.read_text() == "b\n"
+
+    def test_unseen_ids_skip_disk(self, tmp_path):
+        """Test that IDs missing from the Bloom filter never trigger a file scan."""
+        h_file = tmp_path / "history.txt"
+        h_file.write_text("id1\nid2\n")
+        hm = HistoryManager(h_file)
+
+        assert hm._processed_ids == set()
+        with patch.object(hm, "_file_contains", wraps=hm._file_contains) as mock_scan:
+            assert not hm.is_processed("other")
+            mock_scan.assert_not_called()
+
+            # Hits are confirmed once, then served from memory
+            assert hm.is_processed("id1")
+            assert hm.is_processed("id1")
+            mock_scan.assert_called_once_with("id1")
+
+    def test_file_scanned_once_for_many_hits(self, tmp_path):
+        """Test that distinct Bloom filter hits share a single read of the file."""
+        h_file = tmp_path / "history.txt"
+        h_file.write_text("id1\nid2\nid3\n")
+        hm = HistoryManager(h_file)
+
+        with patch.object(hm, "_read_ids", wraps=hm._read_ids) as mock_read:
+            assert hm.is_processed("id1")
+            assert hm.is_processed("id2")
+            assert hm.is_processed("id3")
+
+        mock_read.assert_called_once()
+
+    @patch("yt2audi.core.history._FLUSH_EVERY", 3)
+    def test_writes_are_batched(self, tmp_path):
+        """Test that IDs are buffered and written together once the batch fills."""
+        h_file = tmp_path / "history.txt"
+        hm = HistoryManager(h_file)
+
+        hm.mark_completed("a")
+        hm.mark_completed("b")
+        assert h_file.read_text() == ""
+        assert hm.is_processed("a")
+
+        hm.mark_completed("c")
+        assert h_file.read_text() == "a\nb\nc\n"
+
+        hm.mark_completed("d")
+        with patch("yt2audi.core.history.os.fsync") as mock_fsync:
+            hm.close()
+        mock_fsync.assert_called_once()
+        assert h_file.read_text() == "a\nb\nc\nd\n"
+
+    @patch("yt2audi.core.history._FLUSH_INTERVAL", 0.01)
+    def test_pending_ids_flushed_after_interval(self, tmp_path):
+        """Test that a lone completion reaches disk without an explicit flush."""
+        import time
+
+        h_file = tmp_path / "history.txt"
+        hm = HistoryManager(h_file)
+        hm.mark_completed("a")
+
+        deadline = time.monotonic() + 5
+        while h_file.read_text() != "a\n" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert h_file.read_text() == "a\n"
+        assert hm._flush_timer is None
+        hm.close()
+
+
+class TestBloomFilter:
+    """Test suite for the history Bloom filter."""
+
+    def test_no_false_negatives(self):
+        """Test that every added item is reported as present."""
+        bloom = _BloomFilter(capacity=1000, error_rate=1e-3)
+        items = [f"video{i:05d}".encode() for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+        false_positives = sum(f"other{i:05d}".encode() in bloom for i in range(1000))
+        assert false_positives < 20
@@ -0,0 +1,68 @@
+"""Unit tests for the Job model."""
+
+from datetime import UTC
+from pathlib import Path
+from unittest.mock import patch
+
+from yt2audi.models.job import Job, JobStatus, JobType
+
+
+def make_job() -> Job:
+    """Create a pending single-video job."""
+    return Job(job_type=JobType.SINGLE_VIDEO, url="https://youtu.be/abc", profile_name="audi")
+
+
+class TestJob:
+    """Test suite for Job state and timing."""
+
+    def test_timestamps_are_utc(self) -> None:
+        """Test that user-visible timestamps are timezone-aware UTC."""
+        job = make_job()
+        job.mark_downloading()
+        job.mark_completed([Path("out.mp4")])
+
+        assert job.created_at.tzinfo is UTC
+        assert job.started_at.tzinfo is UTC
+        assert job.completed_at.tzinfo is UTC
+        assert job.status == JobStatus.COMPLETED
+
+    def test_start_recorded_once(self) -> None:
+        """Test that a retried download keeps the original start."""
+        job = make_job()
+        assert job.elapsed_seconds() is None
+
+        with patch("yt2audi.models.job.time.monotonic_ns", return_value=1_000_000_000):
+            job.mark_downloading()
+        started_at = job.started_at
+
+        with patch("yt2audi.models.job.time.monotonic_ns", return_value=5_000_000_000):
+            job.mark_downloading()
+            assert job.started_at == started_at
+            assert job.elapsed_seconds() == 4.0
+
+    def test_update_progress_estimates_eta(self) -> None:
+        """Test that a missing ETA is derived from monotonic elapsed time."""
+        job = make_job()
+        with patch("yt2audi.models.job.time.monotonic_ns", return_value=0):
+            job.mark_downloading()
+
+        with patch("yt2audi.models.job.time.monotonic_ns", return_value=30_000_000_000):
+            job.update_progress(25.0, "Downloading")
+        assert job.eta_seconds == 90
+
+        job.update_progress(50.0, "Downloading", eta=7)
+        assert job.eta_seconds == 7
+
+    def test_empty_collections_not_allocated(self) -> None:
+        """Test that idle jobs share empty defaults until written."""
+        first, second = make_job(), make_job()
+        assert first.final_paths == ()
+        assert first.final_paths is second.final_paths
+        assert first.extra_data is None
+
+        first.set_extra("playlist_index", 3)
+        first.mark_completed([Path("a.mp4"), Path("b.mp4")])
+
+        assert first.extra_data == {"playlist_index": 3}
+        assert first.final_paths == (Path("a.mp4"), Path("b.mp4"))
+        assert second.extra_data is None
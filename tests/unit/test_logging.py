@@ -1,7 +1,7 @@
 """Unit tests for logging configuration."""
 
 from unittest.mock import patch, MagicMock
-from yt2audi.utils.logging import configure_logging, get_logger
+from yt2audi.utils.logging import Lazy, configure_logging, get_logger
 from yt2audi.models.profile import LoggingConfig, LogLevel, LogFormat
 
 class TestLogging:
@@ -27,6 +27,8 @@ class TestLogging:
         args, kwargs = mock_structlog.call_args
         processors = kwargs["processors"]
         assert any("ConsoleRenderer" in str(p) for p in processors)
+        assert any("StackInfoRenderer" in str(p) for p in processors)
+        assert any("set_exc_info" in str(p) for p in processors)
 
     @patch("yt2audi.config.expand_path")
     @patch("logging.basicConfig")
@@ -45,8 +47,58 @@ class TestLogging:
         args, kwargs = mock_structlog.call_args
         processors = kwargs["processors"]
         assert any("JSONRenderer" in str(p) for p in processors)
+        assert not any("StackInfoRenderer" in str(p) for p in processors)
+        assert not any("set_exc_info" in str(p) for p in processors)
+
+    @patch("yt2audi.config.expand_path")
+    @patch("logging.basicConfig")
+    @patch("structlog.configure")
+    def test_configure_logging_json_uses_orjson(self, mock_structlog, mock_logging, mock_expand, tmp_path):
+        """Test that orjson serializes JSON logs as text when installed."""
+        import structlog
+
+        mock_expand.return_value = tmp_path / "test.log"
+        config = LoggingConfig(level=LogLevel.INFO, format=LogFormat.JSON, log_file="test.log")
+        fake_orjson = MagicMock()
+        fake_orjson.dumps.return_value = b'{"event":"x"}'
+
+        with patch("yt2audi.utils.logging.orjson", fake_orjson):
+            configure_logging(config)
+            kwargs = mock_structlog.call_args.kwargs
+            assert kwargs["processors"][-1]._dumps({"event": "x"}) == '{"event":"x"}'
+        assert isinstance(kwargs["logger_factory"], structlog.PrintLoggerFactory)
+
+        with patch("yt2audi.utils.logging.orjson", None):
+            configure_logging(config)
+        kwargs = mock_structlog.call_args.kwargs
+        assert isinstance(kwargs["logger_factory"], structlog.PrintLoggerFactory)
 
     def test_get_logger(self):
         """Test get_logger returns a structlog logger."""
         logger = get_logger("test")
         assert logger is not None
+        assert get_logger("test") is logger
+        assert get_logger("other") is not logger
+
+    def test_lazy_value_only_built_when_rendered(self):
+        """Test that Lazy values are skipped for filtered events."""
+        import io
+        import logging
+
+        import structlog
+
+        out = io.StringIO()
+        logger = structlog.wrap_logger(
+            structlog.PrintLogger(out),
+            wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+            processors=[structlog.processors.JSONRenderer()],
+        )
+        build = MagicMock(return_value=["a", "b"])
+
+        logger.debug("suppressed", value=Lazy(build))
+        build.assert_not_called()
+
+        logger.info("emitted", value=Lazy(build))
+        build.assert_called_once()
+        assert '"value": ["a", "b"]' in out.getvalue()
+        assert repr(Lazy(lambda: "x y")) == "x y"
@@ -2,10 +2,12 @@
 
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 from yt2audi.utils.paths import (
     sanitize_filename,
     get_temp_dir,
     ensure_extension,
+    find_thumbnail,
     get_unique_path
 )
 
@@ -19,6 +21,8 @@ class TestPaths:
         assert sanitize_filename("  spaces and dots.  ") == "spaces_and_dots"
         assert sanitize_filename("🚀 emoji 🚀") == "emoji"
         assert sanitize_filename("") == "video"
+        assert sanitize_filename('a<b>c:"d\\e|f') == "abcdef"
+        assert sanitize_filename("Café  Über") == "Caf_ber"
 
     def test_get_temp_dir(self):
         """Test getting temp directory."""
@@ -27,12 +31,18 @@ class TestPaths:
         assert temp_dir.name == "yt2audi"
         assert temp_dir.exists()
 
+        with patch("tempfile.gettempdir") as mock_gettempdir:
+            assert get_temp_dir() is temp_dir
+        mock_gettempdir.assert_not_called()
+
     def test_ensure_extension(self):
         """Test extension enforcement."""
         path = Path("video.mkv")
         assert ensure_extension(path, "mp4") == Path("video.mp4")
         assert ensure_extension(path, ".mp4") == Path("video.mp4")
         assert ensure_extension(Path("video.mp4"), "mp4") == Path("video.mp4")
+        assert ensure_extension(Path("video.MP4"), ".mp4") == Path("video.MP4")
+        assert ensure_extension(Path("video"), "mp4") == Path("video.mp4")
 
     def test_get_unique_path(self, tmp_path):
         """Test unique path generation."""
@@ -49,3 +59,26 @@ class TestPaths:
         # Exists twice
         unique1.touch()
         assert get_unique_path(base_path) == tmp_path / "video_2.mp4"
+
+    def test_get_unique_path_dense_collisions(self, tmp_path):
+        """Test that long runs of numbered copies are probed logarithmically."""
+        base_path = tmp_path / "video.mp4"
+        base_path.touch()
+        for i in range(1, 1000):
+            (tmp_path / f"video_{i}.mp4").touch()
+
+        with patch("pathlib.Path.exists", autospec=True, side_effect=Path.exists) as mock_exists:
+            assert get_unique_path(base_path) == tmp_path / "video_1000.mp4"
+
+        assert mock_exists.call_count < 30
+
+    def test_find_thumbnail(self, tmp_path):
+        """Test locating a thumbnail next to a video in any supported format."""
+        video = tmp_path / "clip.mp4"
+        assert find_thumbnail(video) is None
+
+        (tmp_path / "clip.webp").touch()
+        assert find_thumbnail(video) == tmp_path / "clip.webp"
+
+        (tmp_path / "clip.jpg").touch()
+        assert find_thumbnail(video) == tmp_path / "clip.jpg"
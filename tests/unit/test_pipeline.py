@@ -22,7 +22,8 @@ class TestProcessingPipeline:
         """Test pipeline initialization."""
         pipeline = ProcessingPipeline(mock_profile, max_concurrent_downloads=5, max_concurrent_conversions=2)
         assert pipeline.profile == mock_profile
-        mock_dl_class.assert_called_once_with(mock_profile)
+        # Download pool sized for the downloads plus a spare thread for prechecks
+        mock_dl_class.assert_called_once_with(mock_profile, max_workers=6)
         mock_conv_class.assert_called_once_with(mock_profile)
         # Check semaphores
         assert pipeline.download_semaphore._value == 5
@@ -66,6 +67,8 @@ class TestProcessingPipeline:
                 
                 assert results == [Path("final.mp4")]
                 mock_dl.download_video_async.assert_called_once()
+                # The pre-check's metadata is reused for the download
+                assert mock_dl.download_video_async.call_args.kwargs["info_dict"] == {"id": "test", "title": "test"}
                 mock_conv.convert_video_async.assert_called_once()
                 mock_split.assert_called_once()
 
@@ -131,12 +134,15 @@ class TestProcessingPipeline:
         """Test batch run where some items fail."""
         pipeline = ProcessingPipeline(mock_profile)
         
-        async def mock_process(url, output_dir, progress_callback=None):
+        async def mock_download(url, info_dict, progress_callback=None):
             if url == "fail":
                 raise Exception("Item failed")
-            return [Path("ok.mp4")]
-            
-        with patch.object(pipeline, "process_one", side_effect=mock_process):
+            return Path(f"{url}.mp4"), {"id": url}
+
+        with patch.object(pipeline, "_precheck", AsyncMock(return_value=(None, None))), \
+             patch.object(pipeline, "_download", side_effect=mock_download), \
+             patch.object(pipeline, "_convert", AsyncMock(return_value=Path("cv.mp4"))), \
+             patch.object(pipeline, "_finalize", AsyncMock(return_value=[Path("ok.mp4")])):
             urls = ["ok1", "fail", "ok2"]
             results = await pipeline.run_batch(urls, output_dir=tmp_path)
             
@@ -145,6 +151,39 @@ class TestProcessingPipeline:
             assert "ok2" in results
             assert "fail" not in results
 
+    @pytest.mark.asyncio
+    @patch("yt2audi.core.pipeline.Downloader")
+    @patch("yt2audi.core.pipeline.Converter")
+    async def test_run_batch_converts_while_downloading(self, mock_conv_class, mock_dl_class, mock_profile, tmp_path):
+        """Test that a finished download is converted while later downloads are still running."""
+        pipeline = ProcessingPipeline(mock_profile, max_concurrent_downloads=1)
+        first_converted = asyncio.Event()
+        events = []
+
+        async def mock_download(url, info_dict, progress_callback=None):
+            if url == "second":
+                # Only completes once the first video's conversion has run
+                await asyncio.wait_for(first_converted.wait(), timeout=5)
+            events.append(f"download:{url}")
+            return Path(f"{url}.mp4"), {"id": url}
+
+        async def mock_convert(url, downloaded_path, info_dict, output_dir, progress_callback=None):
+            events.append(f"convert:{url}")
+            first_converted.set()
+            return Path(f"{url}.m4v")
+
+        async def mock_finalize(url, converted_path, info_dict, output_dir, progress_callback=None, final_paths=None):
+            return [converted_path]
+
+        with patch.object(pipeline, "_precheck", AsyncMock(return_value=(None, None))), \
+             patch.object(pipeline, "_download", side_effect=mock_download), \
+             patch.object(pipeline, "_convert", side_effect=mock_convert), \
+             patch.object(pipeline, "_finalize", side_effect=mock_finalize):
+            results = await pipeline.run_batch(["first", "second"], output_dir=tmp_path)
+
+        assert events == ["download:first", "convert:first", "download:second", "convert:second"]
+        assert list(results) == ["first", "second"]
+
     @pytest.mark.asyncio
     @patch("yt2audi.core.pipeline.Downloader")
     @patch("yt2audi.core.pipeline.Converter")
@@ -162,7 +201,7 @@ class TestProcessingPipeline:
         mock_dl.extract_info_async = AsyncMock(return_value={"id": "test", "title": "test"})
 
         # Download progress hook setup
-        async def dl_side_effect(url, progress_callback=None):
+        async def dl_side_effect(url, progress_callback=None, info_dict=None):
             if progress_callback:
                 progress_callback({"status": "downloading", "downloaded_bytes": 50, "total_bytes": 100})
             return Path("dl.mp4"), {"id": "test"}
@@ -197,3 +236,171 @@ class TestProcessingPipeline:
                 callback.assert_any_call("url", 50.0, "Converting")
                 callback.assert_any_call("url", 95, "Finalizing")
                 callback.assert_any_call("url", 100, "Complete")
+
+    @pytest.mark.asyncio
+    @patch("yt2audi.core.pipeline._QUEUE_SLACK", 0)
+    @patch("yt2audi.core.pipeline.Downloader")
+    @patch("yt2audi.core.pipeline.Converter")
+    async def test_run_batch_backpressure(self, mock_conv_class, mock_dl_class, mock_profile, tmp_path):
+        """Test that downloads pause while conversions are backed up."""
+        pipeline = ProcessingPipeline(mock_profile, max_concurrent_downloads=1, max_concurrent_conversions=1)
+        release = asyncio.Event()
+        downloaded = []
+
+        async def mock_download(url, info_dict, progress_callback=None):
+            downloaded.append(url)
+            return Path(f"{url}.mp4"), {"id": url}
+
+        async def mock_convert(url, downloaded_path, info_dict, output_dir, progress_callback=None):
+            await release.wait()
+            return Path(f"{url}.m4v")
+
+        urls = [f"url{i}" for i in range(6)]
+        with patch.object(pipeline, "_precheck", AsyncMock(return_value=(None, None))), \
+             patch.object(pipeline, "_download", side_effect=mock_download), \
+             patch.object(pipeline, "_convert", side_effect=mock_convert), \
+             patch.object(pipeline, "_finalize", AsyncMock(return_value=[Path("ok.m4v")])):
+            batch = asyncio.create_task(pipeline.run_batch(urls, output_dir=tmp_path))
+            for _ in range(20):
+                await asyncio.sleep(0)
+
+            # One converting, one queued, one waiting to hand off
+            assert downloaded == urls[:3]
+
+            release.set()
+            results = await batch
+
+        assert downloaded == urls
+        assert list(results) == urls
+
+    @pytest.mark.asyncio
+    @patch("yt2audi.core.pipeline.Downloader")
+    @patch("yt2audi.core.pipeline.Converter")
+    @patch("yt2audi.core.pipeline.Splitter.handle_size_exceed")
+    async def test_finalize_splits_off_event_loop(self, mock_split, mock_conv_class, mock_dl_class, mock_profile, tmp_path):
+        """Test that size handling runs in a worker thread, not on the event loop."""
+        import threading
+
+        pipeline = ProcessingPipeline(mock_profile)
+        pipeline.history = MagicMock(spec=HistoryManager)
+        pipeline.profile.transfer.usb_auto_copy = False
+        loop_thread = threading.get_ident()
+        split_threads = []
+
+        def fake_split(*args):
+            split_threads.append(threading.get_ident())
+            return [Path("final.mp4")]
+
+        mock_split.side_effect = fake_split
+        result = await pipeline._finalize("url", Path("cv.mp4"), {"id": "test"}, tmp_path, None)
+
+        assert result == [Path("final.mp4")]
+        assert split_threads and split_threads[0] != loop_thread
+        pipeline.history.mark_completed.assert_called_once_with("test")
+
+    @pytest.mark.asyncio
+    @patch("yt2audi.core.pipeline.Downloader")
+    @patch("yt2audi.core.pipeline.Converter")
+    @patch("yt2audi.core.pipeline.Splitter.handle_many")
+    async def test_run_batch_handles_ready_sizes_together(self, mock_many, mock_conv_class, mock_dl_class, mock_profile, tmp_path):
+        """Test that videos converted while the finalizer is busy are size-handled in one call."""
+        import threading
+
+        pipeline = ProcessingPipeline(mock_profile, max_concurrent_downloads=3, max_concurrent_conversions=3)
+        pipeline.history = MagicMock(spec=HistoryManager)
+        pipeline.profile.transfer.usb_auto_copy = False
+        first_finalizing = asyncio.Event()
+        others_converted = threading.Event()
+        converted = []
+
+        def callback(url, percent, stage):
+            if url == "a" and stage == "Finalizing":
+                first_finalizing.set()
+
+        async def mock_convert(url, downloaded_path, info_dict, output_dir, progress_callback=None):
+            if url != "a":
+                # Finish converting while "a" is still being finalized
+                await asyncio.wait_for(first_finalizing.wait(), timeout=5)
+                converted.append(url)
+                if len(converted) == 2:
+                    others_converted.set()
+            return Path(f"{url}.m4v")
+
+        def fake_split(input_path, *args):
+            others_converted.wait(5)
+            return [input_path]
+
+        def fake_many(items, max_size_gb, output_dir, max_workers=None, encoder=None):
+            return {path: [path.with_suffix(".part1.m4v")] for path, _ in items}
+
+        mock_many.side_effect = fake_many
+        with patch.object(pipeline, "_precheck", AsyncMock(return_value=(None, None))), \
+             patch.object(pipeline, "_download", AsyncMock(return_value=(Path("dl.mp4"), None))), \
+             patch.object(pipeline, "_convert", side_effect=mock_convert), \
+             patch("yt2audi.core.pipeline.Splitter.handle_size_exceed", side_effect=fake_split):
+            results = await pipeline.run_batch(["a", "b", "c"], output_dir=tmp_path, progress_callback=callback)
+
+        assert results == {
+            "a": [Path("a.m4v")],
+            "b": [Path("b.part1.m4v")],
+            "c": [Path("c.part1.m4v")],
+        }
+        mock_many.assert_called_once()
+        assert [path for path, _ in mock_many.call_args.args[0]] == [Path("b.m4v"), Path("c.m4v")]
+        assert mock_many.call_args.kwargs["encoder"] is pipeline.converter.encoder
+
+    @pytest.mark.asyncio
+    @patch("yt2audi.core.pipeline.Downloader")
+    @patch("yt2audi.core.pipeline.Converter")
+    async def test_run_batch_dedupes_and_skips_history_offline(self, mock_conv_class, mock_dl_class, mock_profile, tmp_path):
+        """Test that duplicate URLs and known video IDs never reach the pipeline stages."""
+        mock_dl = mock_dl_class.return_value
+        mock_conv = mock_conv_class.return_value
+        pipeline = ProcessingPipeline(mock_profile)
+        pipeline.history = MagicMock(spec=HistoryManager)
+        pipeline.history.is_processed.side_effect = lambda vid: vid == "aaaaaaaaaaa"
+        mock_dl.cache.get.return_value = {"id": "aaaaaaaaaaa", "title": "done"}
+        mock_conv.get_output_path.return_value = tmp_path / "done.mp4"
+
+        done = "https://youtu.be/aaaaaaaaaaa"
+        new = "https://www.youtube.com/watch?v=bbbbbbbbbbb"
+        with patch.object(pipeline, "_precheck", AsyncMock(return_value=(None, None))) as mock_precheck, \
+             patch.object(pipeline, "_download", AsyncMock(return_value=(Path("dl.mp4"), {"id": "b"}))), \
+             patch.object(pipeline, "_convert", AsyncMock(return_value=Path("cv.mp4"))), \
+             patch.object(pipeline, "_finalize", AsyncMock(return_value=[Path("new.mp4")])):
+            results = await pipeline.run_batch([done, new, new, done], output_dir=tmp_path)
+
+        assert results == {done: [tmp_path / "done.mp4"], new: [Path("new.mp4")]}
+        mock_precheck.assert_awaited_once()
+        assert mock_precheck.call_args.args[0] == new
+
+    @pytest.mark.asyncio
+    @patch("yt2audi.core.pipeline.Downloader")
+    @patch("yt2audi.core.pipeline.Converter")
+    async def test_run_batch_reports_failure_before_batch_ends(self, mock_conv_class, mock_dl_class, mock_profile, tmp_path):
+        """Test that a failed item reaches the progress callback while others still run."""
+        pipeline = ProcessingPipeline(mock_profile, max_concurrent_downloads=2)
+        failure_seen = asyncio.Event()
+
+        def callback(url, percent, stage):
+            if stage.startswith("Finalize Failed"):
+                failure_seen.set()
+
+        async def mock_download(url, info_dict, progress_callback=None):
+            if url == "slow":
+                # Only finishes once the other item's failure has been reported
+                await asyncio.wait_for(failure_seen.wait(), timeout=5)
+            return Path(f"{url}.mp4"), {"id": url}
+
+        async def mock_finalize(url, converted_path, info_dict, output_dir, progress_callback=None, final_paths=None):
+            if url == "bad":
+                raise RuntimeError("split failed")
+            return [converted_path]
+
+        with patch.object(pipeline, "_precheck", AsyncMock(return_value=(None, None))), \
+             patch.object(pipeline, "_download", side_effect=mock_download), \
+             patch.object(pipeline, "_convert", AsyncMock(return_value=Path("cv.mp4"))), \
+             patch.object(pipeline, "_finalize", side_effect=mock_finalize):
+            results = await pipeline.run_batch(["bad", "slow"], output_dir=tmp_path, progress_callback=callback)
+
+        assert list(results) == ["slow"]
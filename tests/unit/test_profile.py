@@ -1,8 +1,12 @@
 """Unit tests for Profile and related Pydantic models."""
 
+from unittest.mock import patch
+
 import pytest
 from pydantic import ValidationError
 
+from tests.conftest import BUNDLED_PROFILE_PATH, load_profile_cached
+
 from yt2audi.models.profile import (
     AudioConfig,
     DownloadConfig,
@@ -267,6 +271,40 @@ class TestProfile:
         assert new_profile.profile.name == sample_profile.profile.name
         assert new_profile.video.max_width == sample_profile.video.max_width
 
+    def test_profile_from_toml_file(self, sample_profile: Profile, tmp_path) -> None:
+        """Test loading a profile back from TOML."""
+        tomli_w = pytest.importorskip("tomli_w")
+        path = tmp_path / "profile.toml"
+        path.write_text(tomli_w.dumps(sample_profile.model_dump(mode="json", exclude_none=True)))
+
+        assert Profile.from_toml_file(path) == sample_profile
+
+    def test_profile_from_missing_toml_file(self, tmp_path) -> None:
+        """Test that a missing profile file raises ConfigError."""
+        from yt2audi.exceptions import ConfigError
+
+        with pytest.raises(ConfigError, match="Profile file not found"):
+            Profile.from_toml_file(tmp_path / "missing.toml")
+
+
+class TestBundledProfile:
+    """Test suite for the profile shipped in configs/profiles."""
+
+    def test_bundled_profile_is_valid(self, bundled_profile: Profile) -> None:
+        """Test that the bundled profile parses and validates."""
+        assert bundled_profile.profile.name
+        assert bundled_profile.output.max_file_size_gb > 0
+
+    def test_bundled_profile_parsed_once(self, bundled_profile: Profile) -> None:
+        """Test that repeated loads reuse the parse and hand out copies."""
+        with patch.object(Profile, "from_toml_file") as mock_from_toml:
+            again = load_profile_cached(BUNDLED_PROFILE_PATH)
+
+        mock_from_toml.assert_not_called()
+        assert again == bundled_profile
+        again.transfer.usb_auto_copy = not bundled_profile.transfer.usb_auto_copy
+        assert load_profile_cached(BUNDLED_PROFILE_PATH) == bundled_profile
+
 
 class TestDownloadConfig:
     """Test suite for DownloadConfig model."""
@@ -313,3 +351,20 @@ class TestDownloadConfig:
                 playlist_end=None,
                 playlist_reverse=False,
             )
+
+    def test_concurrent_fragments_range(self) -> None:
+        """Test that concurrent_fragments must be between 1 and 16."""
+        assert DownloadConfig().concurrent_fragments == 8
+
+        with pytest.raises(ValidationError):
+            DownloadConfig(concurrent_fragments=0)
+
+        with pytest.raises(ValidationError):
+            DownloadConfig(concurrent_fragments=17)
+
+    def test_http_chunk_size_must_be_positive(self) -> None:
+        """Test that http_chunk_size_mb must be > 0."""
+        assert DownloadConfig().http_chunk_size_mb == 10.0
+
+        with pytest.raises(ValidationError):
+            DownloadConfig(http_chunk_size_mb=0)
@@ -1,14 +1,41 @@
 """Unit tests for video file splitter."""
 
 import subprocess
+import sys
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
-from yt2audi.core.splitter import Splitter
+from yt2audi.core.splitter import Splitter, _CutPlanner, _drop_page_cache, _run_ffmpeg
 from yt2audi.exceptions import ConversionError
-from yt2audi.models.profile import OnSizeExceed
+from yt2audi.models.profile import EncoderType, OnSizeExceed
+
+# ffprobe -print_format json -show_entries format=duration,bit_rate output for a 10 minute file
+PROBE_JSON = '{"format": {"duration": "600.0", "bit_rate": "8000000"}}'
+
+
+# Size cap of ~1 KB, leaving a 1020 byte budget per part after the safety margin
+TINY_CAP_GB = 1e-6
+
+
+def packet_lines(count: int, start: float = 0.0) -> list[str]:
+    """ffprobe compact packet lines: one 100 byte video packet per second,
+    with a keyframe every 4 seconds (so 7 packets fit a TINY_CAP_GB part)."""
+    lines = [
+        f"codec_type=video|pts_time={start + t:.6f}|size=100|flags={'K' if t % 4 == 0 else '_'}__"
+        for t in range(count)
+    ]
+    return lines + [f"start_time={start:.6f}"]
+
+
+@pytest.fixture(autouse=True)
+def probe_cache_dir(tmp_path: Path) -> Iterator[Path]:
+    """Keep ffprobe cache entries out of the real config directory."""
+    cache_dir = tmp_path / "ffprobe-cache"
+    with patch("yt2audi.core.splitter._probe_cache_dir", return_value=cache_dir):
+        yield cache_dir
 
 
 class TestGetFileSize:
@@ -24,6 +51,15 @@ class TestGetFileSize:
 
         assert 0.0009 < size_gb < 0.0011  # ~0.001 GB
 
+    def test_get_file_size_uses_given_stat(self, temp_dir: Path) -> None:
+        """Test that a passed stat result is used instead of stat-ing again."""
+        test_file = temp_dir / "test.mp4"
+        test_file.write_bytes(b"x" * 1024)
+        st = test_file.stat()
+
+        with patch.object(Path, "stat", side_effect=AssertionError("stat called")):
+            assert Splitter.get_file_size_gb(test_file, st) == 1024 / 1024**3
+
     def test_get_file_size_nonexistent_file(self, temp_dir: Path) -> None:
         """Test getting size of non-existent file."""
         test_file = temp_dir / "nonexistent.mp4"
@@ -54,49 +90,101 @@ class TestSplitVideo:
         with pytest.raises(ConversionError, match="Input file not found"):
             Splitter.split_video(nonexistent, max_size_gb=1.0)
 
+    @patch("yt2audi.core.splitter._run_ffmpeg")
     @patch("subprocess.run")
     def test_split_video_success(
         self,
         mock_run: Mock,
+        mock_ffmpeg: Mock,
         sample_video_path: Path,
         temp_dir: Path,
     ) -> None:
-        """Test successful video splitting."""
+        """Test size-based splitting cuts once at the planned keyframes."""
+
+        def fake_ffmpeg(cmd, timeout, on_stdout_line=None):
+            if cmd[0] == "ffprobe":
+                for line in packet_lines(14):
+                    on_stdout_line(line)
+                return
+            for num in range(3):
+                (temp_dir / f"sample_video_part{num:03d}.mp4").write_bytes(b"part")
+
+        mock_ffmpeg.side_effect = fake_ffmpeg
+
         # Make file appear large
         with patch.object(Splitter, "get_file_size_gb", return_value=5.0):
-            # Mock ffmpeg success
-            mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+            result = Splitter.split_video(
+                input_path=sample_video_path,
+                max_size_gb=TINY_CAP_GB,
+                output_dir=temp_dir,
+            )
+
+        assert result == [temp_dir / f"sample_video_part{num:03d}.mp4" for num in range(3)]
+        # One packet scan and one stream copy; no duration probe needed
+        mock_run.assert_not_called()
+        assert mock_ffmpeg.call_count == 2
+        cmd = mock_ffmpeg.call_args.args[0]
+        assert cmd[cmd.index("-segment_times") + 1] == "4.000000,8.000000"
 
-            # Create fake output files that FFmpeg would create
-            part1 = temp_dir / "sample_video_part001.mp4"
-            part2 = temp_dir / "sample_video_part002.mp4"
-            part1.write_bytes(b"part1")
-            part2.write_bytes(b"part2")
+    @patch("yt2audi.core.splitter._run_ffmpeg")
+    @patch("subprocess.run")
+    def test_split_video_falls_back_to_segment_muxer(
+        self,
+        mock_run: Mock,
+        mock_ffmpeg: Mock,
+        sample_video_path: Path,
+        temp_dir: Path,
+    ) -> None:
+        """Test time-based segmenting when the keyframe-cut split fails."""
+        part1 = temp_dir / "sample_video_part001.mp4"
+        part2 = temp_dir / "sample_video_part002.mp4"
+
+        def fake_ffmpeg(cmd, timeout, on_stdout_line=None):
+            if cmd[0] == "ffprobe":
+                for line in packet_lines(14):
+                    on_stdout_line(line)
+            elif "-segment_times" in cmd:
+                (temp_dir / "sample_video_part000.mp4").write_bytes(b"partial")
+                raise subprocess.CalledProcessError(1, cmd, stderr="segment error")
+            else:
+                # Create fake output files that FFmpeg would create
+                part1.write_bytes(b"part1")
+                part2.write_bytes(b"part2")
+
+        mock_ffmpeg.side_effect = fake_ffmpeg
+
+        # Make file appear large
+        with patch.object(Splitter, "get_file_size_gb", return_value=5.0):
+            # Mock ffprobe success
+            mock_run.return_value = Mock(returncode=0, stdout=PROBE_JSON, stderr="")
 
             result = Splitter.split_video(
                 input_path=sample_video_path,
-                max_size_gb=2.0,
+                max_size_gb=TINY_CAP_GB,
                 output_dir=temp_dir,
             )
 
-            # Should find the created parts
-            assert len(result) == 2
-            assert part1 in result
-            assert part2 in result
-            # Should have called ffprobe for duration and then ffmpeg for split
-            assert mock_run.call_count == 2
+            # Should find the created parts, without the partial keyframe-cut one
+            assert result == [part1, part2]
+            # Duration probed once for the fallback; packet scan plus both strategies
+            assert mock_run.call_count == 1
+            assert mock_ffmpeg.call_count == 3
+            assert "-segment_time" in mock_ffmpeg.call_args.args[0]
 
+    @patch("yt2audi.core.splitter._run_ffmpeg")
     @patch("subprocess.run")
     def test_split_video_ffmpeg_failure(
         self,
         mock_run: Mock,
+        mock_ffmpeg: Mock,
         sample_video_path: Path,
     ) -> None:
         """Test handling of FFmpeg failure during split."""
         # Make file appear large
         with patch.object(Splitter, "get_file_size_gb", return_value=5.0):
             # Mock ffmpeg failure
-            mock_run.side_effect = subprocess.CalledProcessError(
+            mock_run.return_value = Mock(returncode=0, stdout=PROBE_JSON, stderr="")
+            mock_ffmpeg.side_effect = subprocess.CalledProcessError(
                 returncode=1,
                 cmd=["ffmpeg"],
                 stderr="FFmpeg error",
@@ -105,10 +193,12 @@ class TestSplitVideo:
             with pytest.raises(ConversionError, match="FFmpeg splitting failed"):
                 Splitter.split_video(sample_video_path, max_size_gb=2.0)
 
+    @patch("yt2audi.core.splitter._run_ffmpeg")
     @patch("subprocess.run")
     def test_split_video_no_output_files(
         self,
         mock_run: Mock,
+        mock_ffmpeg: Mock,
         sample_video_path: Path,
         temp_dir: Path,
     ) -> None:
@@ -116,7 +206,7 @@ class TestSplitVideo:
         # Make file appear large
         with patch.object(Splitter, "get_file_size_gb", return_value=5.0):
             # Mock ffmpeg success but don't create files
-            mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+            mock_run.return_value = Mock(returncode=0, stdout=PROBE_JSON, stderr="")
 
             with pytest.raises(ConversionError, match="no output files found"):
                 Splitter.split_video(
@@ -126,6 +216,159 @@ class TestSplitVideo:
                 )
 
 
+class TestFindParts:
+    """Test suite for chunk discovery."""
+
+    def test_find_parts_matches_glob(self, temp_dir: Path) -> None:
+        """Test that only this input's chunk files are listed, sorted."""
+        for name in ("a_part001.mp4", "a_part000.mp4", "a_part000.mkv", "b_part000.mp4", "a.mp4"):
+            (temp_dir / name).write_bytes(b"x")
+        (temp_dir / "a_part_dir.mp4").mkdir()
+
+        parts = Splitter._find_parts(temp_dir / "a.mp4", temp_dir)
+
+        assert parts == [temp_dir / "a_part000.mp4", temp_dir / "a_part001.mp4"]
+        assert parts == sorted(p for p in temp_dir.glob("a_part*.mp4") if p.is_file())
+
+    def test_find_parts_orders_numerically(self, temp_dir: Path) -> None:
+        """Test that unpadded part numbers sort by value, not as text."""
+        for num in (10, 2, 1):
+            (temp_dir / f"a_part{num}.mp4").write_bytes(b"x")
+
+        parts = Splitter._find_parts(temp_dir / "a.mp4", temp_dir)
+
+        assert [p.name for p in parts] == ["a_part1.mp4", "a_part2.mp4", "a_part10.mp4"]
+
+
+class TestSplitMany:
+    """Test suite for batched splitting."""
+
+    @patch("yt2audi.core.splitter._run_ffmpeg")
+    @patch("subprocess.run")
+    def test_split_many_uses_one_ffmpeg(
+        self,
+        mock_run: Mock,
+        mock_ffmpeg: Mock,
+        temp_dir: Path,
+    ) -> None:
+        """Test that oversize inputs share one ffmpeg command with one output each."""
+        small, big_a, big_b = (temp_dir / f"{name}.mp4" for name in ("small", "a", "b"))
+        for path in (small, big_a, big_b):
+            path.write_bytes(path.stem.encode())
+        out_dir = temp_dir / "out"
+        mock_run.return_value = Mock(returncode=0, stdout=PROBE_JSON, stderr="")
+
+        def fake_ffmpeg(cmd, timeout):
+            for stem in ("a", "b"):
+                for num in range(2):
+                    (out_dir / f"{stem}_part{num:03d}.mp4").write_bytes(b"part")
+
+        mock_ffmpeg.side_effect = fake_ffmpeg
+        sizes = {small: 1.0, big_a: 5.0, big_b: 5.0}
+
+        with patch.object(Splitter, "get_file_size_gb", side_effect=lambda p, st=None: sizes[p]):
+            results = Splitter.split_many([small, big_a, big_b], max_size_gb=2.0, output_dir=out_dir)
+
+        mock_ffmpeg.assert_called_once()
+        cmd = mock_ffmpeg.call_args.args[0]
+        assert cmd.count("-i") == 2
+        assert cmd.count("segment") == 2
+        assert cmd[cmd.index("-map") + 1] == "0"
+        assert str(out_dir / "b_part%03d.mp4") in cmd
+        assert list(results) == [small, big_a, big_b]
+        assert results[small] == [small]
+        assert results[big_b] == [out_dir / "b_part000.mp4", out_dir / "b_part001.mp4"]
+
+    @patch("yt2audi.core.splitter._run_ffmpeg")
+    def test_split_many_mixed_containers_falls_back(
+        self,
+        mock_ffmpeg: Mock,
+        temp_dir: Path,
+    ) -> None:
+        """Test that differing containers are split one file at a time."""
+        paths = [temp_dir / "a.mp4", temp_dir / "b.mkv"]
+        for path in paths:
+            path.write_bytes(b"video")
+
+        with patch.object(Splitter, "get_file_size_gb", return_value=5.0), \
+             patch.object(Splitter, "split_video", side_effect=lambda p, *a, **kw: [p]) as mock_split:
+            results = Splitter.split_many(paths, max_size_gb=2.0)
+
+        assert mock_split.call_count == 2
+        mock_ffmpeg.assert_not_called()
+        assert results == {paths[0]: [paths[0]], paths[1]: [paths[1]]}
+
+    @patch("yt2audi.core.splitter._run_ffmpeg")
+    @patch("subprocess.run")
+    def test_split_many_redoes_oversize_segments(
+        self,
+        mock_run: Mock,
+        mock_ffmpeg: Mock,
+        temp_dir: Path,
+    ) -> None:
+        """Test that an input whose segments overshoot is re-split on its own."""
+        paths = [temp_dir / "a.mp4", temp_dir / "b.mp4"]
+        for path in paths:
+            path.write_bytes(b"video")
+        mock_run.return_value = Mock(returncode=0, stdout=PROBE_JSON, stderr="")
+
+        def fake_ffmpeg(cmd, timeout):
+            (temp_dir / "a_part000.mp4").write_bytes(b"x" * 10)
+            (temp_dir / "b_part000.mp4").write_bytes(b"x" * 4096)  # Over the ~1 KB cap
+
+        mock_ffmpeg.side_effect = fake_ffmpeg
+        redone = [temp_dir / "b_part000.mp4", temp_dir / "b_part001.mp4"]
+
+        with patch.object(Splitter, "get_file_size_gb", return_value=5.0), \
+             patch.object(Splitter, "split_video", return_value=redone) as mock_split:
+            results = Splitter.split_many(paths, max_size_gb=1e-6)
+
+        assert results[paths[0]] == [temp_dir / "a_part000.mp4"]
+        assert results[paths[1]] == redone
+        mock_split.assert_called_once()
+        assert mock_split.call_args.args[0] == paths[1]
+        assert not (temp_dir / "b_part000.mp4").exists()
+
+    def test_split_many_missing_input(self, temp_dir: Path) -> None:
+        """Test that a missing input fails before ffmpeg runs."""
+        with pytest.raises(ConversionError, match="Input file not found"):
+            Splitter.split_many([temp_dir / "missing.mp4"], max_size_gb=2.0)
+
+
+class TestProbe:
+    """Test suite for the cached ffprobe helper."""
+
+    @patch("subprocess.run")
+    def test_probe_parses_json(self, mock_run: Mock, sample_video_path: Path) -> None:
+        """Test that duration and bitrate come from ffprobe's JSON format section."""
+        mock_run.return_value = Mock(returncode=0, stdout=PROBE_JSON, stderr="")
+
+        assert Splitter._probe(sample_video_path) == {"duration": 600.0, "bitrate": 8_000_000.0}
+        cmd = mock_run.call_args.args[0]
+        assert cmd[cmd.index("-print_format") + 1] == "json"
+        assert cmd[cmd.index("-show_entries") + 1] == "format=duration,bit_rate"
+        assert "-show_format" not in cmd
+
+    @patch("subprocess.run")
+    def test_probe_result_cached_until_file_changes(
+        self,
+        mock_run: Mock,
+        sample_video_path: Path,
+        probe_cache_dir: Path,
+    ) -> None:
+        """Test that an unchanged file is probed once and a modified one again."""
+        mock_run.return_value = Mock(returncode=0, stdout=PROBE_JSON, stderr="")
+
+        first = Splitter._probe(sample_video_path)
+        assert Splitter._probe(sample_video_path) == first
+        assert mock_run.call_count == 1
+        assert len(list(probe_cache_dir.glob("*.json"))) == 1
+
+        sample_video_path.write_bytes(b"different content")
+        Splitter._probe(sample_video_path)
+        assert mock_run.call_count == 2
+
+
 class TestCompressToSize:
     """Test suite for compress_to_size method."""
 
@@ -136,10 +379,14 @@ class TestCompressToSize:
         with pytest.raises(ConversionError, match="Input file not found"):
             Splitter.compress_to_size(nonexistent, target_size_gb=1.0)
 
+    @patch.object(Splitter, "_remux_if_fits", return_value=False)
+    @patch("yt2audi.core.splitter._run_ffmpeg")
     @patch("subprocess.run")
     def test_compress_to_size_success(
         self,
         mock_run: Mock,
+        mock_ffmpeg: Mock,
+        mock_remux: Mock,
         sample_video_path: Path,
         temp_dir: Path,
     ) -> None:
@@ -147,16 +394,9 @@ class TestCompressToSize:
         output_path = temp_dir / "compressed.mp4"
 
         # Mock ffprobe (duration query)
-        def run_side_effect(cmd, *args, **kwargs):
-            if "ffprobe" in cmd[0]:
-                return Mock(returncode=0, stdout="600.0", stderr="")
-            # ffmpeg (compression)
-            else:
-                # Create output file
-                output_path.write_bytes(b"compressed video")
-                return Mock(returncode=0, stdout="", stderr="")
-
-        mock_run.side_effect = run_side_effect
+        mock_run.return_value = Mock(returncode=0, stdout=PROBE_JSON, stderr="")
+        # ffmpeg (compression) creates the output file
+        mock_ffmpeg.side_effect = lambda cmd, timeout: output_path.write_bytes(b"compressed video")
 
         result = Splitter.compress_to_size(
             input_path=sample_video_path,
@@ -167,12 +407,54 @@ class TestCompressToSize:
 
         assert result == output_path
         assert output_path.exists()
-        assert mock_run.call_count == 2  # ffprobe + ffmpeg
+        assert mock_run.call_count == 1  # ffprobe
+        mock_ffmpeg.assert_called_once()
+        cmd = mock_ffmpeg.call_args.args[0]
+        assert cmd[cmd.index("-c:v") + 1] == "libx264"
+        assert cmd[cmd.index("-x264-params") + 1] == "rc-lookahead=20"
+        assert cmd[cmd.index("-movflags") + 1] == "+faststart"
+
+    @patch.object(Splitter, "_remux_if_fits", return_value=False)
+    @patch("yt2audi.core.splitter._run_ffmpeg")
+    @patch("subprocess.run")
+    def test_compress_hardware_encoder_falls_back_to_libx264(
+        self,
+        mock_run: Mock,
+        mock_ffmpeg: Mock,
+        mock_remux: Mock,
+        sample_video_path: Path,
+        temp_dir: Path,
+    ) -> None:
+        """Test that a failing hardware encoder is retried with libx264."""
+        output_path = temp_dir / "compressed.mp4"
+        mock_run.return_value = Mock(returncode=0, stdout=PROBE_JSON, stderr="")
+
+        def fake_ffmpeg(cmd, timeout):
+            if "h264_nvenc" in cmd:
+                raise subprocess.CalledProcessError(1, cmd, stderr="No NVENC capable devices found")
+            output_path.write_bytes(b"compressed video")
+
+        mock_ffmpeg.side_effect = fake_ffmpeg
+
+        result = Splitter.compress_to_size(
+            sample_video_path,
+            target_size_gb=2.0,
+            output_path=output_path,
+            encoder=EncoderType.NVENC_H264,
+        )
+
+        assert result == output_path
+        first, second = (call.args[0] for call in mock_ffmpeg.call_args_list)
+        assert first[first.index("-preset") + 1] == "p4"
+        assert "-x264-params" not in first
+        assert second[second.index("-c:v") + 1] == "libx264"
 
+    @patch.object(Splitter, "_remux_if_fits", return_value=False)
     @patch("subprocess.run")
     def test_compress_ffprobe_failure(
         self,
         mock_run: Mock,
+        mock_remux: Mock,
         sample_video_path: Path,
     ) -> None:
         """Test handling of ffprobe failure."""
@@ -186,49 +468,235 @@ class TestCompressToSize:
         with pytest.raises(ConversionError):
             Splitter.compress_to_size(sample_video_path, target_size_gb=2.0)
 
+    @patch.object(Splitter, "_remux_if_fits", return_value=False)
+    @patch("yt2audi.core.splitter._run_ffmpeg")
     @patch("subprocess.run")
     def test_compress_ffmpeg_failure(
         self,
         mock_run: Mock,
+        mock_ffmpeg: Mock,
+        mock_remux: Mock,
         sample_video_path: Path,
     ) -> None:
         """Test handling of FFmpeg failure during compression."""
-
-        def run_side_effect(cmd, *args, **kwargs):
-            if "ffprobe" in cmd[0]:
-                return Mock(returncode=0, stdout="600.0", stderr="")
-            else:
-                raise subprocess.CalledProcessError(
-                    returncode=1,
-                    cmd=["ffmpeg"],
-                    stderr="FFmpeg compression error",
-                )
-
-        mock_run.side_effect = run_side_effect
+        mock_run.return_value = Mock(returncode=0, stdout=PROBE_JSON, stderr="")
+        mock_ffmpeg.side_effect = subprocess.CalledProcessError(
+            returncode=1,
+            cmd=["ffmpeg"],
+            stderr="FFmpeg compression error",
+        )
 
         with pytest.raises(ConversionError, match="FFmpeg compression failed"):
             Splitter.compress_to_size(sample_video_path, target_size_gb=2.0)
 
+    @patch.object(Splitter, "_remux_if_fits", return_value=False)
+    @patch("yt2audi.core.splitter._run_ffmpeg")
     @patch("subprocess.run")
     def test_compress_no_output_file(
         self,
         mock_run: Mock,
+        mock_ffmpeg: Mock,
+        mock_remux: Mock,
         sample_video_path: Path,
     ) -> None:
         """Test error when compression doesn't create output file."""
-
-        def run_side_effect(cmd, *args, **kwargs):
-            if "ffprobe" in cmd[0]:
-                return Mock(returncode=0, stdout="600.0", stderr="")
-            else:
-                # Don't create output file
-                return Mock(returncode=0, stdout="", stderr="")
-
-        mock_run.side_effect = run_side_effect
+        # ffmpeg "succeeds" but doesn't create the output file
+        mock_run.return_value = Mock(returncode=0, stdout=PROBE_JSON, stderr="")
 
         with pytest.raises(ConversionError, match="output file not found"):
             Splitter.compress_to_size(sample_video_path, target_size_gb=2.0)
 
+    @patch("yt2audi.core.splitter._run_ffmpeg")
+    @patch("subprocess.run")
+    def test_compress_remux_fits_skips_reencode(
+        self,
+        mock_run: Mock,
+        mock_ffmpeg: Mock,
+        sample_video_path: Path,
+        temp_dir: Path,
+    ) -> None:
+        """Test that a stream-copy remux under target is used as-is."""
+        output_path = temp_dir / "compressed.mp4"
+        mock_ffmpeg.side_effect = lambda cmd, timeout: Path(cmd[-1]).write_bytes(b"remuxed")
+
+        result = Splitter.compress_to_size(sample_video_path, target_size_gb=2.0, output_path=output_path)
+
+        assert result == output_path
+        assert output_path.read_bytes() == b"remuxed"
+        assert list(temp_dir.glob("*.remux.*")) == []
+        cmd = mock_ffmpeg.call_args.args[0]
+        assert cmd[cmd.index("-c") + 1] == "copy"
+        assert "+faststart" in cmd
+        mock_ffmpeg.assert_called_once()
+        mock_run.assert_not_called()  # No ffprobe needed
+
+    @patch("yt2audi.core.splitter._run_ffmpeg")
+    @patch("subprocess.run")
+    def test_compress_remux_too_large_falls_back_to_reencode(
+        self,
+        mock_run: Mock,
+        mock_ffmpeg: Mock,
+        sample_video_path: Path,
+        temp_dir: Path,
+    ) -> None:
+        """Test that an oversize remux is discarded and the file re-encoded."""
+        output_path = temp_dir / "compressed.mp4"
+        mock_run.return_value = Mock(returncode=0, stdout=PROBE_JSON, stderr="")
+        mock_ffmpeg.side_effect = lambda cmd, timeout: Path(cmd[-1]).write_bytes(b"output")
+
+        with patch.object(Splitter, "get_file_size_gb", side_effect=[2.1, 2.05, 1.5, 2.1]):
+            result = Splitter.compress_to_size(
+                sample_video_path, target_size_gb=2.0, output_path=output_path
+            )
+
+        assert result == output_path
+        assert list(temp_dir.glob("*.remux.*")) == []
+        assert mock_ffmpeg.call_count == 2
+        assert "-b:v" in mock_ffmpeg.call_args.args[0]
+
+    @patch("yt2audi.core.splitter._run_ffmpeg")
+    @patch("subprocess.run")
+    def test_compress_far_oversize_skips_remux(
+        self,
+        mock_run: Mock,
+        mock_ffmpeg: Mock,
+        sample_video_path: Path,
+        temp_dir: Path,
+    ) -> None:
+        """Test that files well over target go straight to re-encoding."""
+        output_path = temp_dir / "compressed.mp4"
+        mock_run.return_value = Mock(returncode=0, stdout=PROBE_JSON, stderr="")
+        mock_ffmpeg.side_effect = lambda cmd, timeout: Path(cmd[-1]).write_bytes(b"output")
+
+        with patch.object(Splitter, "get_file_size_gb", return_value=5.0):
+            Splitter.compress_to_size(sample_video_path, target_size_gb=2.0, output_path=output_path)
+
+        mock_ffmpeg.assert_called_once()
+        assert "-b:v" in mock_ffmpeg.call_args.args[0]
+
+
+    def test_compress_command_template_cached(self, temp_dir: Path) -> None:
+        """Test that static encoder flags are built once per encoder/container."""
+        from yt2audi.core.splitter import _compress_template
+
+        _compress_template.cache_clear()
+        with patch("yt2audi.core.splitter.get_encoder_preset", return_value="p4") as mock_preset:
+            first = Splitter._compress_command(
+                temp_dir / "a.mp4", temp_dir / "a_c.mp4", EncoderType.NVENC_H264, 1000, 128
+            )
+            second = Splitter._compress_command(
+                temp_dir / "b.mp4", temp_dir / "b_c.mp4", EncoderType.NVENC_H264, 2000, 128
+            )
+
+        mock_preset.assert_called_once()
+        assert first[first.index("-c:v") + 1] == "h264_nvenc"
+        assert second[second.index("-b:v") + 1] == "2000k"
+        assert second[-3:] == ["+faststart", "-y", str(temp_dir / "b_c.mp4")]
+        _compress_template.cache_clear()
+
+
+class TestRunFFmpeg:
+    """Test suite for the streaming ffmpeg runner."""
+
+    def test_success(self) -> None:
+        """Test that a clean exit returns without raising."""
+        _run_ffmpeg([sys.executable, "-c", "import sys; sys.stderr.write('ok\\n')"], timeout=30)
+
+    def test_failure_keeps_only_stderr_tail(self) -> None:
+        """Test that a failing process reports just the last stderr lines."""
+        script = "import sys\nfor i in range(500): sys.stderr.write(f'line {i}\\n')\nsys.exit(3)"
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            _run_ffmpeg([sys.executable, "-c", script], timeout=30)
+
+        lines = exc_info.value.stderr.splitlines()
+        assert exc_info.value.returncode == 3
+        assert len(lines) == 200
+        assert lines[0] == "line 300"
+        assert lines[-1] == "line 499"
+
+
+    def test_stdout_lines_passed_to_callback(self) -> None:
+        """Test that stdout is handed over line by line as it is read."""
+        script = "print('out_time_us=1000'); print('progress=end')"
+        lines: list[str] = []
+
+        _run_ffmpeg([sys.executable, "-c", script], timeout=30, on_stdout_line=lines.append)
+
+        assert [line.strip() for line in lines] == ["out_time_us=1000", "progress=end"]
+
+
+class TestCutPlanner:
+    """Test suite for keyframe cut planning."""
+
+    def plan(self, lines: list[str]) -> _CutPlanner:
+        planner = _CutPlanner(1020)
+        for line in lines:
+            planner.feed(line)
+        return planner
+
+    def test_cuts_at_last_keyframe_that_fits(self) -> None:
+        """Test that each part starts on the keyframe where the previous one stopped."""
+        planner = self.plan(packet_lines(20))
+
+        # 7 packets fit; each cut falls back to the part's last keyframe
+        assert planner.cuts == [4.0, 8.0, 12.0, 16.0]
+        assert not planner.oversize_gop
+
+    def test_short_tail_ends_the_plan(self) -> None:
+        """Test that a tail well under the cap stays one final part."""
+        planner = self.plan(packet_lines(9))
+
+        assert planner.cuts == [4.0]
+        assert planner.segment_times() == [4.0]
+
+    def test_times_relative_to_start_time(self) -> None:
+        """Test that cuts are shifted into ffmpeg's zero-based output timeline."""
+        planner = self.plan(packet_lines(9, start=1.5))
+
+        assert planner.cuts == [5.5]
+        assert planner.segment_times() == [4.0]
+
+    def test_audio_keyframes_ignored(self) -> None:
+        """Test that only video keyframes are used as cut points."""
+        lines = [
+            f"codec_type=audio|pts_time={t:.6f}|size=100|flags=K__" for t in range(9)
+        ]
+
+        planner = self.plan(lines)
+
+        assert planner.cuts == []
+        assert planner.oversize_gop
+
+    def test_oversize_gop(self) -> None:
+        """Test that a GOP larger than the cap marks the plan unusable."""
+        lines = [
+            f"codec_type=video|pts_time={t:.6f}|size=100|flags={'K' if t == 0 else '_'}__"
+            for t in range(9)
+        ]
+
+        assert self.plan(lines).oversize_gop
+
+
+class TestDropPageCache:
+    """Test suite for the page cache hint."""
+
+    def test_drops_cached_pages(self, sample_video_path: Path) -> None:
+        """Test that the whole file is hinted with POSIX_FADV_DONTNEED."""
+        with patch("yt2audi.core.splitter.os.posix_fadvise", create=True) as mock_fadvise, \
+             patch("yt2audi.core.splitter.os.POSIX_FADV_DONTNEED", 4, create=True):
+            _drop_page_cache(sample_video_path)
+
+        mock_fadvise.assert_called_once()
+        assert mock_fadvise.call_args.args[1:] == (0, 0, 4)
+
+    def test_missing_file_is_ignored(self, temp_dir: Path) -> None:
+        """Test that a vanished file doesn't raise."""
+        with patch("yt2audi.core.splitter.os.posix_fadvise", create=True) as mock_fadvise:
+            _drop_page_cache(temp_dir / "missing.mp4")
+
+        mock_fadvise.assert_not_called()
+
 
 class TestHandleSizeExceed:
     """Test suite for handle_size_exceed method."""
@@ -267,7 +735,9 @@ class TestHandleSizeExceed:
             )
 
             assert result == [part1, part2]
-            mock_split.assert_called_once_with(sample_video_path, 2.0, temp_dir)
+            mock_split.assert_called_once_with(
+                sample_video_path, 2.0, temp_dir, input_stat=sample_video_path.stat()
+            )
 
     @patch.object(Splitter, "compress_to_size")
     def test_handle_size_exceed_compress_action(
@@ -287,10 +757,12 @@ class TestHandleSizeExceed:
                 max_size_gb=2.0,
                 action=OnSizeExceed.COMPRESS,
                 output_dir=temp_dir,
+                encoder=EncoderType.QSV_H264,
             )
 
             assert result == [compressed]
             mock_compress.assert_called_once()
+            assert mock_compress.call_args.kwargs["encoder"] == EncoderType.QSV_H264
 
     def test_handle_size_exceed_warn_action(self, sample_video_path: Path) -> None:
         """Test warn action when size exceeded."""
@@ -317,3 +789,110 @@ class TestHandleSizeExceed:
 
             # Should return empty list
             assert result == []
+
+    def test_every_action_has_a_handler(self) -> None:
+        """Test that the dispatch table covers all OnSizeExceed actions."""
+        assert set(Splitter._HANDLERS) == set(OnSizeExceed)
+
+    def test_handle_size_exceed_unknown_action(self, sample_video_path: Path) -> None:
+        """Test that an action without a handler raises."""
+        with patch.object(Splitter, "get_file_size_gb", return_value=5.0):
+            with pytest.raises(ConversionError, match="Unknown size exceed action"):
+                Splitter.handle_size_exceed(
+                    input_path=sample_video_path,
+                    max_size_gb=2.0,
+                    action=Mock(value="bogus"),
+                )
+
+
+class TestHandleMany:
+    """Test suite for parallel size handling."""
+
+    def test_handle_many_runs_in_parallel(self, temp_dir: Path) -> None:
+        """Test that files are handled concurrently and reported in input order."""
+        import threading
+
+        paths = [temp_dir / f"video{i}.mp4" for i in range(3)]
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_handle(input_path, max_size_gb, action, output_dir, encoder):
+            barrier.wait()  # Deadlocks unless all three run at once
+            return [input_path.with_suffix(".part.mp4")]
+
+        with patch.object(Splitter, "handle_size_exceed", side_effect=fake_handle):
+            results = Splitter.handle_many(
+                [(p, OnSizeExceed.SPLIT) for p in paths], max_size_gb=2.0, max_workers=3
+            )
+
+        assert list(results) == paths
+        assert results[paths[0]] == [temp_dir / "video0.part.mp4"]
+
+    def test_handle_many_limits_compressions_and_skips_failures(self, temp_dir: Path) -> None:
+        """Test that compressions are capped at half the CPUs and failures are left out."""
+        import threading
+
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+        paths = [temp_dir / f"video{i}.mp4" for i in range(4)]
+
+        def fake_handle(input_path, max_size_gb, action, output_dir, encoder):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            threading.Event().wait(0.05)
+            with lock:
+                active -= 1
+            if input_path == paths[1]:
+                raise ConversionError("boom")
+            return [input_path]
+
+        with patch.object(Splitter, "handle_size_exceed", side_effect=fake_handle), \
+             patch("yt2audi.core.splitter.os.cpu_count", return_value=2):
+            results = Splitter.handle_many(
+                [(p, OnSizeExceed.COMPRESS) for p in paths], max_size_gb=2.0, max_workers=4
+            )
+
+        assert peak == 1
+        assert list(results) == [paths[0], paths[2], paths[3]]
+
+    def test_handle_many_batches_splits_per_container(self, temp_dir: Path) -> None:
+        """Test that same-container splits share one split_many call."""
+        mp4s = [temp_dir / "a.mp4", temp_dir / "b.mp4"]
+        mkv = temp_dir / "c.mkv"
+        items = [(mp4s[0], OnSizeExceed.SPLIT), (mkv, OnSizeExceed.SPLIT), (mp4s[1], OnSizeExceed.SPLIT)]
+
+        with patch.object(Splitter, "split_many", return_value={p: [p] for p in mp4s}) as mock_many, \
+             patch.object(Splitter, "handle_size_exceed", return_value=[mkv]) as mock_handle:
+            results = Splitter.handle_many(items, max_size_gb=2.0)
+
+        mock_many.assert_called_once_with(mp4s, 2.0, None)
+        mock_handle.assert_called_once_with(
+            mkv, 2.0, OnSizeExceed.SPLIT, None, EncoderType.LIBX264
+        )
+        assert list(results) == [mp4s[0], mkv, mp4s[1]]
+
+    def test_handle_many_passes_encoder(self, temp_dir: Path) -> None:
+        """Test that compressions use the caller's encoder."""
+        path = temp_dir / "a.mp4"
+
+        with patch.object(Splitter, "handle_size_exceed", return_value=[path]) as mock_handle:
+            Splitter.handle_many(
+                [(path, OnSizeExceed.COMPRESS)], max_size_gb=2.0, encoder=EncoderType.NVENC_H264
+            )
+
+        mock_handle.assert_called_once_with(
+            path, 2.0, OnSizeExceed.COMPRESS, None, EncoderType.NVENC_H264
+        )
+
+    def test_handle_many_retries_failed_batch_per_file(self, temp_dir: Path) -> None:
+        """Test that files from a failed batch are handled one by one."""
+        paths = [temp_dir / "a.mp4", temp_dir / "b.mp4"]
+
+        with patch.object(Splitter, "split_many", side_effect=ConversionError("boom")), \
+             patch.object(Splitter, "handle_size_exceed", side_effect=lambda p, *a: [p]) as mock_handle:
+            results = Splitter.handle_many([(p, OnSizeExceed.SPLIT) for p in paths], max_size_gb=2.0)
+
+        assert mock_handle.call_count == 2
+        assert results == {paths[0]: [paths[0]], paths[1]: [paths[1]]}
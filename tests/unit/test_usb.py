@@ -1,12 +1,14 @@
 """Unit tests for the USBManager class."""
 
+import errno
+import io
 import os
 import shutil
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-from yt2audi.transfer.usb import USBManager, USBTransferError
+from yt2audi.transfer.usb import USBManager, USBTransferError, _copyfileobj_readinto, _fastcopy
 
 class TestUSBManager:
     """Test suite for USBManager class."""
@@ -21,10 +23,29 @@ class TestUSBManager:
         # A: (index 0) is DRIVE_REMOVABLE (2), D: (index 3) is DRIVE_FIXED (3)
         mock_drive_type.side_effect = lambda path: 2 if "A:" in path else 3
         
-        drives = USBManager.get_removable_drives()
+        drives = USBManager.get_removable_drives(max_age=0)
         assert len(drives) == 1
         assert drives[0] == Path("A:\\")
 
+    @patch("os.name", "nt")
+    def test_get_removable_drives_cached(self):
+        """Test that repeated scans within the TTL reuse the last result."""
+        mock_windll = MagicMock()
+        mock_windll.kernel32.GetLogicalDrives.return_value = 1
+        mock_windll.kernel32.GetDriveTypeW.return_value = 2
+
+        with patch("ctypes.windll", mock_windll, create=True), \
+                patch("yt2audi.transfer.usb.Path", str), \
+                patch("yt2audi.transfer.usb.time.monotonic", side_effect=[100.0, 101.0, 103.0]):
+            first = USBManager.get_removable_drives(max_age=0)
+            cached = USBManager.get_removable_drives()
+            first.clear()
+            expired = USBManager.get_removable_drives()
+
+        assert cached == ["A:\\"]
+        assert expired == ["A:\\"]
+        assert mock_windll.kernel32.GetLogicalDrives.call_count == 2
+
     @patch("os.name", "posix")
     def test_get_removable_drives_non_windows(self):
         """Test removable drive detection on non-Windows."""
@@ -114,6 +135,140 @@ class TestUSBManager:
         
         with patch("shutil.disk_usage") as mock_usage:
             mock_usage.return_value = MagicMock(free=1000000)
-            with patch("shutil.copy2", side_effect=OSError("I/O Error")):
+            with patch("os.sendfile", side_effect=OSError("I/O Error")), \
+                    patch("yt2audi.transfer.usb._copyfileobj_readinto",
+                          side_effect=OSError("I/O Error")):
                 with pytest.raises(USBTransferError, match="Failed to copy"):
                     USBManager.copy_to_usb([src], usb_root)
+
+    def test_copy_to_usb_samples_free_space_once(self, tmp_path):
+        """Test that free space is queried once and checked for the batch."""
+        usb_root = tmp_path / "usb"
+        usb_root.mkdir()
+        sources = []
+        for i in range(3):
+            src = tmp_path / f"part{i}.mp4"
+            src.write_bytes(b"x" * 100)
+            sources.append(src)
+
+        with patch("shutil.disk_usage") as mock_usage:
+            mock_usage.return_value = MagicMock(free=250)
+            with pytest.raises(USBTransferError, match="Not enough space"):
+                USBManager.copy_to_usb(sources, usb_root)
+
+            mock_usage.return_value = MagicMock(free=300)
+            results = USBManager.copy_to_usb(sources, usb_root)
+
+        assert mock_usage.call_count == 2
+        assert results == [usb_root / "Videos" / src.name for src in sources]
+
+    def test_copy_to_usb_parallel_keeps_order(self, tmp_path):
+        """Test that a multi-worker copy returns paths in input order."""
+        usb_root = tmp_path / "usb"
+        usb_root.mkdir()
+        sources = []
+        for i in range(5):
+            src = tmp_path / f"part{i}.mp4"
+            src.write_bytes(b"x" * (i + 1))
+            sources.append(src)
+
+        results = USBManager.copy_to_usb(sources, usb_root, concurrency=3, delete_original=True)
+
+        assert results == [usb_root / "Videos" / src.name for src in sources]
+        assert [p.stat().st_size for p in results] == [1, 2, 3, 4, 5]
+        assert not any(src.exists() for src in sources)
+
+    def test_copy_workers_same_device_is_sequential(self, tmp_path):
+        """Test that copies on one device are not parallelised."""
+        sources = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+        for src in sources:
+            src.touch()
+
+        assert USBManager._copy_workers(sources, tmp_path) == 1
+        assert USBManager._copy_workers(sources[:1], tmp_path) == 1
+
+    def test_copy_workers_other_device(self, tmp_path):
+        """Test that copies across devices use up to four workers."""
+        sources = [tmp_path / f"{i}.mp4" for i in range(6)]
+        target = MagicMock()
+        target.stat.return_value = MagicMock(st_dev=-1)
+        for src in sources:
+            src.touch()
+
+        assert USBManager._copy_workers(sources, target) == 4
+        assert USBManager._copy_workers(sources[:2], target) == 2
+
+    def test_copy_to_usb_enospc_during_copy(self, tmp_path):
+        """Test that ENOSPC from the copy is reported as a space error."""
+        usb_root = tmp_path / "usb"
+        usb_root.mkdir()
+        src = tmp_path / "a.mp4"
+        src.write_bytes(b"data")
+
+        with patch("shutil.disk_usage") as mock_usage, \
+                patch("yt2audi.transfer.usb._fastcopy",
+                      side_effect=OSError(errno.ENOSPC, "No space left on device")):
+            mock_usage.return_value = MagicMock(free=1024)
+            with pytest.raises(USBTransferError, match="Not enough space"):
+                USBManager.copy_to_usb([src], usb_root)
+
+        assert mock_usage.call_count == 2
+
+    def test_fastcopy_sendfile(self, tmp_path):
+        """Test that the POSIX fast path copies data and metadata."""
+        src = tmp_path / "big.mp4"
+        src.write_bytes(b"x" * (3 * 1024 * 1024 + 17))
+        os.utime(src, (1_000_000, 1_000_000))
+        dst = tmp_path / "copy.mp4"
+
+        with patch("os.name", "posix"), \
+                patch("yt2audi.transfer.usb._copyfileobj_readinto") as mock_fallback:
+            _fastcopy(src, dst)
+
+        mock_fallback.assert_not_called()
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime == 1_000_000
+
+    def test_fastcopy_falls_back_to_buffered_copy(self, tmp_path):
+        """Test the userspace fallback when the fast path fails."""
+        src = tmp_path / "a.mp4"
+        src.write_bytes(os.urandom(2 * 1024 * 1024 + 5))
+        os.utime(src, (1_000_000, 1_000_000))
+        dst = tmp_path / "b.mp4"
+
+        with patch("os.name", "posix"), \
+                patch("os.sendfile", side_effect=OSError("not supported")):
+            _fastcopy(src, dst)
+
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime == 1_000_000
+
+    def test_copyfileobj_readinto_short_writes(self):
+        """Test that short raw writes are resumed until the chunk is out."""
+        fsrc = io.BytesIO(b"abcdefghij")
+        out = bytearray()
+
+        class ShortWriter:
+            def write(self, data):
+                out.extend(bytes(data[:3]))
+                return min(3, len(data))
+
+        _copyfileobj_readinto(fsrc, ShortWriter(), length=4)
+
+        assert bytes(out) == b"abcdefghij"
+
+    def test_fastcopy_windows_copyfile(self, tmp_path):
+        """Test that Windows uses CopyFileW and checks its result."""
+        src = tmp_path / "a.mp4"
+        src.write_bytes(b"data")
+        dst = tmp_path / "b.mp4"
+        mock_windll = MagicMock()
+        mock_windll.kernel32.CopyFileW.return_value = 0
+
+        with patch("os.name", "nt"), \
+                patch("ctypes.windll", mock_windll, create=True), \
+                patch("ctypes.WinError", return_value=OSError("denied"), create=True):
+            _fastcopy(src, dst)
+
+        mock_windll.kernel32.CopyFileW.assert_called_once_with(str(src), str(dst), False)
+        assert dst.read_bytes() == b"data"
@@ -1,12 +1,17 @@
 """Unit tests for validation utilities."""
 
+import os
+from unittest.mock import patch
+
 import pytest
 from yt2audi.utils.validation import (
+    extract_video_id,
     is_valid_url,
     is_youtube_url,
     is_playlist_url,
     validate_file_path,
-    sanitize_path
+    resolve_safe,
+    sanitize_path,
 )
 
 class TestValidation:
@@ -18,13 +23,40 @@ class TestValidation:
         assert is_valid_url("http://localhost:8080") is True
         assert is_valid_url("not a url") is False
         assert is_valid_url("") is False
+        assert is_valid_url("https://m.youtube.com/watch?v=dQw4w9WgXcQ") is True
+        assert is_valid_url("youtube.com/watch?v=dQw4w9WgXcQ") is False
+        # Uncommon schemes and malformed hosts still go through urlparse
+        assert is_valid_url("rtmp://host/live") is True
+        assert is_valid_url("http:///path") is False
+        assert is_valid_url("http://[::1") is False
+        assert is_valid_url("http://a[") is False
+        assert is_valid_url("http://a[b/c") is False
+        assert is_valid_url("http://a]?q") is False
+        assert is_valid_url("http://a/b[c]") is True
+        # Non-strings are rejected, not raised on
+        assert is_valid_url(None) is False
+        assert is_valid_url(123) is False
+        assert is_valid_url(["https://google.com"]) is False
 
     def test_is_youtube_url(self):
         """Test YouTube URL detection."""
         assert is_youtube_url("https://www.youtube.com/watch?v=dQw4w9WgXcQ") is True
         assert is_youtube_url("https://youtu.be/dQw4w9WgXcQ") is True
         assert is_youtube_url("https://www.youtube.com/playlist?list=PL123") is True
+        assert is_youtube_url("youtube.com/channel/UC123") is True
+        assert is_youtube_url("www.youtube.com/@creator") is True
         assert is_youtube_url("https://google.com") is False
+        assert is_youtube_url("https://youtube.com/watch?v=") is False
+
+    def test_extract_video_id(self):
+        """Test offline video ID extraction."""
+        assert extract_video_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+        assert extract_video_id("https://youtube.com/watch?feature=share&v=dQw4w9WgXcQ&t=5") == "dQw4w9WgXcQ"
+        assert extract_video_id("https://youtu.be/dQw4w9WgXcQ?si=abc") == "dQw4w9WgXcQ"
+        assert extract_video_id("https://m.youtube.com/shorts/dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+        assert extract_video_id("https://www.youtube.com/playlist?list=PL123") is None
+        assert extract_video_id("https://www.youtube.com/watch?v=short") is None
+        assert extract_video_id("https://example.com/watch?v=dQw4w9WgXcQ") is None
 
     def test_is_playlist_url(self):
         """Test playlist URL detection."""
@@ -39,13 +71,27 @@ class TestValidation:
 
     def test_sanitize_path_success(self):
         """Test path sanitization with valid paths."""
-        # Note: sanitize_path calls resolve(), so we should use relative paths
-        # that actually exist or just check if it returns a string.
         path = "src/yt2audi"
         sanitized = sanitize_path(path)
         assert isinstance(sanitized, str)
         assert "yt2audi" in sanitized
 
+    def test_sanitize_path_is_lexical(self):
+        """Test that sanitize_path normalizes without touching the filesystem."""
+        with patch("pathlib.Path.resolve") as mock_resolve:
+            assert sanitize_path("out/./a/../b") == os.path.join("out", "b")
+        mock_resolve.assert_not_called()
+
+        with pytest.raises(ValueError, match="Path traversal"):
+            sanitize_path("../outside")
+
+    def test_resolve_safe(self, tmp_path):
+        """Test that resolve_safe returns an absolute path after sanitizing."""
+        assert resolve_safe(str(tmp_path / "a" / ".." / "b")) == str((tmp_path / "b").resolve())
+
+        with pytest.raises(ValueError, match="dangerous shell metacharacter"):
+            resolve_safe("out; rm -rf /")
+
     def test_sanitize_path_failures(self):
         """Test path sanitization with dangerous inputs."""
         with pytest.raises(ValueError, match="null bytes"):
@@ -56,3 +102,6 @@ class TestValidation:
             
         with pytest.raises(ValueError, match="reserved filename"):
             sanitize_path("C:/NUL")
+
+        with pytest.raises(ValueError, match="reserved filename: com1.tar.gz"):
+            sanitize_path("backup/com1.tar.gz")